@@ -0,0 +1,816 @@
+#!/usr/bin/env python3
+"""Performance benchmarks for the game engine and training loop.
+
+Runs seeded workloads and reports wall-clock throughput, so engine changes
+can be measured against each other on the same machine.
+
+Usage:
+    # Benchmark full training episodes (both trainers)
+    python scripts/benchmark.py train --episodes 50
+
+    # Benchmark feature extraction and distance lookups
+    python scripts/benchmark.py features --boards 200
+
+    # Benchmark the vectorized multi-game simulator
+    python scripts/benchmark.py batch --games 4096
+
+    # Episodes/sec of the worker pool from 1 to all cores
+    python scripts/benchmark.py parallel --episodes 200
+
+    # Hogwild throughput and final-weight divergence against the serial trainer
+    python scripts/benchmark.py hogwild --episodes 200
+
+    # Transposition cache hit rates and speed in play and training
+    python scripts/benchmark.py cache --boards 200
+
+    # Board generation speed and layout rejection rate
+    python scripts/benchmark.py placement --boards 5000
+
+    # Neighbourhood rules: offset loops vs cell tables, moves, successors, legal actions
+    python scripts/benchmark.py rules --boards 200
+
+    # Per-step TD updates against mini-batches applied as one vectorized update
+    python scripts/benchmark.py update --episodes 50
+
+    # Replay buffer: appends, uniform and prioritized sampling, replayed updates
+    python scripts/benchmark.py replay --games 1000000
+
+    # Memory the trainer step loop allocates, measured with tracemalloc
+    python scripts/benchmark.py alloc --episodes 50
+
+    # Fresh Board() per episode against reset pooled boards, with GC pauses
+    python scripts/benchmark.py pool --episodes 2000
+
+    # Run every benchmark
+    python scripts/benchmark.py all
+"""
+
+import argparse
+import gc
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path for direct script execution
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from pacman_zombie.agents.features import V_hat, V_hat_batch, argmax_last
+from pacman_zombie.agents.pacman_agent import PacmanAgent
+from pacman_zombie.agents.transposition import TranspositionCache
+from pacman_zombie.agents.zombie_agent import ZombieAgent
+from pacman_zombie.core.batch_board import BatchBoard
+from pacman_zombie.core.board import Board, BoardPool
+from pacman_zombie.core.constants import (
+    ACTION_SHOOT,
+    CELL_EMPTY,
+    CELL_ZOMBIE,
+    MOVE_DOWN,
+    MOVE_LEFT,
+    MOVE_RIGHT,
+    MOVE_UP,
+)
+from pacman_zombie.core.distances import cell_distances, static_fields
+from pacman_zombie.core.placement import placement_stats, sample_placement
+from pacman_zombie.core.rng import episode_seeds, make_rng
+from pacman_zombie.core.rules import NEIGHBOUR_OFFSETS, SHOOT_OFFSETS, cell_tables, zombies_among
+from pacman_zombie.learning.hogwild import HogwildRunner
+from pacman_zombie.learning.parallel import ParallelEpisodeRunner
+from pacman_zombie.learning.replay import ReplayBuffer
+from pacman_zombie.learning.trainer import PacmanTrainer, ZombieTrainer
+from pacman_zombie.learning.weights import load_legacy_weights
+
+ROOT = Path(__file__).parent.parent
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Returns:
+        Parsed arguments namespace
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the Pac-Man vs Zombies engine",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+
+    parser.add_argument(
+        'benchmark',
+        choices=[
+            'train', 'features', 'batch', 'parallel', 'hogwild', 'cache', 'placement', 'pool', 'rules', 'update', 'replay',
+            'alloc', 'all'
+        ],
+        help='Which benchmark to run'
+    )
+
+    parser.add_argument(
+        '--episodes',
+        type=int,
+        default=50,
+        help='Episodes per trainer for the train benchmark (default: 50)'
+    )
+
+    parser.add_argument(
+        '--max-steps',
+        type=int,
+        default=300,
+        help='Maximum steps per episode (default: 300)'
+    )
+
+    parser.add_argument(
+        '--boards',
+        type=int,
+        default=200,
+        help='Seeded boards for the feature benchmarks (default: 200)'
+    )
+
+    parser.add_argument(
+        '--games',
+        type=int,
+        default=4096,
+        help='Games stepped together by the batch benchmark (default: 4096)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=os.cpu_count(),
+        help='Largest worker count for the parallel benchmarks (default: all cores)'
+    )
+
+    parser.add_argument(
+        '--learning-rate',
+        type=float,
+        default=0.0001,
+        help='Learning rate for the hogwild benchmark (default: 0.0001)'
+    )
+
+    parser.add_argument(
+        '--repeats',
+        type=int,
+        default=20,
+        help='Repetitions per board for micro-benchmarks (default: 20)'
+    )
+
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='Base random seed (default: 0)'
+    )
+
+    return parser.parse_args()
+
+
+def report(name: str, elapsed: float, count: int, unit: str) -> None:
+    """Print one benchmark result line.
+
+    Args:
+        name: Benchmark name
+        elapsed: Wall-clock seconds
+        count: Number of units processed
+        unit: Unit name (e.g. 'step')
+    """
+    per_unit = elapsed / max(count, 1) * 1e6
+    print(f"{name:32s} {count:8d} {unit}s  {elapsed:8.3f}s  {per_unit:10.2f} us/{unit}")
+
+
+def bench_train(args: argparse.Namespace) -> None:
+    """Benchmark seeded training episodes for both trainers.
+
+    Args:
+        args: Command-line arguments
+    """
+    player_weights, zombie_weights = load_legacy_weights(
+        str(ROOT / 'w_hat_player.txt'), str(ROOT / 'w_hat_zombie.txt')
+    )
+
+    for name, make_trainer, opponent in (
+        ('train/pacman', lambda rng: PacmanTrainer(player_weights, rng=rng), zombie_weights),
+        ('train/zombie', lambda rng: ZombieTrainer(np.array([-1.0, 0.5, 0.2]), rng=rng), player_weights),
+    ):
+        boards = BoardPool()
+        total_steps = 0
+        start = time.perf_counter()
+        for episode in range(args.episodes):
+            board_seed, agent_seed = episode_seeds(args.seed, episode)
+            board = boards.board(episode, board_seed)
+            _, steps, _ = make_trainer(make_rng(agent_seed)).train_episode(board, opponent, max_steps=args.max_steps)
+            total_steps += steps
+        report(name, time.perf_counter() - start, total_steps, 'step')
+
+
+def seeded_boards(args: argparse.Namespace) -> list:
+    """Build the seeded boards used by the micro-benchmarks.
+
+    Args:
+        args: Command-line arguments
+
+    Returns:
+        List of freshly initialised boards
+    """
+    boards = []
+    for index in range(args.boards):
+        boards.append(Board(rng=make_rng(args.seed + index)))
+    return boards
+
+
+def bench_features(args: argparse.Namespace) -> None:
+    """Benchmark feature extraction and the distance kernel behind it.
+
+    Args:
+        args: Command-line arguments
+    """
+    boards = seeded_boards(args)
+
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        for board in boards:
+            board.extract_features()
+    report('features/pacman', time.perf_counter() - start, args.repeats * len(boards), 'call')
+
+    # Greedy Pac-Man choice: push/extract/pop loop vs one batched mat-vec
+    weights = np.ones(8)
+    candidates = [(board, board.get_possible_action()) for board in boards]
+    decisions = args.repeats * len(candidates)
+
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        for board, actions in candidates:
+            max_value = -np.inf
+            for action in actions:
+                board.push_player_action(action)
+                value = V_hat(board.extract_features(), weights)
+                board.pop_action()
+                if value >= max_value:
+                    max_value = value
+    loop_elapsed = time.perf_counter() - start
+    report('select/pacman-loop', loop_elapsed, decisions, 'call')
+
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        for board, actions in candidates:
+            argmax_last(V_hat_batch(board.extract_features_batch(actions), weights))
+    batch_elapsed = time.perf_counter() - start
+    report('select/pacman-batch', batch_elapsed, decisions, 'call')
+    print(f"{'select speedup':32s} {loop_elapsed / batch_elapsed:8.2f}x")
+
+    # All zombies' moves: per-successor push/extract/pop loop vs one value field
+    zombie_weights = np.ones(3)
+    zombie_moves = [
+        [(row, col, board.get_possible_action_zombie(row, col)) for row, col in sorted(board.zombies_positions)]
+        for board in boards
+    ]
+
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        for board, moves in zip(boards, zombie_moves):
+            for row, col, actions in moves:
+                for action in actions:
+                    d_row, d_col = board.move_deltas[action]
+                    board.push_zombie_action(action, row, col)
+                    V_hat(board.extract_features_zombie(None, row + d_row, col + d_col), zombie_weights)
+                    board.pop_action()
+    loop_elapsed = time.perf_counter() - start
+    report('select/zombies-loop', loop_elapsed, decisions, 'turn')
+
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        for board, moves in zip(boards, zombie_moves):
+            values = V_hat_batch(board.extract_features_zombie_field(), zombie_weights).tolist()
+            for row, col, actions in moves:
+                for action in actions:
+                    d_row, d_col = board.move_deltas[action]
+                    values[(row + d_row) * board.width + col + d_col]
+    field_elapsed = time.perf_counter() - start
+    report('select/zombies-field', field_elapsed, decisions, 'turn')
+    print(f"{'zombie select speedup':32s} {loop_elapsed / field_elapsed:8.2f}x")
+
+    zombie_calls = 0
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        for board in boards:
+            for row, col in board.zombies_positions:
+                board.extract_features_zombie(None, row, col)
+                zombie_calls += 1
+    report('features/zombie', time.perf_counter() - start, zombie_calls, 'call')
+
+    # Distances one Pac-Man feature vector needs, via math.dist vs the table
+    targets = []
+    for board in boards:
+        entities = list(board.zombies_positions) + board.obstacle_positions
+        entities += [board.vaccine_position, board.exit_position, board.pit_position]
+        targets.append((board.player_position, entities))
+    lookups = sum(len(entities) for _, entities in targets) * args.repeats
+
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        for player, entities in targets:
+            [math.dist(player, entity) for entity in entities]
+    math_elapsed = time.perf_counter() - start
+    report('distance/math.dist', math_elapsed, lookups, 'call')
+
+    table = cell_distances(boards[0].height, boards[0].width)
+    width = table.width
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        for player, entities in targets:
+            distance = table.from_cell(*player)
+            [distance[row * width + col] for row, col in entities]
+    table_elapsed = time.perf_counter() - start
+    report('distance/table', table_elapsed, lookups, 'call')
+    print(f"{'distance speedup':32s} {math_elapsed / table_elapsed:8.2f}x")
+
+    # One static field build per episode layout (uncached)
+    start = time.perf_counter()
+    for board in boards:
+        static_fields.__wrapped__(
+            board.height, board.width, tuple(board.obstacle_positions),
+            board.exit_position, board.pit_position
+        )
+    report('fields/build', time.perf_counter() - start, len(boards), 'layout')
+
+
+def bench_batch(args: argparse.Namespace) -> None:
+    """Benchmark BatchBoard stepping many games with random legal actions.
+
+    Args:
+        args: Command-line arguments
+    """
+    batch = BatchBoard(args.games, seed=args.seed)
+    turns = args.max_steps
+
+    start = time.perf_counter()
+    for _ in range(turns):
+        batch.step(batch.random_player_actions())
+    elapsed = time.perf_counter() - start
+    game_steps = turns * args.games
+    report('batch/step', elapsed, game_steps, 'step')
+    print(f"{'batch game steps per ms':32s} {game_steps / elapsed / 1000:8.1f}")
+
+    boards = seeded_boards(args)
+    chooser = random.Random(args.seed)
+    start = time.perf_counter()
+    count = 0
+    for board in boards:
+        for _ in range(10):
+            actions = board.get_possible_action()
+            board.player_action(chooser.choice(actions))
+            moves = []
+            for row, col in board.get_zombies_position():
+                zombie_actions = board.get_possible_action_zombie(row, col)
+                if zombie_actions:
+                    moves.append((row, col, chooser.choice(zombie_actions)))
+            board.zombies_action(moves)
+            count += 1
+            if board.is_game_over() or not board.exit_exist():
+                break
+    report('board/step', time.perf_counter() - start, count, 'step')
+
+
+def bench_parallel(args: argparse.Namespace) -> None:
+    """Benchmark Pac-Man training episodes/sec on 1..N worker processes.
+
+    Learning is disabled (alpha=0) and every run uses the same episode
+    seeds, so the serial loop and all worker counts play identical games
+    and only the wall clock differs.
+
+    Args:
+        args: Command-line arguments
+    """
+    player_weights, zombie_weights = load_legacy_weights(
+        str(ROOT / 'w_hat_player.txt'), str(ROOT / 'w_hat_zombie.txt')
+    )
+
+    start = time.perf_counter()
+    for episode in range(args.episodes):
+        board_seed, agent_seed = episode_seeds(args.seed, episode)
+        PacmanTrainer(player_weights, rng=make_rng(agent_seed)).train_episode(
+            Board(rng=make_rng(board_seed)), zombie_weights, 0.0, args.max_steps
+        )
+    serial = args.episodes / (time.perf_counter() - start)
+    print(f"{'parallel/serial':32s} {serial:8.1f} episodes/s")
+
+    for workers in range(1, args.workers + 1):
+        trainer = PacmanTrainer(player_weights)
+        start = time.perf_counter()
+        with ParallelEpisodeRunner(
+            trainer, zombie_weights, workers=workers, alpha=0.0, max_steps=args.max_steps, seed=args.seed
+        ) as runner:
+            for _ in runner.run(args.episodes):
+                pass
+        rate = args.episodes / (time.perf_counter() - start)
+        print(f"{f'parallel/workers={workers}':32s} {rate:8.1f} episodes/s  {rate / serial:6.2f}x serial")
+
+
+def bench_hogwild(args: argparse.Namespace) -> None:
+    """Benchmark Hogwild zombie training against the serial trainer.
+
+    Both play the same seeded episodes, so with one worker the weights
+    match the serial run exactly; with more workers, interleaved updates
+    make them drift. Divergence is the relative L2 distance of the final
+    weights from the serial ones.
+
+    Args:
+        args: Command-line arguments
+    """
+    player_weights, zombie_weights = load_legacy_weights(
+        str(ROOT / 'w_hat_player.txt'), str(ROOT / 'w_hat_zombie.txt')
+    )
+
+    trainer = ZombieTrainer(zombie_weights)
+    start = time.perf_counter()
+    for episode in range(args.episodes):
+        board_seed, agent_seed = episode_seeds(args.seed, episode)
+        trainer.rng = make_rng(agent_seed)
+        trainer.train_episode(Board(rng=make_rng(board_seed)), player_weights, args.learning_rate, args.max_steps)
+    serial = args.episodes / (time.perf_counter() - start)
+    serial_weights = trainer.w_hat_zombie
+    print(f"{'hogwild/serial':32s} {serial:8.1f} episodes/s")
+
+    for workers in range(1, args.workers + 1):
+        trainer = ZombieTrainer(zombie_weights)
+        start = time.perf_counter()
+        with HogwildRunner(
+            trainer, player_weights, workers=workers, alpha=args.learning_rate,
+            max_steps=args.max_steps, seed=args.seed
+        ) as runner:
+            for _ in runner.run(args.episodes):
+                pass
+        rate = args.episodes / (time.perf_counter() - start)
+        if np.isfinite(serial_weights).all():
+            divergence = np.linalg.norm(trainer.w_hat_zombie - serial_weights) / np.linalg.norm(serial_weights)
+            drift = f"divergence {divergence:.2e}"
+        else:
+            # V_train is -inf on turns where no zombie can move
+            drift = "divergence n/a (serial weights not finite)"
+        print(f"{f'hogwild/workers={workers}':32s} {rate:8.1f} episodes/s  {rate / serial:6.2f}x serial  {drift}")
+
+
+def bench_cache(args: argparse.Namespace) -> None:
+    """Benchmark greedy decisions with and without a transposition cache.
+
+    Plays the seeded boards with PacmanAgent/ZombieAgent, then runs
+    ZombieTrainer episodes (which cache Pac-Man's decisions), and reports
+    time and hit rate for each. Cached runs consume less randomness, so
+    their games diverge from the uncached ones.
+
+    Args:
+        args: Command-line arguments
+    """
+    player_weights, zombie_weights = load_legacy_weights(
+        str(ROOT / 'w_hat_player.txt'), str(ROOT / 'w_hat_zombie.txt')
+    )
+
+    for cache in (None, TranspositionCache()):
+        pacman = PacmanAgent(player_weights, cache=cache)
+        zombies = ZombieAgent(zombie_weights, cache=cache)
+        boards = BoardPool()
+        turns = 0
+        start = time.perf_counter()
+        for index in range(args.boards):
+            board_seed, agent_seed = episode_seeds(args.seed, index)
+            board = boards.board(index, board_seed)
+            pacman.rng = zombies.rng = make_rng(agent_seed)
+            for _ in range(args.max_steps):
+                board.player_action(pacman.select_action(board))
+                board.zombies_action(zombies.select_actions_all_zombies(board))
+                turns += 1
+                if board.is_game_over() or not board.exit_exist():
+                    break
+        name = 'cache/play-uncached' if cache is None else 'cache/play-cached'
+        report(name, time.perf_counter() - start, turns, 'turn')
+        if cache is not None:
+            print(f"{'play hit rate':32s} {cache.hit_rate:8.1%}  ({cache.hits} hits, {len(cache)} entries)")
+
+    for cache in (None, TranspositionCache()):
+        total_steps = 0
+        start = time.perf_counter()
+        for episode in range(args.episodes):
+            board_seed, agent_seed = episode_seeds(args.seed, episode)
+            trainer = ZombieTrainer(zombie_weights, cache=cache, rng=make_rng(agent_seed))
+            _, steps, _ = trainer.train_episode(Board(rng=make_rng(board_seed)), player_weights, max_steps=args.max_steps)
+            total_steps += steps
+        name = 'cache/train-uncached' if cache is None else 'cache/train-cached'
+        report(name, time.perf_counter() - start, total_steps, 'step')
+        if cache is not None:
+            print(f"{'train hit rate':32s} {cache.hit_rate:8.1%}  ({cache.hits} hits, {len(cache)} entries)")
+
+
+def bench_placement(args: argparse.Namespace) -> None:
+    """Benchmark board construction and report how many layouts were redrawn.
+
+    Args:
+        args: Command-line arguments
+    """
+    placement_stats.reset()
+    start = time.perf_counter()
+    seeded_boards(args)
+    report('placement/board', time.perf_counter() - start, args.boards, 'board')
+    print(f"{'layout rejection rate':32s} {placement_stats.rejection_rate:8.2%}  "
+          f"({placement_stats.rejected} redrawn, {placement_stats.accepted} accepted)")
+
+
+def bench_pool(args: argparse.Namespace) -> None:
+    """Benchmark ZombieTrainer episodes on fresh boards against pooled boards.
+
+    Both runs are seeded identically and play the same games; the report
+    adds the garbage collections triggered and the time spent in them.
+
+    Args:
+        args: Command-line arguments
+    """
+    player_weights, zombie_weights = load_legacy_weights(
+        str(ROOT / 'w_hat_player.txt'), str(ROOT / 'w_hat_zombie.txt')
+    )
+
+    pauses = []
+    def on_gc(phase: str, info: dict) -> None:
+        if phase == 'start':
+            pauses.append(-time.perf_counter())
+        else:
+            pauses[-1] += time.perf_counter()
+
+    pool = BoardPool()
+    for name, make_board in (
+        ('pool/fresh-board', lambda episode, seed: Board(rng=make_rng(seed))),
+        ('pool/reset-board', pool.board),
+    ):
+        trainer = ZombieTrainer(zombie_weights)
+        gc.collect()
+        pauses.clear()
+        gc.callbacks.append(on_gc)
+        total_steps = 0
+        start = time.perf_counter()
+        try:
+            for episode in range(args.episodes):
+                board_seed, agent_seed = episode_seeds(args.seed, episode)
+                trainer.rng = make_rng(agent_seed)
+                _, steps, _ = trainer.train_episode(make_board(episode, board_seed), player_weights, 0.0, args.max_steps)
+                total_steps += steps
+        finally:
+            gc.callbacks.remove(on_gc)
+        report(name, time.perf_counter() - start, args.episodes, 'episode')
+        print(f"{'  gc collections / pause':32s} {len(pauses):8d}  {sum(pauses) * 1e3:8.2f} ms  ({total_steps} steps)")
+
+
+# Move that undoes each move, indexed by action code
+OPPOSITE_MOVES = (MOVE_DOWN, MOVE_UP, MOVE_RIGHT, MOVE_LEFT)
+
+
+def offset_zombies(board: Board, offsets: tuple) -> list:
+    """Zombies at offsets from Pac-Man, with a bounds check per offset.
+
+    The per-call form of the rules that core.rules tables replace; kept
+    here as the baseline for bench_rules.
+    """
+    row, col = board.player_position
+    found = []
+    for d_row, d_col in offsets:
+        target = (row + d_row, col + d_col)
+        if 0 <= target[0] < board.height and 0 <= target[1] < board.width and board.cells.item(target) == CELL_ZOMBIE:
+            found.append(target)
+    return found
+
+
+def bench_rules(args: argparse.Namespace) -> None:
+    """Benchmark the neighbourhood rules and the board operations built on them.
+
+    Compares per-call offset loops with the precomputed cell tables for
+    the shooting and cure/capture checks, then times the live move, the
+    successor simulation and the legal-action generator.
+
+    Args:
+        args: Command-line arguments
+    """
+    boards = seeded_boards(args)
+    tables = cell_tables(boards[0].height, boards[0].width)
+    checks = args.repeats * len(boards)
+
+    for rule, offsets, entries in (
+        ('shoot', SHOOT_OFFSETS, tables.shots),
+        ('neighbours', NEIGHBOUR_OFFSETS, tables.neighbours),
+    ):
+        start = time.perf_counter()
+        for _ in range(args.repeats):
+            for board in boards:
+                offset_zombies(board, offsets)
+        offset_elapsed = time.perf_counter() - start
+        report(f'rules/{rule}-offsets', offset_elapsed, checks, 'call')
+
+        start = time.perf_counter()
+        for _ in range(args.repeats):
+            for board in boards:
+                row, col = board.player_position
+                zombies_among(board.cells, entries[row * board.width + col])
+        table_elapsed = time.perf_counter() - start
+        report(f'rules/{rule}-table', table_elapsed, checks, 'call')
+        print(f"{rule + ' speedup':32s} {offset_elapsed / table_elapsed:8.2f}x")
+
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        for board in boards:
+            board.get_possible_action()
+    report('rules/legal-actions', time.perf_counter() - start, checks, 'call')
+
+    candidates = [(board, board.get_possible_action()) for board in boards]
+    successors = args.repeats * sum(len(actions) for _, actions in candidates)
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        for board, actions in candidates:
+            for action in actions:
+                board.push_player_action(action)
+                board.pop_action()
+    report('rules/successor', time.perf_counter() - start, successors, 'call')
+
+    # Step onto an empty cell and back, so the boards end where they started
+    moves = []
+    for board, actions in candidates:
+        row, col = board.player_position
+        for action in actions:
+            target = tables.moves[row * board.width + col][action]
+            if action != ACTION_SHOOT and board.cells.item(target) == CELL_EMPTY:
+                moves.append((board, action, OPPOSITE_MOVES[action]))
+                break
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        for board, action, back in moves:
+            board.player_action(action)
+            board.player_action(back)
+    report('rules/live-move', time.perf_counter() - start, 2 * args.repeats * len(moves), 'call')
+
+
+def bench_update(args: argparse.Namespace) -> None:
+    """Benchmark applying recorded TD updates per step and in mini-batches.
+
+    Records the (features, V_train) rows of seeded episodes for both
+    trainers, then applies them with apply_updates() per step (the default)
+    and with several update_batch sizes.
+
+    Args:
+        args: Command-line arguments
+    """
+    player_weights, zombie_weights = load_legacy_weights(
+        str(ROOT / 'w_hat_player.txt'), str(ROOT / 'w_hat_zombie.txt')
+    )
+
+    for name, make_trainer, opponent in (
+        ('update/pacman', lambda batch: PacmanTrainer(player_weights, update_batch=batch), zombie_weights),
+        ('update/zombie', lambda batch: ZombieTrainer(np.array([-1.0, 0.5, 0.2]), update_batch=batch), player_weights),
+    ):
+        records = []
+        boards = BoardPool()
+        for episode in range(args.episodes):
+            board_seed, agent_seed = episode_seeds(args.seed, episode)
+            trainer = make_trainer(None)
+            trainer.rng = make_rng(agent_seed)
+            trainer.train_episode(boards.board(episode, board_seed), opponent, max_steps=args.max_steps, records=records)
+        features = np.array([row for row, _ in records])
+        V_trains = np.array([V_train for _, V_train in records], dtype=float)
+
+        for batch in (None, 32, 256, 4096):
+            trainer = make_trainer(batch)
+            start = time.perf_counter()
+            with np.errstate(invalid='ignore', over='ignore'):
+                trainer.apply_updates(features, V_trains, args.learning_rate)
+                trainer.flush()
+            label = 'per-step' if batch is None else f'batch {batch}'
+            report(f'{name} ({label})', time.perf_counter() - start, len(V_trains), 'row')
+
+
+def bench_replay(args: argparse.Namespace) -> None:
+    """Benchmark the replay buffer with --games transitions of capacity.
+
+    Fills zombie buffers from seeded training episodes, then pads them to
+    capacity with random rows and times batch sampling and replay_update()
+    for uniform and prioritized buffers.
+
+    Args:
+        args: Command-line arguments
+    """
+    player_weights, _ = load_legacy_weights(str(ROOT / 'w_hat_player.txt'), str(ROOT / 'w_hat_zombie.txt'))
+    batch_size = 256
+    rounds = 200
+    rng = np.random.default_rng(args.seed)
+
+    for name, prioritized in (('replay/uniform', False), ('replay/prioritized', True)):
+        replay = ReplayBuffer(args.games, 3, prioritized=prioritized, rng=np.random.default_rng(args.seed))
+        trainer = ZombieTrainer(np.array([-1.0, 0.5, 0.2]), update_batch=batch_size)
+        boards = BoardPool()
+        start = time.perf_counter()
+        for episode in range(args.episodes):
+            board_seed, agent_seed = episode_seeds(args.seed, episode)
+            trainer.rng = make_rng(agent_seed)
+            trainer.train_episode(
+                boards.board(episode, board_seed), player_weights, max_steps=args.max_steps,
+                records=[], transitions=replay
+            )
+        report(f'{name} (episodes)', time.perf_counter() - start, len(replay), 'step')
+
+        rows = rng.random((args.games - len(replay), 7))
+        start = time.perf_counter()
+        replay.extend(rows)
+        report(f'{name} (extend)', time.perf_counter() - start, len(rows), 'row')
+
+        replay.sample(1)  # sums the padded tree once
+        start = time.perf_counter()
+        for _ in range(rounds):
+            replay.sample(batch_size)
+        report(f'{name} (sample {batch_size})', time.perf_counter() - start, rounds * batch_size, 'row')
+
+        start = time.perf_counter()
+        with np.errstate(over='ignore', invalid='ignore'):
+            for _ in range(rounds):
+                trainer.replay_update(replay, batch_size, args.learning_rate)
+        report(f'{name} (update {batch_size})', time.perf_counter() - start, rounds * batch_size, 'row')
+
+
+def bench_alloc(args: argparse.Namespace) -> None:
+    """Measure the memory both trainers' step loops allocate, with tracemalloc.
+
+    Every episode replays one layout, so the per-layout and per-cell caches
+    are warm after the first. Reports the memory still held after all
+    episodes (per step; the step loop should keep nothing) and the largest
+    transient peak within one episode.
+
+    Args:
+        args: Command-line arguments
+    """
+    player_weights, zombie_weights = load_legacy_weights(
+        str(ROOT / 'w_hat_player.txt'), str(ROOT / 'w_hat_zombie.txt')
+    )
+    # A layout whose game does not end before the first move
+    board = Board(rng=make_rng(args.seed))
+    rng = make_rng(args.seed)
+    while True:
+        layout = sample_placement(board.height, board.width, board.num_zombies, board.num_obstacles, rng=rng)
+        board.reset(layout=layout)
+        if not board.is_game_over():
+            break
+    distances = cell_distances(board.height, board.width)
+    for row in range(board.height):
+        for col in range(board.width):
+            distances.from_cell(row, col)
+
+    for name, trainer, opponent in (
+        ('alloc/pacman', PacmanTrainer(player_weights), zombie_weights),
+        ('alloc/zombie', ZombieTrainer(np.array([-1.0, 0.5, 0.2])), player_weights),
+    ):
+        def play(episode: int) -> int:
+            board_seed, agent_seed = episode_seeds(args.seed, episode)
+            board.reset(seed=board_seed, layout=layout)
+            trainer.rng = make_rng(agent_seed)
+            return trainer.train_episode(board, opponent, max_steps=args.max_steps)[1]
+
+        play(args.episodes)  # warm-up
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        total_steps = 0
+        peak = 0
+        # A trapped Pac-Man's -inf target turns weights to NaN; the warning
+        # would load source lines into linecache and count as held memory
+        with np.errstate(invalid='ignore'):
+            for episode in range(args.episodes):
+                tracemalloc.reset_peak()
+                start = tracemalloc.get_traced_memory()[0]
+                total_steps += play(episode)
+                peak = max(peak, tracemalloc.get_traced_memory()[1] - start)
+        held = tracemalloc.get_traced_memory()[0] - base
+        tracemalloc.stop()
+        print(f"{name:32s} {total_steps:8d} steps  {held / max(total_steps, 1):8.1f} B/step held  "
+              f"{peak:8d} B peak")
+
+
+BENCHMARKS = {
+    'train': bench_train,
+    'features': bench_features,
+    'batch': bench_batch,
+    'parallel': bench_parallel,
+    'hogwild': bench_hogwild,
+    'cache': bench_cache,
+    'placement': bench_placement,
+    'pool': bench_pool,
+    'rules': bench_rules,
+    'update': bench_update,
+    'replay': bench_replay,
+    'alloc': bench_alloc,
+}
+
+
+def main() -> None:
+    """Run the selected benchmarks."""
+    args = parse_args()
+
+    names = list(BENCHMARKS) if args.benchmark == 'all' else [args.benchmark]
+    for name in names:
+        BENCHMARKS[name](args)
+
+
+if __name__ == '__main__':
+    main()
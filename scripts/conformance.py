@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""Conformance checks for alternative game engines against Board.
+
+Plays seeded games with random legal actions on reference Board instances
+and on the engine under test, and fails on the first state that differs.
+
+Usage:
+    # Check BatchBoard against Board on 200 seeded games
+    python scripts/conformance.py batch --games 200
+"""
+
+import argparse
+import random
+import sys
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path for direct script execution
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from pacman_zombie.core.batch_board import NO_ACTION, BatchBoard
+from pacman_zombie.core.board import Board
+from pacman_zombie.core.constants import CELL_ZOMBIE
+from pacman_zombie.core.rules import MASK_TABLE
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Returns:
+        Parsed arguments namespace
+    """
+    parser = argparse.ArgumentParser(
+        description="Check game engines against the reference Board",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+
+    parser.add_argument(
+        'check',
+        choices=['batch', 'all'],
+        help='Which engine to check'
+    )
+
+    parser.add_argument(
+        '--games',
+        type=int,
+        default=200,
+        help='Seeded games to play (default: 200)'
+    )
+
+    parser.add_argument(
+        '--max-steps',
+        type=int,
+        default=200,
+        help='Maximum turns per game (default: 200)'
+    )
+
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='Base random seed (default: 0)'
+    )
+
+    return parser.parse_args()
+
+
+class ReplayBatchBoard(BatchBoard):
+    """BatchBoard that takes its random placements from the reference boards.
+
+    Board draws pit respawns and vaccine drops from its own random stream, so
+    the check records where each reference board placed them and replays
+    those cells here, asserting that BatchBoard would accept them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.placements = None
+        self.replayed = 0
+        super().__init__(*args, **kwargs)
+
+    def _sample(self, games, allowed):
+        if self.placements is None:
+            return super()._sample(games, allowed)
+        cells = np.array([self.placements[game].popleft() for game in games], dtype=np.intp)
+        assert allowed[np.arange(len(games)), cells].all(), "reference placed an entity on a cell BatchBoard rejects"
+        self.replayed += len(cells)
+        return cells
+
+
+def flat(board: Board, position) -> int:
+    """Flat cell index of a (row, col) position."""
+    return position[0] * board.width + position[1]
+
+
+def check_batch(args: argparse.Namespace) -> None:
+    """Check BatchBoard rule by rule against Board.
+
+    Args:
+        args: Command-line arguments
+    """
+    boards = []
+    for game in range(args.games):
+        boards.append(Board(rng=random.Random(args.seed + game)))
+    batch = ReplayBatchBoard.from_boards(boards, seed=args.seed, auto_reset=False)
+    batch.placements = [deque() for _ in boards]
+
+    chooser = random.Random(args.seed)
+    # Games lost in their initial state end before the first move, as in the trainers
+    live = np.array([not board.is_game_over() for board in boards])
+    assert np.array_equal(live, ~batch.done), "initial outcomes differ"
+    compared = 0
+
+    for _ in range(args.max_steps):
+        if not live.any():
+            break
+
+        # Pac-Man moves first; legal actions must agree
+        legal_player = batch.legal_player_actions()
+        player_actions = np.full(len(boards), NO_ACTION, dtype=np.intp)
+        for game, board in enumerate(boards):
+            if not live[game]:
+                continue
+            assert np.array_equal(MASK_TABLE[board.legal_action_mask()], legal_player[game]), game
+            actions = board.get_possible_action()
+            if actions:
+                action = chooser.choice(actions)
+                player_actions[game] = action
+                board.player_action(action)
+        batch.player_action(player_actions)
+
+        # Zombies decide on the state after Pac-Man's move
+        legal_zombies = batch.legal_zombie_actions()
+        zombie_actions = np.full(batch.zombies.shape, NO_ACTION, dtype=np.intp)
+        for game, board in enumerate(boards):
+            if not live[game]:
+                continue
+            zombies = board.get_zombies_position()
+            assert [flat(board, zombie) for zombie in zombies] == [
+                cell for cell in batch.zombies[game].tolist() if cell < batch.size
+            ], game
+            zombie_moves = []
+            for rank, (row, col) in enumerate(zombies):
+                zombie_mask = board.legal_zombie_mask(row, col)
+                assert np.array_equal(MASK_TABLE[zombie_mask, :4], legal_zombies[game, rank]), (game, row, col)
+                zombie_legal = board.get_possible_action_zombie(row, col)
+                if zombie_legal:
+                    action = chooser.choice(zombie_legal)
+                    zombie_moves.append((row, col, action))
+                    zombie_actions[game, rank] = action
+            board.zombies_action(zombie_moves)
+
+            # Record Board's random placements for the replaying batch
+            pit_zombie = board.cells.item(board.pit_position) == CELL_ZOMBIE
+            zombies_before = set(board.zombies_positions)
+            vaccine_before = board.vaccine_position
+            board.is_game_over()
+            if pit_zombie:
+                respawned = set(board.zombies_positions) - (zombies_before - {board.pit_position})
+                batch.placements[game].extend(flat(board, cell) for cell in respawned)
+            if board.vaccine_position is not None and board.vaccine_position != vaccine_before:
+                batch.placements[game].append(flat(board, board.vaccine_position))
+
+        batch.zombies_action(zombie_actions)
+        batch.resolve()
+
+        for game, board in enumerate(boards):
+            if not live[game]:
+                continue
+            status = board.status()
+            assert np.array_equal(batch.cells[game, :batch.size], board.cells.ravel()), game
+            assert batch.player[game] == flat(board, board.player_position), game
+            assert batch.shoot[game] == board.shoot, game
+            assert batch.has_vaccine[game] == board.has_vaccine, game
+            assert batch.num_zombie_cure[game] == board.num_zombie_cure, game
+            assert batch.score[game] == board.score, game
+            assert batch.captured[game] == status.captured, game
+            assert batch.fell_into_pit[game] == status.fell_into_pit, game
+            assert batch.exit_exists[game] == status.exit_exists, game
+            assert batch.num_zombies[game] == status.num_zombies, game
+            assert not batch.placements[game], game
+            compared += 1
+
+            won = not status.exit_exists and status.num_zombies == 0
+            if status.game_over or won:
+                live[game] = False
+
+    print(
+        f"batch: {compared} game steps identical across {len(boards)} games "
+        f"({batch.replayed} respawns/vaccine drops, {int(batch.num_zombie_cure.sum())} cures)"
+    )
+
+
+CHECKS = {
+    'batch': check_batch,
+}
+
+
+def main() -> None:
+    """Run the selected checks."""
+    args = parse_args()
+
+    names = list(CHECKS) if args.check == 'all' else [args.check]
+    for name in names:
+        CHECKS[name](args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Fit agent weights in closed form with least-squares TD (LSTD).
+
+`collect` plays seeded episodes with fixed weights and logs every step as a
+(features, next_features, reward) transition. `fit` streams one or more
+logs into LSTD's A and b statistics, solves for the weights and saves them
+with the same metadata as train.py (see learning.lstd).
+
+Usage:
+    # Log 10000 Pac-Man episodes played with trained weights
+    python scripts/fit_lstd.py collect pacman pacman.trans --episodes 10000 \\
+        --weights weights/pacman_weights.json --opponent-weights weights/zombie_weights.json
+
+    # Append more episodes from another seed
+    python scripts/fit_lstd.py collect pacman pacman.trans --episodes 10000 --seed 1 --append \\
+        --weights weights/pacman_weights.json --opponent-weights weights/zombie_weights.json
+
+    # Solve for Pac-Man weights from the logs
+    python scripts/fit_lstd.py fit pacman pacman.trans --output weights/pacman_lstd.json
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path for direct script execution
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from pacman_zombie.core.board import BoardPool
+from pacman_zombie.core.rng import episode_seeds, fresh_seed, init_generator, make_rng
+from pacman_zombie.learning.lstd import LSTDSolver, TransitionLog, read_log_info
+from pacman_zombie.learning.param_server import AGENTS
+from pacman_zombie.learning.trainer import PacmanTrainer, ZombieTrainer
+from pacman_zombie.learning.weights import WeightManager, WeightMetadata
+
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
+
+FEATURE_COUNTS = {'pacman': 8, 'zombie': 3}
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Returns:
+        Parsed arguments namespace
+    """
+    parser = argparse.ArgumentParser(
+        description="Fit agent weights with least-squares TD from logged transitions",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    collect = commands.add_parser('collect', help='Play episodes and log their transitions')
+    collect.add_argument('agent', choices=AGENTS, help='Agent whose transitions are logged')
+    collect.add_argument('log', type=Path, help='Transition log to write')
+    collect.add_argument('--episodes', type=int, default=1000, help='Episodes to play (default: 1000)')
+    collect.add_argument('--max-steps', type=int, default=1000, help='Maximum steps per episode (default: 1000)')
+    collect.add_argument('--weights', type=Path, help='Weights the agent plays with (default: random)')
+    collect.add_argument('--opponent-weights', type=Path, help='Opponent weights (default: random)')
+    collect.add_argument('--layouts', metavar='FILE', help='Start episode i from layout i of a layout bank')
+    collect.add_argument('--seed', type=int, help='Run seed (default: drawn and printed)')
+    collect.add_argument('--append', action='store_true', help='Append to an existing log')
+
+    fit = commands.add_parser('fit', help='Solve for weights from transition logs')
+    fit.add_argument('agent', choices=AGENTS, help='Agent to fit')
+    fit.add_argument('logs', type=Path, nargs='+', help='Transition logs to read')
+    fit.add_argument('--output', type=Path, required=True, help='Weight file to write (.json)')
+    fit.add_argument('--gamma', type=float, default=1.0,
+                     help='Discount of the bootstrapped value (default: 1.0, as in train.py)')
+    fit.add_argument('--ridge', type=float, default=0.0,
+                     help='L2 regularization added to A\'s diagonal (default: 0)')
+
+    return parser.parse_args()
+
+
+def load_or_random(path: Path, agent: str, seed: int) -> np.ndarray:
+    """Load an agent's weights, or draw random ones like train.py does.
+
+    Args:
+        path: Weight file, or None
+        agent: 'pacman' or 'zombie'
+        seed: Run seed
+
+    Returns:
+        8 or 3 weights
+    """
+    if path:
+        weights, _ = WeightManager.load(path)
+        return weights
+    return init_generator(seed, AGENTS.index(agent)).random(FEATURE_COUNTS[agent]) - 0.5
+
+
+def collect(args: argparse.Namespace) -> None:
+    """Play episodes with fixed weights and log their transitions."""
+    seed = fresh_seed() if args.seed is None else args.seed
+    print(f"Seed: {seed}")
+    opponent = 'zombie' if args.agent == 'pacman' else 'pacman'
+    weights = load_or_random(args.weights, args.agent, seed)
+    opponent_weights = load_or_random(args.opponent_weights, opponent, seed)
+    trainer = PacmanTrainer(weights) if args.agent == 'pacman' else ZombieTrainer(weights)
+
+    boards = BoardPool(layouts=args.layouts)
+    episodes = range(args.episodes)
+    if TQDM_AVAILABLE:
+        episodes = tqdm(episodes, desc="Collecting", ncols=100)
+
+    start = time.perf_counter()
+    with TransitionLog(args.log, FEATURE_COUNTS[args.agent], append=args.append) as log:
+        logged, wins = log.count, log.wins
+        for episode in episodes:
+            board_seed, agent_seed = episode_seeds(seed, episode)
+            trainer.rng = make_rng(agent_seed)
+            # Recording (instead of updating) keeps the weights fixed
+            _, _, won = trainer.train_episode(
+                boards.board(episode, board_seed), opponent_weights,
+                max_steps=args.max_steps, records=[], transitions=log
+            )
+            log.end_episode(won)
+    elapsed = time.perf_counter() - start
+
+    print(f"Wrote {log}")
+    print(f"Win rate: {(log.wins - wins) / max(args.episodes, 1):.2%}")
+    print(f"Transitions/sec: {(log.count - logged) / max(elapsed, 1e-9):.0f}")
+
+
+def fit(args: argparse.Namespace) -> None:
+    """Solve for weights from transition logs and save them."""
+    num_features = FEATURE_COUNTS[args.agent]
+    solver = LSTDSolver(num_features, gamma=args.gamma, ridge=args.ridge)
+    episodes = wins = 0
+
+    start = time.perf_counter()
+    for path in args.logs:
+        info = read_log_info(path)
+        solver.add_log(path)
+        episodes += info.episodes
+        wins += info.wins
+    weights = solver.solve()
+    elapsed = time.perf_counter() - start
+
+    print(f"Transitions: {solver.count} from {episodes} episodes ({solver.skipped} non-finite skipped)")
+    print(f"Fit time: {elapsed:.3f}s")
+    print(f"Weights: {weights}")
+
+    metadata = WeightMetadata(
+        episodes_trained=episodes,
+        final_win_rate=wins / max(episodes, 1),
+        timestamp=datetime.now().isoformat(),
+        learning_rate=0.0,  # closed-form solve, no step size
+        feature_count=num_features,
+        agent_type=args.agent
+    )
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    WeightManager.save(weights, args.output, metadata)
+    print(f"Saved: {args.output}")
+
+
+def main() -> None:
+    """Run the selected command."""
+    args = parse_args()
+    if args.command == 'collect':
+        collect(args)
+    else:
+        fit(args)
+
+
+if __name__ == '__main__':
+    main()
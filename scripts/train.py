@@ -1,444 +1,822 @@
-#!/usr/bin/env python3
-"""Training script for Pac-Man and Zombie agents using temporal difference learning.
-
-This script trains agents using the exact algorithms from the original implementation,
-preserving the sacred weight update formulas:
-
-PAC-MAN:  w = w + α * (V_train - V_hat) * features  (COOPERATIVE)
-ZOMBIE:   w = w - α * (V_train - V_hat) * features  (ADVERSARIAL)
-
-Usage:
-    # Train Pac-Man agent
-    python scripts/train.py pacman --episodes 10000 --learning-rate 0.01
-
-    # Train Zombie agent
-    python scripts/train.py zombie --episodes 10000 --learning-rate 0.01
-
-    # Continue training from existing weights
-    python scripts/train.py pacman --continue-from weights/pacman_weights.json
-
-    # Train both agents (sequential)
-    python scripts/train.py both --episodes 5000
-"""
-
-import argparse
-import sys
-from datetime import datetime
-from pathlib import Path
-from typing import Optional
-
-import numpy as np
-
-# Add src to path for direct script execution
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
-
-from pacman_zombie.core.board import Board
-from pacman_zombie.learning.trainer import PacmanTrainer, ZombieTrainer
-from pacman_zombie.learning.weights import WeightManager, WeightMetadata
-
-try:
-    from tqdm import tqdm
-    TQDM_AVAILABLE = True
-except ImportError:
-    TQDM_AVAILABLE = False
-    print("Warning: tqdm not available. Install for progress bars: pip install tqdm")
-
-
-def parse_args() -> argparse.Namespace:
-    """Parse command-line arguments.
-
-    Returns:
-        Parsed arguments namespace
-    """
-    parser = argparse.ArgumentParser(
-        description="Train Pac-Man and Zombie agents using temporal difference learning",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=__doc__
-    )
-
-    parser.add_argument(
-        'agent',
-        choices=['pacman', 'zombie', 'both'],
-        help='Which agent to train'
-    )
-
-    parser.add_argument(
-        '--episodes',
-        type=int,
-        default=10000,
-        help='Number of training episodes (default: 10000)'
-    )
-
-    parser.add_argument(
-        '--learning-rate',
-        type=float,
-        default=0.01,
-        help='Learning rate alpha (default: 0.01)'
-    )
-
-    parser.add_argument(
-        '--max-steps',
-        type=int,
-        default=1000,
-        help='Maximum steps per episode (default: 1000)'
-    )
-
-    parser.add_argument(
-        '--continue-from',
-        type=Path,
-        metavar='WEIGHTS_FILE',
-        help='Continue training from existing weights file'
-    )
-
-    parser.add_argument(
-        '--opponent-weights',
-        type=Path,
-        metavar='WEIGHTS_FILE',
-        help='Use specific weights for opponent agent'
-    )
-
-    parser.add_argument(
-        '--save-interval',
-        type=int,
-        default=1000,
-        help='Save weights every N episodes (default: 1000)'
-    )
-
-    parser.add_argument(
-        '--output-dir',
-        type=Path,
-        default=Path('weights'),
-        help='Directory to save trained weights (default: ./weights)'
-    )
-
-    parser.add_argument(
-        '--stats-window',
-        type=int,
-        default=100,
-        help='Window size for computing win rate statistics (default: 100)'
-    )
-
-    parser.add_argument(
-        '--seed',
-        type=int,
-        help='Random seed for reproducibility'
-    )
-
-    return parser.parse_args()
-
-
-def train_pacman(
-    args: argparse.Namespace,
-    zombie_weights: np.ndarray
-) -> None:
-    """Train Pac-Man agent.
-
-    Args:
-        args: Command-line arguments
-        zombie_weights: Opponent zombie weights (3-dimensional)
-    """
-    print("\n" + "=" * 60)
-    print("TRAINING PAC-MAN AGENT")
-    print("=" * 60)
-
-    # Initialize or load trainer
-    if args.continue_from:
-        print(f"Loading initial weights from: {args.continue_from}")
-        initial_weights, metadata = WeightManager.load(args.continue_from)
-        if metadata:
-            print(f"  Previously trained for {metadata.episodes_trained} episodes")
-            print(f"  Final win rate: {metadata.final_win_rate:.2%}")
-        trainer = PacmanTrainer(initial_weights)
-    else:
-        print("Initializing with random weights...")
-        trainer = PacmanTrainer()
-
-    print(f"  Initial weights: {trainer.w_hat_player}")
-    print(f"\nTraining parameters:")
-    print(f"  Episodes: {args.episodes}")
-    print(f"  Learning rate: {args.learning_rate}")
-    print(f"  Max steps/episode: {args.max_steps}")
-    print(f"  Stats window: {args.stats_window}")
-    print()
-
-    # Training statistics
-    recent_wins = []
-    start_time = datetime.now()
-
-    # Progress bar
-    if TQDM_AVAILABLE:
-        pbar = tqdm(range(args.episodes), desc="Training", ncols=100)
-    else:
-        pbar = range(args.episodes)
-
-    for episode in pbar:
-        # Create fresh board for episode
-        board = Board()
-
-        # Train one episode
-        V_train, steps, won = trainer.train_episode(
-            board=board,
-            zombie_weights=zombie_weights,
-            alpha=args.learning_rate,
-            max_steps=args.max_steps
-        )
-
-        # Track statistics
-        recent_wins.append(1 if won else 0)
-        if len(recent_wins) > args.stats_window:
-            recent_wins.pop(0)
-
-        # Update progress bar or print status
-        if TQDM_AVAILABLE:
-            win_rate = np.mean(recent_wins) if recent_wins else 0
-            pbar.set_postfix({
-                'Win%': f'{win_rate:.1%}',
-                'Steps': steps,
-                'V': f'{V_train:.1f}'
-            })
-        else:
-            if (episode + 1) % args.save_interval == 0:
-                win_rate = np.mean(recent_wins) if recent_wins else 0
-                print(f"Episode {episode + 1}/{args.episodes} | "
-                      f"Win Rate: {win_rate:.2%} | "
-                      f"Steps: {steps} | "
-                      f"V_train: {V_train:.1f}")
-
-        # Save checkpoint
-        if (episode + 1) % args.save_interval == 0:
-            checkpoint_path = args.output_dir / f'pacman_weights_ep{episode + 1}.json'
-            win_rate = np.mean(recent_wins) if recent_wins else 0
-
-            metadata = WeightMetadata(
-                episodes_trained=episode + 1,
-                final_win_rate=win_rate,
-                timestamp=datetime.now().isoformat(),
-                learning_rate=args.learning_rate,
-                feature_count=8,
-                agent_type='pacman'
-            )
-
-            WeightManager.save(trainer.w_hat_player, checkpoint_path, metadata)
-
-            if not TQDM_AVAILABLE:
-                print(f"  Saved checkpoint: {checkpoint_path}")
-
-    if TQDM_AVAILABLE:
-        pbar.close()
-
-    # Save final weights
-    final_path = args.output_dir / 'pacman_weights.json'
-    final_win_rate = np.mean(recent_wins) if recent_wins else 0
-
-    final_metadata = WeightMetadata(
-        episodes_trained=args.episodes,
-        final_win_rate=final_win_rate,
-        timestamp=datetime.now().isoformat(),
-        learning_rate=args.learning_rate,
-        feature_count=8,
-        agent_type='pacman'
-    )
-
-    WeightManager.save(trainer.w_hat_player, final_path, final_metadata)
-
-    # Print summary
-    elapsed = datetime.now() - start_time
-    print(f"\n" + "=" * 60)
-    print("TRAINING COMPLETE")
-    print("=" * 60)
-    print(f"Total episodes: {args.episodes}")
-    print(f"Total wins: {trainer.num_win}")
-    print(f"Overall win rate: {trainer.num_win / args.episodes:.2%}")
-    print(f"Final {args.stats_window}-episode win rate: {final_win_rate:.2%}")
-    print(f"Training time: {elapsed}")
-    print(f"\nFinal weights: {trainer.w_hat_player}")
-    print(f"Saved to: {final_path}")
-    print()
-
-
-def train_zombie(
-    args: argparse.Namespace,
-    player_weights: np.ndarray
-) -> None:
-    """Train Zombie agent.
-
-    Args:
-        args: Command-line arguments
-        player_weights: Opponent player weights (8-dimensional)
-    """
-    print("\n" + "=" * 60)
-    print("TRAINING ZOMBIE AGENT")
-    print("=" * 60)
-
-    # Initialize or load trainer
-    if args.continue_from:
-        print(f"Loading initial weights from: {args.continue_from}")
-        initial_weights, metadata = WeightManager.load(args.continue_from)
-        if metadata:
-            print(f"  Previously trained for {metadata.episodes_trained} episodes")
-            print(f"  Final win rate: {metadata.final_win_rate:.2%}")
-        trainer = ZombieTrainer(initial_weights)
-    else:
-        print("Initializing with random weights...")
-        trainer = ZombieTrainer()
-
-    print(f"  Initial weights: {trainer.w_hat_zombie}")
-    print(f"\nTraining parameters:")
-    print(f"  Episodes: {args.episodes}")
-    print(f"  Learning rate: {args.learning_rate}")
-    print(f"  Max steps/episode: {args.max_steps}")
-    print(f"  Stats window: {args.stats_window}")
-    print()
-
-    # Training statistics
-    recent_wins = []
-    start_time = datetime.now()
-
-    # Progress bar
-    if TQDM_AVAILABLE:
-        pbar = tqdm(range(args.episodes), desc="Training", ncols=100)
-    else:
-        pbar = range(args.episodes)
-
-    for episode in pbar:
-        # Create fresh board for episode
-        board = Board()
-
-        # Train one episode
-        V_train, steps, won = trainer.train_episode(
-            board=board,
-            player_weights=player_weights,
-            alpha=args.learning_rate,
-            max_steps=args.max_steps
-        )
-
-        # Track statistics
-        recent_wins.append(1 if won else 0)
-        if len(recent_wins) > args.stats_window:
-            recent_wins.pop(0)
-
-        # Update progress bar or print status
-        if TQDM_AVAILABLE:
-            win_rate = np.mean(recent_wins) if recent_wins else 0
-            pbar.set_postfix({
-                'Win%': f'{win_rate:.1%}',
-                'Steps': steps,
-                'V': f'{V_train:.1f}'
-            })
-        else:
-            if (episode + 1) % args.save_interval == 0:
-                win_rate = np.mean(recent_wins) if recent_wins else 0
-                print(f"Episode {episode + 1}/{args.episodes} | "
-                      f"Win Rate: {win_rate:.2%} | "
-                      f"Steps: {steps} | "
-                      f"V_train: {V_train:.1f}")
-
-        # Save checkpoint
-        if (episode + 1) % args.save_interval == 0:
-            checkpoint_path = args.output_dir / f'zombie_weights_ep{episode + 1}.json'
-            win_rate = np.mean(recent_wins) if recent_wins else 0
-
-            metadata = WeightMetadata(
-                episodes_trained=episode + 1,
-                final_win_rate=win_rate,
-                timestamp=datetime.now().isoformat(),
-                learning_rate=args.learning_rate,
-                feature_count=3,
-                agent_type='zombie'
-            )
-
-            WeightManager.save(trainer.w_hat_zombie, checkpoint_path, metadata)
-
-            if not TQDM_AVAILABLE:
-                print(f"  Saved checkpoint: {checkpoint_path}")
-
-    if TQDM_AVAILABLE:
-        pbar.close()
-
-    # Save final weights
-    final_path = args.output_dir / 'zombie_weights.json'
-    final_win_rate = np.mean(recent_wins) if recent_wins else 0
-
-    final_metadata = WeightMetadata(
-        episodes_trained=args.episodes,
-        final_win_rate=final_win_rate,
-        timestamp=datetime.now().isoformat(),
-        learning_rate=args.learning_rate,
-        feature_count=3,
-        agent_type='zombie'
-    )
-
-    WeightManager.save(trainer.w_hat_zombie, final_path, final_metadata)
-
-    # Print summary
-    elapsed = datetime.now() - start_time
-    print(f"\n" + "=" * 60)
-    print("TRAINING COMPLETE")
-    print("=" * 60)
-    print(f"Total episodes: {args.episodes}")
-    print(f"Total wins: {trainer.num_win}")
-    print(f"Overall win rate: {trainer.num_win / args.episodes:.2%}")
-    print(f"Final {args.stats_window}-episode win rate: {final_win_rate:.2%}")
-    print(f"Training time: {elapsed}")
-    print(f"\nFinal weights: {trainer.w_hat_zombie}")
-    print(f"Saved to: {final_path}")
-    print()
-
-
-def main() -> None:
-    """Main training orchestrator."""
-    args = parse_args()
-
-    # Set random seed if provided
-    if args.seed is not None:
-        np.random.seed(args.seed)
-        print(f"Random seed set to: {args.seed}")
-
-    # Create output directory
-    args.output_dir.mkdir(parents=True, exist_ok=True)
-
-    # Load opponent weights
-    if args.agent == 'pacman':
-        # Load or initialize zombie weights
-        if args.opponent_weights:
-            print(f"Loading zombie opponent weights from: {args.opponent_weights}")
-            zombie_weights, _ = WeightManager.load(args.opponent_weights)
-        else:
-            print("No zombie weights provided, using random initialization")
-            zombie_weights = np.random.rand(3) - 0.5
-
-        train_pacman(args, zombie_weights)
-
-    elif args.agent == 'zombie':
-        # Load or initialize player weights
-        if args.opponent_weights:
-            print(f"Loading player opponent weights from: {args.opponent_weights}")
-            player_weights, _ = WeightManager.load(args.opponent_weights)
-        else:
-            print("No player weights provided, using random initialization")
-            player_weights = np.random.rand(8) - 0.5
-
-        train_zombie(args, player_weights)
-
-    elif args.agent == 'both':
-        # Train both agents sequentially
-        print("Training both agents sequentially...")
-        print("This will train Pac-Man first, then Zombie against trained Pac-Man")
-        print()
-
-        # First train Pac-Man against random zombie
-        zombie_weights = np.random.rand(3) - 0.5
-        train_pacman(args, zombie_weights)
-
-        # Load trained Pac-Man weights
-        pacman_path = args.output_dir / 'pacman_weights.json'
-        player_weights, _ = WeightManager.load(pacman_path)
-
-        # Then train Zombie against trained Pac-Man
-        train_zombie(args, player_weights)
-
-    print("All training complete!")
-
-
-if __name__ == '__main__':
-    main()
+#!/usr/bin/env python3
+"""Training script for Pac-Man and Zombie agents using temporal difference learning.
+
+This script trains agents using the exact algorithms from the original implementation,
+preserving the sacred weight update formulas:
+
+PAC-MAN:  w = w + α * (V_train - V_hat) * features  (COOPERATIVE)
+ZOMBIE:   w = w - α * (V_train - V_hat) * features  (ADVERSARIAL)
+
+Usage:
+    # Train Pac-Man agent
+    python scripts/train.py pacman --episodes 10000 --learning-rate 0.01
+
+    # Train Zombie agent
+    python scripts/train.py zombie --episodes 10000 --learning-rate 0.01
+
+    # Continue training from existing weights
+    python scripts/train.py pacman --continue-from weights/pacman_weights.json
+
+    # Train both agents (sequential)
+    python scripts/train.py both --episodes 5000
+
+    # Play episodes on 4 worker processes, rebroadcasting weights every 64 episodes
+    python scripts/train.py pacman --workers 4 --broadcast-interval 64
+
+    # Mini-batch TD: apply updates 256 steps at a time as one vectorized update
+    python scripts/train.py pacman --update-batch 256
+
+    # Asynchronous training: 4 workers update shared-memory weights lock-free
+    python scripts/train.py zombie --workers 4 --hogwild
+
+    # Parameter server owning both agents' weights, plus 2 local workers
+    python scripts/train.py both --serve 0.0.0.0:5555 --workers 2 --episodes 20000
+
+    # Extra worker on another host, training the zombies
+    python scripts/train.py zombie --connect trainer-host:5555
+"""
+
+import argparse
+import multiprocessing
+import os
+import socket
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Tuple, Union
+
+import numpy as np
+
+# Add src to path for direct script execution
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from pacman_zombie.core.board import BoardPool
+from pacman_zombie.core.rng import episode_seeds, fresh_seed, init_generator, make_rng
+from pacman_zombie.learning.hogwild import HogwildRunner
+from pacman_zombie.learning.param_server import AGENTS, ParameterServer, ParameterWorker, parse_address
+from pacman_zombie.learning.parallel import ParallelEpisodeRunner
+from pacman_zombie.learning.trainer import OUTCOME_CYCLE, PacmanTrainer, ZombieTrainer
+from pacman_zombie.learning.weights import WeightManager, WeightMetadata
+
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
+    print("Warning: tqdm not available. Install for progress bars: pip install tqdm")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Returns:
+        Parsed arguments namespace
+    """
+    parser = argparse.ArgumentParser(
+        description="Train Pac-Man and Zombie agents using temporal difference learning",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+
+    parser.add_argument(
+        'agent',
+        choices=['pacman', 'zombie', 'both'],
+        help='Which agent to train'
+    )
+
+    parser.add_argument(
+        '--episodes',
+        type=int,
+        default=10000,
+        help='Number of training episodes (default: 10000)'
+    )
+
+    parser.add_argument(
+        '--learning-rate',
+        type=float,
+        default=0.01,
+        help='Learning rate alpha (default: 0.01)'
+    )
+
+    parser.add_argument(
+        '--max-steps',
+        type=int,
+        default=1000,
+        help='Maximum steps per episode (default: 1000)'
+    )
+
+    parser.add_argument(
+        '--continue-from',
+        type=Path,
+        metavar='WEIGHTS_FILE',
+        help='Continue training from existing weights file'
+    )
+
+    parser.add_argument(
+        '--opponent-weights',
+        type=Path,
+        metavar='WEIGHTS_FILE',
+        help='Use specific weights for opponent agent'
+    )
+
+    parser.add_argument(
+        '--save-interval',
+        type=int,
+        default=1000,
+        help='Save weights every N episodes (default: 1000)'
+    )
+
+    parser.add_argument(
+        '--output-dir',
+        type=Path,
+        default=Path('weights'),
+        help='Directory to save trained weights (default: ./weights)'
+    )
+
+    parser.add_argument(
+        '--stats-window',
+        type=int,
+        default=100,
+        help='Window size for computing win rate statistics (default: 100)'
+    )
+
+    parser.add_argument(
+        '--seed',
+        type=int,
+        help='Seed of every random stream in the run (default: drawn and printed)'
+    )
+
+    parser.add_argument(
+        '--max-repeats',
+        type=int,
+        metavar='N',
+        help='End an episode once any game state has repeated more than N times '
+             '(default: off, episodes run until game over or --max-steps)'
+    )
+
+    parser.add_argument(
+        '--layouts',
+        metavar='FILE',
+        help='Start episode i from layout i of a bank made by generate_layouts.py '
+             '(default: draw a fresh layout per episode)'
+    )
+
+    parser.add_argument(
+        '--update-batch',
+        type=int,
+        metavar='N',
+        help='Collect N steps\' TD updates and apply them as one vectorized update, '
+             'evaluated at the weights the batch started from (default: off, '
+             'every step is applied immediately)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        metavar='N',
+        help='Play episodes on N worker processes; the parent applies their '
+             'updates in order (default: serial, in-process)'
+    )
+
+    parser.add_argument(
+        '--broadcast-interval',
+        type=int,
+        default=32,
+        metavar='K',
+        help='With --workers, send workers fresh weights every K episodes (default: 32)'
+    )
+
+    parser.add_argument(
+        '--hogwild',
+        action='store_true',
+        help='With --workers, train asynchronously: workers apply their updates '
+             'lock-free to shared-memory weights'
+    )
+
+    parser.add_argument(
+        '--serve',
+        metavar='HOST:PORT',
+        help='Run a parameter server owning both agents\' weights; with --workers, '
+             'also start N local workers (--episodes counts all workers\' episodes)'
+    )
+
+    parser.add_argument(
+        '--connect',
+        metavar='HOST:PORT',
+        help='Run a worker that trains AGENT against a parameter server'
+    )
+
+    parser.add_argument(
+        '--batch-episodes',
+        type=int,
+        default=8,
+        help='Parameter-server workers: episodes per pushed update (default: 8)'
+    )
+
+    parser.add_argument(
+        '--staleness',
+        type=int,
+        default=4,
+        help='Parameter server: drop updates more than N versions behind (default: 4)'
+    )
+
+    args = parser.parse_args()
+    if args.hogwild and not args.workers:
+        parser.error('--hogwild requires --workers')
+    if args.serve and args.connect:
+        parser.error('--serve and --connect are mutually exclusive')
+    if args.serve and args.hogwild:
+        parser.error('--hogwild cannot be combined with --serve')
+    if args.connect and args.agent == 'both':
+        parser.error('--connect needs AGENT to be pacman or zombie')
+    if args.layouts and (args.serve or args.connect):
+        parser.error('--layouts is not supported in parameter-server mode')
+    if args.update_batch is not None:
+        if args.update_batch < 1:
+            parser.error('--update-batch must be at least 1')
+        if args.hogwild or args.serve or args.connect:
+            parser.error('--update-batch is not supported with --hogwild or in parameter-server mode')
+
+    return args
+
+
+def random_weights(args: argparse.Namespace, agent: str) -> np.ndarray:
+    """Random initial weights in [-0.5, 0.5) for an agent, from the run seed.
+
+    Args:
+        args: Command-line arguments
+        agent: 'pacman' or 'zombie'
+
+    Returns:
+        8 or 3 weights
+    """
+    size = 8 if agent == 'pacman' else 3
+    return init_generator(args.seed, AGENTS.index(agent)).random(size) - 0.5
+
+
+def play_episodes(
+    args: argparse.Namespace,
+    trainer: Union[PacmanTrainer, ZombieTrainer],
+    opponent_weights: np.ndarray
+) -> Iterator[Tuple[float, int, bool, str]]:
+    """Play the run's training episodes serially, on a worker pool or Hogwild.
+
+    Args:
+        args: Command-line arguments
+        trainer: PacmanTrainer or ZombieTrainer to train
+        opponent_weights: Fixed opponent weights
+
+    Yields:
+        (V_train, steps, won, outcome) per episode, after its weight updates
+    """
+    if not args.workers:
+        # Reset one board per episode instead of constructing a new one
+        boards = BoardPool(layouts=args.layouts)
+        for episode in range(args.episodes):
+            board_seed, agent_seed = episode_seeds(args.seed, episode)
+            board = boards.board(episode, board_seed)
+            trainer.rng = make_rng(agent_seed)
+            V_train, steps, won = trainer.train_episode(
+                board, opponent_weights, args.learning_rate, args.max_steps, max_repeats=args.max_repeats
+            )
+            yield V_train, steps, won, trainer.last_outcome
+        return
+
+    if args.hogwild:
+        with HogwildRunner(
+            trainer,
+            opponent_weights,
+            workers=args.workers,
+            alpha=args.learning_rate,
+            max_steps=args.max_steps,
+            seed=args.seed,
+            max_repeats=args.max_repeats,
+            layouts=args.layouts
+        ) as runner:
+            for result in runner.run(args.episodes):
+                yield result.V_train, result.steps, result.won, result.outcome
+        return
+
+    with ParallelEpisodeRunner(
+        trainer,
+        opponent_weights,
+        workers=args.workers,
+        broadcast_interval=args.broadcast_interval,
+        alpha=args.learning_rate,
+        max_steps=args.max_steps,
+        seed=args.seed,
+        max_repeats=args.max_repeats,
+        layouts=args.layouts
+    ) as runner:
+        for record in runner.run(args.episodes):
+            yield record.V_train, record.steps, record.won, record.outcome
+
+
+def print_cycle_summary(args: argparse.Namespace, cycles: int, steps_played: int, steps_saved: int) -> None:
+    """Print how many episodes cycle detection ended and the CPU it saved.
+
+    Saved steps assume a cycling episode would otherwise have run to
+    --max-steps, so the CPU fraction is an estimate.
+
+    Args:
+        args: Command-line arguments
+        cycles: Episodes ended by cycle detection
+        steps_played: Steps played over all episodes
+        steps_saved: Steps cut from cycle-ended episodes
+    """
+    if args.max_repeats is None:
+        return
+    print(f"Cycle-ended episodes: {cycles} ({cycles / args.episodes:.2%}, max repeats {args.max_repeats})")
+    print(f"Estimated CPU saved: {steps_saved / max(steps_played + steps_saved, 1):.2%} "
+          f"({steps_saved} of {steps_played + steps_saved} steps)")
+
+
+def train_pacman(
+    args: argparse.Namespace,
+    zombie_weights: np.ndarray
+) -> None:
+    """Train Pac-Man agent.
+
+    Args:
+        args: Command-line arguments
+        zombie_weights: Opponent zombie weights (3-dimensional)
+    """
+    print("\n" + "=" * 60)
+    print("TRAINING PAC-MAN AGENT")
+    print("=" * 60)
+
+    # Initialize or load trainer
+    if args.continue_from:
+        print(f"Loading initial weights from: {args.continue_from}")
+        initial_weights, metadata = WeightManager.load(args.continue_from)
+        if metadata:
+            print(f"  Previously trained for {metadata.episodes_trained} episodes")
+            print(f"  Final win rate: {metadata.final_win_rate:.2%}")
+        trainer = PacmanTrainer(initial_weights, update_batch=args.update_batch)
+    else:
+        print("Initializing with random weights...")
+        trainer = PacmanTrainer(random_weights(args, 'pacman'), update_batch=args.update_batch)
+
+    print(f"  Initial weights: {trainer.w_hat_player}")
+    print(f"\nTraining parameters:")
+    print(f"  Episodes: {args.episodes}")
+    print(f"  Learning rate: {args.learning_rate}")
+    print(f"  Max steps/episode: {args.max_steps}")
+    print(f"  Stats window: {args.stats_window}")
+    if args.hogwild:
+        print(f"  Workers: {args.workers} (Hogwild, shared-memory weights)")
+    elif args.workers:
+        print(f"  Workers: {args.workers} (weights broadcast every {args.broadcast_interval} episodes)")
+    if args.update_batch:
+        print(f"  Update batch: {args.update_batch} steps")
+    print()
+
+    # Training statistics
+    recent_wins = []
+    cycles = steps_played = steps_saved = 0
+    start_time = datetime.now()
+
+    # Progress bar
+    episodes = play_episodes(args, trainer, zombie_weights)
+    if TQDM_AVAILABLE:
+        pbar = tqdm(episodes, total=args.episodes, desc="Training", ncols=100)
+    else:
+        pbar = episodes
+
+    for episode, (V_train, steps, won, outcome) in enumerate(pbar):
+
+        # Track statistics
+        steps_played += steps
+        if outcome == OUTCOME_CYCLE:
+            cycles += 1
+            steps_saved += args.max_steps - steps
+        recent_wins.append(1 if won else 0)
+        if len(recent_wins) > args.stats_window:
+            recent_wins.pop(0)
+
+        # Update progress bar or print status
+        if TQDM_AVAILABLE:
+            win_rate = np.mean(recent_wins) if recent_wins else 0
+            pbar.set_postfix({
+                'Win%': f'{win_rate:.1%}',
+                'Steps': steps,
+                'V': f'{V_train:.1f}'
+            })
+        else:
+            if (episode + 1) % args.save_interval == 0:
+                win_rate = np.mean(recent_wins) if recent_wins else 0
+                print(f"Episode {episode + 1}/{args.episodes} | "
+                      f"Win Rate: {win_rate:.2%} | "
+                      f"Steps: {steps} | "
+                      f"V_train: {V_train:.1f}")
+
+        # Save checkpoint
+        if (episode + 1) % args.save_interval == 0:
+            checkpoint_path = args.output_dir / f'pacman_weights_ep{episode + 1}.json'
+            win_rate = np.mean(recent_wins) if recent_wins else 0
+
+            metadata = WeightMetadata(
+                episodes_trained=episode + 1,
+                final_win_rate=win_rate,
+                timestamp=datetime.now().isoformat(),
+                learning_rate=args.learning_rate,
+                feature_count=8,
+                agent_type='pacman'
+            )
+
+            trainer.flush()  # include a pending partial mini-batch
+            WeightManager.save(trainer.w_hat_player, checkpoint_path, metadata)
+
+            if not TQDM_AVAILABLE:
+                print(f"  Saved checkpoint: {checkpoint_path}")
+
+    if TQDM_AVAILABLE:
+        pbar.close()
+
+    # Save final weights
+    final_path = args.output_dir / 'pacman_weights.json'
+    final_win_rate = np.mean(recent_wins) if recent_wins else 0
+
+    final_metadata = WeightMetadata(
+        episodes_trained=args.episodes,
+        final_win_rate=final_win_rate,
+        timestamp=datetime.now().isoformat(),
+        learning_rate=args.learning_rate,
+        feature_count=8,
+        agent_type='pacman'
+    )
+
+    trainer.flush()
+    WeightManager.save(trainer.w_hat_player, final_path, final_metadata)
+
+    # Print summary
+    elapsed = datetime.now() - start_time
+    print(f"\n" + "=" * 60)
+    print("TRAINING COMPLETE")
+    print("=" * 60)
+    print(f"Total episodes: {args.episodes}")
+    print(f"Total wins: {trainer.num_win}")
+    print(f"Overall win rate: {trainer.num_win / args.episodes:.2%}")
+    print(f"Final {args.stats_window}-episode win rate: {final_win_rate:.2%}")
+    print(f"Training time: {elapsed}")
+    print(f"Episodes/sec: {args.episodes / max(elapsed.total_seconds(), 1e-9):.1f}")
+    print_cycle_summary(args, cycles, steps_played, steps_saved)
+    print(f"\nFinal weights: {trainer.w_hat_player}")
+    print(f"Saved to: {final_path}")
+    print()
+
+
+def train_zombie(
+    args: argparse.Namespace,
+    player_weights: np.ndarray
+) -> None:
+    """Train Zombie agent.
+
+    Args:
+        args: Command-line arguments
+        player_weights: Opponent player weights (8-dimensional)
+    """
+    print("\n" + "=" * 60)
+    print("TRAINING ZOMBIE AGENT")
+    print("=" * 60)
+
+    # Initialize or load trainer
+    if args.continue_from:
+        print(f"Loading initial weights from: {args.continue_from}")
+        initial_weights, metadata = WeightManager.load(args.continue_from)
+        if metadata:
+            print(f"  Previously trained for {metadata.episodes_trained} episodes")
+            print(f"  Final win rate: {metadata.final_win_rate:.2%}")
+        trainer = ZombieTrainer(initial_weights, update_batch=args.update_batch)
+    else:
+        print("Initializing with random weights...")
+        trainer = ZombieTrainer(random_weights(args, 'zombie'), update_batch=args.update_batch)
+
+    print(f"  Initial weights: {trainer.w_hat_zombie}")
+    print(f"\nTraining parameters:")
+    print(f"  Episodes: {args.episodes}")
+    print(f"  Learning rate: {args.learning_rate}")
+    print(f"  Max steps/episode: {args.max_steps}")
+    print(f"  Stats window: {args.stats_window}")
+    if args.hogwild:
+        print(f"  Workers: {args.workers} (Hogwild, shared-memory weights)")
+    elif args.workers:
+        print(f"  Workers: {args.workers} (weights broadcast every {args.broadcast_interval} episodes)")
+    if args.update_batch:
+        print(f"  Update batch: {args.update_batch} steps")
+    print()
+
+    # Training statistics
+    recent_wins = []
+    cycles = steps_played = steps_saved = 0
+    start_time = datetime.now()
+
+    # Progress bar
+    episodes = play_episodes(args, trainer, player_weights)
+    if TQDM_AVAILABLE:
+        pbar = tqdm(episodes, total=args.episodes, desc="Training", ncols=100)
+    else:
+        pbar = episodes
+
+    for episode, (V_train, steps, won, outcome) in enumerate(pbar):
+
+        # Track statistics
+        steps_played += steps
+        if outcome == OUTCOME_CYCLE:
+            cycles += 1
+            steps_saved += args.max_steps - steps
+        recent_wins.append(1 if won else 0)
+        if len(recent_wins) > args.stats_window:
+            recent_wins.pop(0)
+
+        # Update progress bar or print status
+        if TQDM_AVAILABLE:
+            win_rate = np.mean(recent_wins) if recent_wins else 0
+            pbar.set_postfix({
+                'Win%': f'{win_rate:.1%}',
+                'Steps': steps,
+                'V': f'{V_train:.1f}'
+            })
+        else:
+            if (episode + 1) % args.save_interval == 0:
+                win_rate = np.mean(recent_wins) if recent_wins else 0
+                print(f"Episode {episode + 1}/{args.episodes} | "
+                      f"Win Rate: {win_rate:.2%} | "
+                      f"Steps: {steps} | "
+                      f"V_train: {V_train:.1f}")
+
+        # Save checkpoint
+        if (episode + 1) % args.save_interval == 0:
+            checkpoint_path = args.output_dir / f'zombie_weights_ep{episode + 1}.json'
+            win_rate = np.mean(recent_wins) if recent_wins else 0
+
+            metadata = WeightMetadata(
+                episodes_trained=episode + 1,
+                final_win_rate=win_rate,
+                timestamp=datetime.now().isoformat(),
+                learning_rate=args.learning_rate,
+                feature_count=3,
+                agent_type='zombie'
+            )
+
+            trainer.flush()  # include a pending partial mini-batch
+            WeightManager.save(trainer.w_hat_zombie, checkpoint_path, metadata)
+
+            if not TQDM_AVAILABLE:
+                print(f"  Saved checkpoint: {checkpoint_path}")
+
+    if TQDM_AVAILABLE:
+        pbar.close()
+
+    # Save final weights
+    final_path = args.output_dir / 'zombie_weights.json'
+    final_win_rate = np.mean(recent_wins) if recent_wins else 0
+
+    final_metadata = WeightMetadata(
+        episodes_trained=args.episodes,
+        final_win_rate=final_win_rate,
+        timestamp=datetime.now().isoformat(),
+        learning_rate=args.learning_rate,
+        feature_count=3,
+        agent_type='zombie'
+    )
+
+    trainer.flush()
+    WeightManager.save(trainer.w_hat_zombie, final_path, final_metadata)
+
+    # Print summary
+    elapsed = datetime.now() - start_time
+    print(f"\n" + "=" * 60)
+    print("TRAINING COMPLETE")
+    print("=" * 60)
+    print(f"Total episodes: {args.episodes}")
+    print(f"Total wins: {trainer.num_win}")
+    print(f"Overall win rate: {trainer.num_win / args.episodes:.2%}")
+    print(f"Final {args.stats_window}-episode win rate: {final_win_rate:.2%}")
+    print(f"Training time: {elapsed}")
+    print(f"Episodes/sec: {args.episodes / max(elapsed.total_seconds(), 1e-9):.1f}")
+    print_cycle_summary(args, cycles, steps_played, steps_saved)
+    print(f"\nFinal weights: {trainer.w_hat_zombie}")
+    print(f"Saved to: {final_path}")
+    print()
+
+
+def initial_server_weights(args: argparse.Namespace) -> dict:
+    """Initial weights of both agents for the parameter server.
+
+    The trained agent starts from --continue-from and its opponent from
+    --opponent-weights when given; anything else is randomly initialized.
+
+    Args:
+        args: Command-line arguments
+
+    Returns:
+        Dict mapping 'pacman' and 'zombie' to weight vectors
+    """
+    weights = {agent: random_weights(args, agent) for agent in AGENTS}
+    if args.agent in AGENTS:
+        opponent = 'zombie' if args.agent == 'pacman' else 'pacman'
+        if args.continue_from:
+            print(f"Loading {args.agent} weights from: {args.continue_from}")
+            weights[args.agent], _ = WeightManager.load(args.continue_from)
+        if args.opponent_weights:
+            print(f"Loading {opponent} weights from: {args.opponent_weights}")
+            weights[opponent], _ = WeightManager.load(args.opponent_weights)
+    return weights
+
+
+def print_worker_metrics(metrics: list) -> None:
+    """Print per-worker throughput.
+
+    Args:
+        metrics: WorkerMetrics of each worker
+    """
+    print(f"{'Worker':24s} {'Agent':7s} {'Episodes':>8s} {'Ep/s':>7s} {'Busy':>6s} "
+          f"{'Pushes':>6s} {'Stale':>6s} {'Reconn':>6s}")
+    for worker in sorted(metrics, key=lambda worker: worker.worker):
+        print(f"{worker.worker:24s} {worker.agent:7s} {worker.episodes:8d} "
+              f"{worker.episodes_per_second:7.1f} {worker.utilization:6.1%} "
+              f"{worker.pushes:6d} {worker.rejected:6d} {worker.reconnects:6d}")
+
+
+def run_local_worker(
+    address: tuple,
+    agent: str,
+    worker_id: str,
+    args: argparse.Namespace,
+    seed: int
+) -> None:
+    """Entry point of a worker process started by --serve --workers."""
+    ParameterWorker(
+        address, agent, worker_id=worker_id, batch_episodes=args.batch_episodes,
+        alpha=args.learning_rate, max_steps=args.max_steps, seed=seed, max_repeats=args.max_repeats
+    ).run()
+
+
+def serve(args: argparse.Namespace) -> None:
+    """Run a parameter server until --episodes episodes have been applied.
+
+    Args:
+        args: Command-line arguments
+    """
+    host, port = parse_address(args.serve)
+    weights = initial_server_weights(args)
+    trained = list(AGENTS) if args.agent == 'both' else [args.agent]
+
+    server = ParameterServer(
+        weights['pacman'], weights['zombie'], host=host, port=port,
+        staleness=args.staleness, episodes=args.episodes
+    )
+    server.start()
+    address = server.address
+    print(f"Parameter server listening on {address[0]}:{address[1]}")
+    print(f"  Training: {', '.join(trained)} for {args.episodes} episodes "
+          f"(staleness bound {args.staleness})")
+
+    # Local workers connect like remote ones; with 'both' they alternate agents
+    connect_host = '127.0.0.1' if address[0] in ('0.0.0.0', '') else address[0]
+    workers = []
+    for index in range(args.workers or 0):
+        agent = trained[index % len(trained)]
+        seed = args.seed + index
+        process = multiprocessing.Process(
+            target=run_local_worker,
+            args=((connect_host, address[1]), agent, f"local-{index}-{agent}", args, seed)
+        )
+        process.start()
+        workers.append(process)
+
+    start_time = datetime.now()
+    next_checkpoint = args.save_interval
+    while True:
+        time.sleep(0.5)
+        episodes = server.episodes
+        if server.done:
+            break
+        if episodes >= next_checkpoint:
+            for agent in trained:
+                checkpoint_path = args.output_dir / f'{agent}_weights_ep{episodes}.json'
+                metadata = WeightMetadata(
+                    episodes_trained=episodes,
+                    final_win_rate=server.win_rate(agent),
+                    timestamp=datetime.now().isoformat(),
+                    learning_rate=args.learning_rate,
+                    feature_count=len(weights[agent]),
+                    agent_type=agent
+                )
+                WeightManager.save(server.snapshot(agent), checkpoint_path, metadata)
+            print(f"Episode {episodes}/{args.episodes} | saved checkpoint")
+            while next_checkpoint <= episodes:
+                next_checkpoint += args.save_interval
+
+    for process in workers:
+        process.join()
+    # Give remote workers a moment to fetch the final 'done' reply
+    time.sleep(1.0)
+    server.stop()
+
+    elapsed = datetime.now() - start_time
+    print("\n" + "=" * 60)
+    print("PARAMETER SERVER TRAINING COMPLETE")
+    print("=" * 60)
+    for agent in trained:
+        final_path = args.output_dir / f'{agent}_weights.json'
+        final_metadata = WeightMetadata(
+            episodes_trained=server.episodes,
+            final_win_rate=server.win_rate(agent),
+            timestamp=datetime.now().isoformat(),
+            learning_rate=args.learning_rate,
+            feature_count=len(weights[agent]),
+            agent_type=agent
+        )
+        WeightManager.save(server.snapshot(agent), final_path, final_metadata)
+        print(f"{agent}: win rate {server.win_rate(agent):.2%}, weights {server.snapshot(agent)}")
+        print(f"  Saved to: {final_path}")
+    print(f"Training time: {elapsed}")
+    print(f"Episodes/sec: {server.episodes / max(elapsed.total_seconds(), 1e-9):.1f}")
+    print()
+    print_worker_metrics(server.metrics())
+
+
+def connect(args: argparse.Namespace) -> None:
+    """Run one parameter-server worker until the server's target is reached.
+
+    Args:
+        args: Command-line arguments
+    """
+    address = parse_address(args.connect)
+    worker_id = f"{socket.gethostname()}-{os.getpid()}"
+    print(f"Worker {worker_id} training {args.agent} against {address[0]}:{address[1]}")
+    metrics = ParameterWorker(
+        address, args.agent, worker_id=worker_id, batch_episodes=args.batch_episodes,
+        alpha=args.learning_rate, max_steps=args.max_steps, seed=args.seed,
+        max_repeats=args.max_repeats
+    ).run()
+    print_worker_metrics([metrics])
+
+
+def main() -> None:
+    """Main training orchestrator."""
+    args = parse_args()
+
+    # Every random stream of the run derives from one seed (see core.rng)
+    if args.seed is None:
+        args.seed = fresh_seed()
+    print(f"Random seed: {args.seed}")
+
+    # Create output directory
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+
+    if args.serve:
+        serve(args)
+        return
+    if args.connect:
+        connect(args)
+        return
+
+    # Load opponent weights
+    if args.agent == 'pacman':
+        # Load or initialize zombie weights
+        if args.opponent_weights:
+            print(f"Loading zombie opponent weights from: {args.opponent_weights}")
+            zombie_weights, _ = WeightManager.load(args.opponent_weights)
+        else:
+            print("No zombie weights provided, using random initialization")
+            zombie_weights = random_weights(args, 'zombie')
+
+        train_pacman(args, zombie_weights)
+
+    elif args.agent == 'zombie':
+        # Load or initialize player weights
+        if args.opponent_weights:
+            print(f"Loading player opponent weights from: {args.opponent_weights}")
+            player_weights, _ = WeightManager.load(args.opponent_weights)
+        else:
+            print("No player weights provided, using random initialization")
+            player_weights = random_weights(args, 'pacman')
+
+        train_zombie(args, player_weights)
+
+    elif args.agent == 'both':
+        # Train both agents sequentially
+        print("Training both agents sequentially...")
+        print("This will train Pac-Man first, then Zombie against trained Pac-Man")
+        print()
+
+        # First train Pac-Man against random zombie
+        zombie_weights = random_weights(args, 'zombie')
+        train_pacman(args, zombie_weights)
+
+        # Load trained Pac-Man weights
+        pacman_path = args.output_dir / 'pacman_weights.json'
+        player_weights, _ = WeightManager.load(pacman_path)
+
+        # Then train Zombie against trained Pac-Man
+        train_zombie(args, player_weights)
+
+    print("All training complete!")
+
+
+if __name__ == '__main__':
+    main()
@@ -11,6 +11,7 @@ __license__ = 'MIT'
 
 # Core imports
 from .core.board import Board
+from .core.constants import Action, Cell
 from .agents.pacman_agent import PacmanAgent
 from .agents.zombie_agent import ZombieAgent
 from .agents.features import V_hat
@@ -19,6 +20,8 @@ from .learning.weights import WeightManager, WeightMetadata
 __all__ = [
     '__version__',
     'Board',
+    'Action',
+    'Cell',
     'PacmanAgent',
     'ZombieAgent',
     'V_hat',
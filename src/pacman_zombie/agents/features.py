@@ -1,137 +1,204 @@
-"""Feature extraction for Pac-Man and Zombie agents.
-
-This module contains feature extractors that convert game states into numerical
-feature vectors used by learning agents. Feature engineering is critical to the
-learning algorithm's performance.
-
-IMPORTANT: The exact feature formulas are integral to trained weights.
-Modifying these requires retraining all agents from scratch.
-"""
-
-from typing import TYPE_CHECKING, List
-
-import numpy as np
-from numpy.typing import NDArray
-
-if TYPE_CHECKING:
-    from ..core.board import Board
-
-
-class PacmanFeatureExtractor:
-    """Extracts feature vectors for Pac-Man agent decision making.
-
-    This extractor produces an 8-dimensional feature vector representing:
-    1. Distance to exit (weighted by context)
-    2. Shooting opportunity value
-    3. Remaining vaccines available
-    4. Distance to nearest vaccine
-    5. Distance to nearest zombie (weighted by context)
-    6. Has vaccine flag (binary)
-    7. Minimum distance to obstacles
-    8. Distance to pit (weighted by context)
-
-    Feature weights (multipliers) dynamically adjust based on game state:
-    - When Pac-Man has vaccine: prioritize approaching zombies to cure them
-    - When no zombies remain: prioritize reaching exit
-    - Otherwise: avoid zombies and seek shooting opportunities
-
-    The feature extraction logic is currently delegated to Board.extract_features()
-    for backward compatibility. Future refactoring should move the logic here.
-    """
-
-    def extract(self, board: 'Board', successor_state: List[List[str]]) -> NDArray:
-        """Extract 8-dimensional feature vector from game state.
-
-        Args:
-            board: Current board state (for has_vaccine, shoot count, etc.)
-            successor_state: Hypothetical next board state after taking an action
-
-        Returns:
-            numpy array of 8 float values representing:
-            [0] go_to_exit * (distance_to_exit / 20)
-            [1] shoot * num_zombies
-            [2] remaining_vaccines
-            [3] go_to_vaccine * (distance_to_vaccine / 20)
-            [4] go_to_zombies * (distance_to_nearest_zombie / 20)
-            [5] has_vaccine (binary)
-            [6] min(distance_to_obstacles) / 20
-            [7] pit * (distance_to_pit / 20)
-
-        Note:
-            Multipliers (go_to_exit, shoot, etc.) are context-dependent:
-            - go_to_exit: 100 when zombies=0, else 0
-            - shoot: -1000000 normally, 0 with vaccine
-            - go_to_zombies: -1 with vaccine (flee), 1 otherwise (approach)
-            - pit: 10 when zombies=0, 1 otherwise
-        """
-        return board.extract_features(successor_state)
-
-
-class ZombieFeatureExtractor:
-    """Extracts feature vectors for Zombie agent decision making.
-
-    This extractor produces a 3-dimensional feature vector representing:
-    1. Distance to Pac-Man (negative to encourage approach, positive to flee)
-    2. Distance to pit (to avoid falling in)
-    3. Minimum distance to obstacles (obstacle awareness)
-
-    Feature weights adjust based on whether Pac-Man has vaccine:
-    - Without vaccine: chase Pac-Man (negative multiplier minimizes distance)
-    - With vaccine: flee from Pac-Man (positive multiplier maximizes distance)
-
-    The feature extraction logic is currently delegated to Board.extract_features_zombie()
-    for backward compatibility. Future refactoring should move the logic here.
-    """
-
-    def extract(
-        self,
-        board: 'Board',
-        successor_state: List[List[str]],
-        zombie_row: int,
-        zombie_col: int
-    ) -> NDArray:
-        """Extract 3-dimensional feature vector from game state.
-
-        Args:
-            board: Current board state (for has_vaccine flag)
-            successor_state: Hypothetical next board state after taking an action
-            zombie_row: Zombie's row position in successor state
-            zombie_col: Zombie's column position in successor state
-
-        Returns:
-            numpy array of 3 float values representing:
-            [0] go_to_player * (distance_to_player / 20)
-            [1] distance_to_pit / 20
-            [2] min(distance_to_obstacles) / 40
-
-        Note:
-            go_to_player multiplier is context-dependent:
-            - -10 when Pac-Man doesn't have vaccine (chase)
-            - +10 when Pac-Man has vaccine (flee)
-        """
-        return board.extract_features_zombie(successor_state, zombie_row, zombie_col)
-
-
-def V_hat(features: NDArray, weights: NDArray) -> float:
-    """Compute linear value approximation.
-
-    This is the core value function used by both agents:
-    V(s) ≈ w · φ(s) = Σᵢ wᵢ * φᵢ(s)
-
-    where:
-    - w are the learned weights
-    - φ(s) are the extracted features
-
-    Args:
-        features: Feature vector (numpy array)
-        weights: Weight vector (numpy array, same dimension as features)
-
-    Returns:
-        Estimated value of the state (scalar)
-
-    Example:
-        >>> features = np.array([1.5, 0.0, 3.0, 2.1, 1.0, 1.0, 0.5, 0.8])
-        >>> weights = np.array([-19.5, 7.2, 23.6, -2.6, 2.3, 7.0, 0.01, 0.24])
-        >>> value = V_hat(features, weights)
-    """
-    return np.dot(weights, features)
+"""Feature extraction for Pac-Man and Zombie agents.
+
+This module contains feature extractors that convert game states into numerical
+feature vectors used by learning agents. Feature engineering is critical to the
+learning algorithm's performance.
+
+IMPORTANT: The exact feature formulas are integral to trained weights.
+Modifying these requires retraining all agents from scratch.
+"""
+
+from typing import TYPE_CHECKING, List, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+if TYPE_CHECKING:
+    from ..core.board import Board
+
+
+class PacmanFeatureExtractor:
+    """Extracts feature vectors for Pac-Man agent decision making.
+
+    This extractor produces an 8-dimensional feature vector representing:
+    1. Distance to exit (weighted by context)
+    2. Shooting opportunity value
+    3. Remaining vaccines available
+    4. Distance to nearest vaccine
+    5. Distance to nearest zombie (weighted by context)
+    6. Has vaccine flag (binary)
+    7. Minimum distance to obstacles
+    8. Distance to pit (weighted by context)
+
+    Feature weights (multipliers) dynamically adjust based on game state:
+    - When Pac-Man has vaccine: prioritize approaching zombies to cure them
+    - When no zombies remain: prioritize reaching exit
+    - Otherwise: avoid zombies and seek shooting opportunities
+
+    The feature extraction logic is currently delegated to Board.extract_features()
+    for backward compatibility. Future refactoring should move the logic here.
+    """
+
+    def extract(self, board: 'Board', successor_state: Optional[List[List[str]]] = None) -> NDArray:
+        """Extract 8-dimensional feature vector from game state.
+
+        Args:
+            board: Current board state (for has_vaccine, shoot count, etc.)
+            successor_state: Hypothetical next board state after taking an action.
+                If None, the board's own cells are used, so a successor can be
+                evaluated in place between board.push_player_action() and
+                board.pop_action().
+
+        Returns:
+            numpy array of 8 float values representing:
+            [0] go_to_exit * (distance_to_exit / 20)
+            [1] shoot * num_zombies
+            [2] remaining_vaccines
+            [3] go_to_vaccine * (distance_to_vaccine / 20)
+            [4] go_to_zombies * (distance_to_nearest_zombie / 20)
+            [5] has_vaccine (binary)
+            [6] min(distance_to_obstacles) / 20
+            [7] pit * (distance_to_pit / 20)
+
+        Note:
+            Multipliers (go_to_exit, shoot, etc.) are context-dependent:
+            - go_to_exit: 100 when zombies=0, else 0
+            - shoot: -1000000 normally, 0 with vaccine
+            - go_to_zombies: -1 with vaccine (flee), 1 otherwise (approach)
+            - pit: 10 when zombies=0, 1 otherwise
+        """
+        return board.extract_features(successor_state)
+
+    def extract_batch(self, board: 'Board', actions: List[int]) -> NDArray:
+        """Extract feature vectors for the successors of several actions.
+
+        Vectorized over actions: row i equals extract() on the successor after
+        actions[i], without pushing any action on the board.
+
+        Args:
+            board: Current board state
+            actions: Legal Pac-Man Action codes (see board.get_possible_action())
+
+        Returns:
+            (len(actions), 8) numpy array, one feature vector per action
+        """
+        return board.extract_features_batch(actions)
+
+
+class ZombieFeatureExtractor:
+    """Extracts feature vectors for Zombie agent decision making.
+
+    This extractor produces a 3-dimensional feature vector representing:
+    1. Distance to Pac-Man (negative to encourage approach, positive to flee)
+    2. Distance to pit (to avoid falling in)
+    3. Minimum distance to obstacles (obstacle awareness)
+
+    Feature weights adjust based on whether Pac-Man has vaccine:
+    - Without vaccine: chase Pac-Man (negative multiplier minimizes distance)
+    - With vaccine: flee from Pac-Man (positive multiplier maximizes distance)
+
+    The feature extraction logic is currently delegated to Board.extract_features_zombie()
+    for backward compatibility. Future refactoring should move the logic here.
+    """
+
+    def extract(
+        self,
+        board: 'Board',
+        successor_state: Optional[List[List[str]]],
+        zombie_row: int,
+        zombie_col: int
+    ) -> NDArray:
+        """Extract 3-dimensional feature vector from game state.
+
+        Args:
+            board: Current board state (for has_vaccine flag)
+            successor_state: Hypothetical next board state after taking an action.
+                If None, the board's own cells are used (see
+                board.push_zombie_action()).
+            zombie_row: Zombie's row position in successor state
+            zombie_col: Zombie's column position in successor state
+
+        Returns:
+            numpy array of 3 float values representing:
+            [0] go_to_player * (distance_to_player / 20)
+            [1] distance_to_pit / 20
+            [2] min(distance_to_obstacles) / 40
+
+        Note:
+            go_to_player multiplier is context-dependent:
+            - -10 when Pac-Man doesn't have vaccine (chase)
+            - +10 when Pac-Man has vaccine (flee)
+        """
+        return board.extract_features_zombie(successor_state, zombie_row, zombie_col)
+
+    def extract_field(self, board: 'Board') -> NDArray:
+        """Extract feature vectors for a zombie standing on every cell.
+
+        Row ``row * board.width + col`` equals extract() on the successor
+        where a zombie has moved to (row, col), so one call covers the moves
+        of every zombie in a turn.
+
+        Args:
+            board: Current board state
+
+        Returns:
+            (board.height * board.width, 3) numpy array of feature vectors
+        """
+        return board.extract_features_zombie_field()
+
+
+def V_hat(features: NDArray, weights: NDArray) -> float:
+    """Compute linear value approximation.
+
+    This is the core value function used by both agents:
+    V(s) ≈ w · φ(s) = Σᵢ wᵢ * φᵢ(s)
+
+    where:
+    - w are the learned weights
+    - φ(s) are the extracted features
+
+    Args:
+        features: Feature vector (numpy array)
+        weights: Weight vector (numpy array, same dimension as features)
+
+    Returns:
+        Estimated value of the state (scalar)
+
+    Example:
+        >>> features = np.array([1.5, 0.0, 3.0, 2.1, 1.0, 1.0, 0.5, 0.8])
+        >>> weights = np.array([-19.5, 7.2, 23.6, -2.6, 2.3, 7.0, 0.01, 0.24])
+        >>> value = V_hat(features, weights)
+    """
+    return np.dot(weights, features)
+
+
+def V_hat_batch(features: NDArray, weights: NDArray) -> NDArray:
+    """Compute V_hat for every row of a feature matrix.
+
+    Evaluated as a single einsum mat-vec rather than BLAS gemv: gemv may
+    round identical rows differently depending on their position, which
+    would break tie-breaking between equal successors.
+
+    Args:
+        features: (n, d) feature matrix
+        weights: Weight vector of dimension d
+
+    Returns:
+        Array of n state values
+    """
+    return np.einsum('ij,j->i', features, weights)
+
+
+def argmax_last(values: NDArray) -> int:
+    """Index of the last maximum value.
+
+    Matches the greedy scan ``if value >= max_value`` over shuffled actions,
+    where later ties win (np.argmax keeps the first).
+
+    Args:
+        values: Non-empty array of values
+
+    Returns:
+        Index of the last occurrence of the maximum
+    """
+    return len(values) - 1 - int(np.argmax(values[::-1]))
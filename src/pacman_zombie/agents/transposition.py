@@ -0,0 +1,116 @@
+"""Bounded LRU cache of greedy decisions keyed by board state.
+
+Greedy agents often revisit the same state (they oscillate between two
+cells, for example). A TranspositionCache remembers the decision taken in
+a state, keyed by the board's Zobrist hash and a version of the weights
+that produced it, so a revisit skips successor generation and feature
+extraction.
+
+Caching is opt-in: on a hit the agent returns the remembered decision
+without shuffling the legal actions, so it consumes less randomness and a
+cached run no longer reproduces an uncached run with the same seed.
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+DEFAULT_CACHE_SIZE = 65536
+"""Default maximum number of cached decisions."""
+
+
+def weights_version(weights: NDArray) -> bytes:
+    """Version key of a weight vector, for use in cache keys.
+
+    The version is the vector's float64 bytes, so agents with equal weights
+    share entries and any change to the weights gives a new version.
+
+    Args:
+        weights: Weight vector
+
+    Returns:
+        Bytes identifying the weight values
+    """
+    return np.asarray(weights, dtype=np.float64).tobytes()
+
+
+class TranspositionCache:
+    """Least-recently-used map from (state hash, weights version, ...) keys
+    to (decision, value) entries.
+
+    Attributes:
+        maxsize: Maximum number of entries before the oldest is evicted
+        hits: Lookups that found an entry
+        misses: Lookups that did not
+        evictions: Entries dropped to stay within maxsize
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: 'OrderedDict[Hashable, Tuple[Any, Optional[float]]]' = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Tuple[Any, Optional[float]]]:
+        """Look up a decision and mark it most recently used.
+
+        Args:
+            key: Cache key, starting with the state hash and weights version
+
+        Returns:
+            (decision, value) if cached, else None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: Hashable, decision: Any, value: Optional[float] = None) -> None:
+        """Store a decision, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            decision: Chosen action (or list of zombie moves)
+            value: Estimated value of the decision, if any
+        """
+        self._entries[key] = (decision, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that hit (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"TranspositionCache(size={len(self)}/{self.maxsize}, hits={self.hits}, "
+            f"misses={self.misses}, hit_rate={self.hit_rate:.1%})"
+        )
@@ -1,135 +1,182 @@
-"""Zombie agent using linear function approximation."""
-
-import random
-from typing import TYPE_CHECKING, List, Tuple
-
-from numpy.typing import NDArray
-
-from .features import ZombieFeatureExtractor, V_hat
-
-if TYPE_CHECKING:
-    from ..core.board import Board
-
-
-class ZombieAgent:
-    """Zombie agent that selects actions using learned weights.
-
-    This agent uses a greedy policy to select actions that maximize estimated
-    value, where value is computed using linear function approximation.
-
-    Unlike Pac-Man, zombies operate cooperatively - each zombie on the board
-    independently selects its best action given the current state.
-    """
-
-    def __init__(self, weights: NDArray):
-        """Initialize Zombie agent with weights.
-
-        Args:
-            weights: 3-dimensional weight vector for feature linear combination
-        """
-        if len(weights) != 3:
-            raise ValueError(f"Zombie requires 3 weights, got {len(weights)}")
-
-        self.weights = weights
-        self.feature_extractor = ZombieFeatureExtractor()
-
-    def select_action(self, board: 'Board', zombie_row: int, zombie_col: int) -> str:
-        """Select best action for a single zombie using greedy policy.
-
-        Args:
-            board: Current game board state
-            zombie_row: Zombie's current row position
-            zombie_col: Zombie's current column position
-
-        Returns:
-            Action string: one of UP, DOWN, LEFT, RIGHT
-
-        Algorithm:
-            1. Get all legal actions for this zombie's position
-            2. Randomly shuffle actions (for tie-breaking)
-            3. For each action:
-               a. Get successor state
-               b. Extract features from successor
-               c. Compute V_hat(features, weights)
-            4. Return action with maximum value
-        """
-        actions = board.get_possible_action_zombie(zombie_row, zombie_col)
-
-        if not actions:
-            # No legal actions (zombie is trapped)
-            return "UP"  # Default fallback
-
-        # Shuffle for random tie-breaking
-        random.shuffle(actions)
-
-        max_value = float('-inf')
-        best_action = actions[0]
-
-        for action in actions:
-            # Get hypothetical next state
-            successor_state = board.get_successor_state_zombie(action, zombie_row, zombie_col)
-
-            # Calculate zombie's position in successor state
-            move_delta = board.move_dict[action]
-            successor_row = zombie_row + move_delta[0]
-            successor_col = zombie_col + move_delta[1]
-
-            # Extract features and compute value
-            features = self.feature_extractor.extract(board, successor_state, successor_row, successor_col)
-            value = V_hat(features, self.weights)
-
-            # Update best action if this is better
-            if value > max_value:
-                max_value = value
-                best_action = action
-
-        return best_action
-
-    def select_actions_all_zombies(self, board: 'Board') -> List[Tuple[int, int, str]]:
-        """Select actions for all zombies on the board.
-
-        Args:
-            board: Current game board state
-
-        Returns:
-            List of (row, col, action) tuples, one for each zombie
-
-        Example:
-            >>> zombie_agent = ZombieAgent(weights)
-            >>> actions = zombie_agent.select_actions_all_zombies(board)
-            >>> board.zombies_action(actions)
-        """
-        zombie_positions = board.get_zombies_position()
-        best_actions = []
-
-        for zombie_pos in zombie_positions:
-            row, col = zombie_pos[0], zombie_pos[1]
-            best_action = self.select_action(board, row, col)
-            best_actions.append((row, col, best_action))
-
-        return best_actions
-
-    def get_action_values(self, board: 'Board', zombie_row: int, zombie_col: int) -> dict:
-        """Get value estimates for all possible actions (for analysis/debugging).
-
-        Args:
-            board: Current game board state
-            zombie_row: Zombie's current row position
-            zombie_col: Zombie's current column position
-
-        Returns:
-            Dictionary mapping action strings to their estimated values
-        """
-        actions = board.get_possible_action_zombie(zombie_row, zombie_col)
-        action_values = {}
-
-        for action in actions:
-            successor_state = board.get_successor_state_zombie(action, zombie_row, zombie_col)
-            move_delta = board.move_dict[action]
-            successor_row = zombie_row + move_delta[0]
-            successor_col = zombie_col + move_delta[1]
-            features = self.feature_extractor.extract(board, successor_state, successor_row, successor_col)
-            value = V_hat(features, self.weights)
-            action_values[action] = value
-
-        return action_values
+"""Zombie agent using linear function approximation."""
+
+import random
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from numpy.typing import NDArray
+
+from ..core.constants import MOVE_UP, Action
+from ..core.rng import make_rng
+from .features import ZombieFeatureExtractor, V_hat_batch
+from .transposition import TranspositionCache, weights_version
+
+if TYPE_CHECKING:
+    from ..core.board import Board
+
+
+class ZombieAgent:
+    """Zombie agent that selects actions using learned weights.
+
+    This agent uses a greedy policy to select actions that maximize estimated
+    value, where value is computed using linear function approximation.
+
+    Unlike Pac-Man, zombies operate cooperatively - each zombie on the board
+    independently selects its best action given the current state.
+    """
+
+    def __init__(
+        self,
+        weights: NDArray,
+        cache: Optional[TranspositionCache] = None,
+        rng: Optional[random.Random] = None
+    ):
+        """Initialize Zombie agent with weights.
+
+        Args:
+            weights: 3-dimensional weight vector for feature linear combination
+            cache: Optional transposition cache for whole zombie turns; see
+                agents.transposition (hits skip the tie-breaking shuffles)
+            rng: Random stream for tie-breaking shuffles. If None, a
+                private stream seeded from OS entropy is used.
+        """
+        if len(weights) != 3:
+            raise ValueError(f"Zombie requires 3 weights, got {len(weights)}")
+
+        self.weights = weights
+        self.feature_extractor = ZombieFeatureExtractor()
+        self.cache = cache
+        self.rng: random.Random = rng if rng is not None else make_rng()
+
+    @property
+    def weights(self) -> NDArray:
+        """Weight vector (assigning it also refreshes weights_version)."""
+        return self._weights
+
+    @weights.setter
+    def weights(self, weights: NDArray) -> None:
+        self._weights = weights
+        self.weights_version = weights_version(weights)
+
+    def value_field(self, board: 'Board') -> List[float]:
+        """Estimate the value of a zombie standing on each cell.
+
+        Args:
+            board: Current game board state
+
+        Returns:
+            List of V_hat values indexed by ``row * board.width + col``
+        """
+        features = self.feature_extractor.extract_field(board)
+        return V_hat_batch(features, self.weights).tolist()
+
+    def select_action(
+        self,
+        board: 'Board',
+        zombie_row: int,
+        zombie_col: int,
+        values: Optional[List[float]] = None
+    ) -> Action:
+        """Select best action for a single zombie using greedy policy.
+
+        Args:
+            board: Current game board state
+            zombie_row: Zombie's current row position
+            zombie_col: Zombie's current column position
+            values: Value field from value_field() for this turn (computed
+                if None)
+
+        Returns:
+            Action code: one of UP, DOWN, LEFT, RIGHT
+
+        Algorithm:
+            1. Get all legal actions for this zombie's position
+            2. Randomly shuffle actions (for tie-breaking)
+            3. Look up the value field at each action's target cell
+            4. Return the first action with maximum value
+        """
+        actions = board.get_possible_action_zombie(zombie_row, zombie_col)
+
+        if not actions:
+            # No legal actions (zombie is trapped)
+            return MOVE_UP  # Default fallback
+
+        # Shuffle for random tie-breaking
+        self.rng.shuffle(actions)
+
+        if values is None:
+            values = self.value_field(board)
+
+        max_value = float('-inf')
+        best_action = actions[0]
+        width = board.width
+
+        for action in actions:
+            # Value of the zombie's cell in the successor state
+            d_row, d_col = board.move_deltas[action]
+            value = values[(zombie_row + d_row) * width + zombie_col + d_col]
+
+            # Update best action if this is better
+            if value > max_value:
+                max_value = value
+                best_action = action
+
+        return best_action
+
+    def select_actions_all_zombies(self, board: 'Board') -> List[Tuple[int, int, Action]]:
+        """Select actions for all zombies on the board.
+
+        The value field is computed once and shared by every zombie, since
+        all zombies choose against the same board state. With a cache, a
+        state already decided under the same weights returns the cached
+        moves directly.
+
+        Args:
+            board: Current game board state
+
+        Returns:
+            List of (row, col, action) tuples, one for each zombie
+
+        Example:
+            >>> zombie_agent = ZombieAgent(weights)
+            >>> actions = zombie_agent.select_actions_all_zombies(board)
+            >>> board.zombies_action(actions)
+        """
+        if self.cache is not None:
+            key = (board.zobrist_hash, self.weights_version, 'zombies')
+            cached = self.cache.get(key)
+            if cached is not None:
+                return list(cached[0])
+
+        zombie_positions = board.get_zombies_position()
+        best_actions = []
+        values = self.value_field(board) if zombie_positions else None
+
+        for zombie_pos in zombie_positions:
+            row, col = zombie_pos[0], zombie_pos[1]
+            best_action = self.select_action(board, row, col, values)
+            best_actions.append((row, col, best_action))
+
+        if self.cache is not None:
+            self.cache.put(key, tuple(best_actions))
+        return best_actions
+
+    def get_action_values(self, board: 'Board', zombie_row: int, zombie_col: int) -> dict:
+        """Get value estimates for all possible actions (for analysis/debugging).
+
+        Args:
+            board: Current game board state
+            zombie_row: Zombie's current row position
+            zombie_col: Zombie's current column position
+
+        Returns:
+            Dictionary mapping Action codes to their estimated values
+        """
+        actions = board.get_possible_action_zombie(zombie_row, zombie_col)
+        values = self.value_field(board)
+        action_values = {}
+
+        for action in actions:
+            d_row, d_col = board.move_deltas[action]
+            action_values[action] = values[(zombie_row + d_row) * board.width + zombie_col + d_col]
+
+        return action_values
@@ -0,0 +1,709 @@
+"""Vectorized simulator running many independent games at once.
+
+BatchBoard holds N games as stacked NumPy arrays and applies the Board
+rules (player moves, shooting, zombie moves, pit respawn, vaccine pickup,
+curing, capture, pit and exit) to all of them with array operations.
+Finished games are reset in place, so the batch behaves like a vector of
+environments that never runs dry. Without auto_reset, a finished game is
+marked done and left untouched (its outcome fixed) until reset().
+
+Cells are stored flat: game g's cell (row, col) is ``cells[g, row * width +
+col]``. Every game has one extra padding cell at index ``height * width``
+that always reads as an obstacle. Neighbours come from precomputed offset
+tables that send off-board moves to that cell, so a move, bounds check and
+obstacle check is two array lookups.
+
+Actions are the Board's Action codes: 0-3 are the moves (UP, DOWN, LEFT,
+RIGHT), 4 is SHOOT and NO_ACTION (-1) skips a game or zombie.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .constants import *
+from .grid import GRID_DTYPE
+from .placement import DEFAULT_MAX_ATTEMPTS, placement_stats
+from .rules import NEIGHBOUR_OFFSETS, SHOOT_OFFSETS
+
+if TYPE_CHECKING:
+    from .board import Board
+
+BATCH_ACTIONS: Tuple[Action, ...] = tuple(Action)
+"""Actions by batch action code (the same codes Board uses)."""
+
+ACTION_CODE_SHOOT: int = ACTION_SHOOT
+"""Batch action code of SHOOT."""
+
+NO_ACTION: int = -1
+"""Action code that leaves a game (or zombie) untouched."""
+
+# Step outcomes returned by BatchBoard.step()
+OUTCOME_NONE: int = 0
+OUTCOME_WIN: int = 1
+OUTCOME_CAPTURED: int = 2
+OUTCOME_PIT: int = 3
+
+# Cells a zombie cannot enter, indexed by cell code
+_ZOMBIE_BLOCKED: NDArray = np.isin(np.arange(len(Cell)), [CELL_OBSTACLE, CELL_VACCINE, CELL_EXIT])
+
+
+def _offset_table(height: int, width: int, offsets: Tuple[Tuple[int, int], ...]) -> NDArray:
+    """Flat neighbour cells for each offset, padded for off-board targets.
+
+    Args:
+        height: Board height in cells
+        width: Board width in cells
+        offsets: (d_row, d_col) offsets
+
+    Returns:
+        (height * width + 1, len(offsets)) array where entry [cell, k] is the
+        cell at offsets[k] from cell, or height * width if that is off the
+        board (the padding cell maps to itself). A cell's row is contiguous,
+        so table[cells] gathers all neighbours of many cells at once.
+    """
+    size = height * width
+    rows, cols = np.divmod(np.arange(size), width)
+    table = np.full((size + 1, len(offsets)), size, dtype=np.intp)
+    for index, (d_row, d_col) in enumerate(offsets):
+        target_rows = rows + d_row
+        target_cols = cols + d_col
+        inside = (target_rows >= 0) & (target_rows < height) & (target_cols >= 0) & (target_cols < width)
+        table[:size, index] = np.where(inside, target_rows * width + target_cols, size)
+    return table
+
+
+class BatchBoard:
+    """N independent games stepped together with array operations.
+
+    State arrays (one row or entry per game):
+    - cells: (N, height * width + 1) cell codes, last column is padding
+    - player: Pac-Man's flat cell
+    - zombies: (N, max_zombies) flat cells in row-major order, padded
+      with the padding index for zombies no longer on the board
+    - vaccine / exit / pit: flat cells (vaccine is the padding index when
+      no vaccine is on the board)
+    - shoot, has_vaccine, num_zombie_cure, score, steps: game counters
+
+    After resolve() the step outcome is available as captured,
+    fell_into_pit, exit_exists and num_zombies, and as an OUTCOME_* code
+    in outcome. Games with an outcome are marked in done; the move and
+    resolve passes skip them until they are reset.
+
+    New games are placed like Board(): distinct cells are sampled without
+    replacement and layouts that are not connected (see
+    core.placement.is_connected) are redrawn. Pit respawns and vaccine
+    drops sample uniformly from the same cells Board would accept.
+
+    Attributes:
+        num_games: Number of games N
+        width: Board width in cells
+        height: Board height in cells
+        size: Cells per game (height * width), also the padding index
+        auto_reset: Whether step() resets finished games
+        rng: Random generator for placement
+    """
+
+    def __init__(
+        self,
+        num_games: int,
+        width: int = DEFAULT_BOARD_WIDTH,
+        height: int = DEFAULT_BOARD_HEIGHT,
+        num_zombies: int = DEFAULT_NUM_ZOMBIES,
+        num_obstacles: int = DEFAULT_NUM_OBSTACLES,
+        num_shots: int = DEFAULT_NUM_SHOTS,
+        seed: Optional[int] = None,
+        auto_reset: bool = True
+    ):
+        """Initialize N freshly placed games.
+
+        Args:
+            num_games: Number of games to simulate
+            width: Board width in cells
+            height: Board height in cells
+            num_zombies: Zombies per game
+            num_obstacles: Obstacles per game
+            num_shots: Shots Pac-Man starts with
+            seed: Seed for the placement generator
+            auto_reset: Reset games as soon as step() finishes them
+        """
+        self.num_games = num_games
+        self.width = width
+        self.height = height
+        self.size = width * height
+        self.num_zombies_start = num_zombies
+        self.num_obstacles = num_obstacles
+        self.num_shots = num_shots
+        self.auto_reset = auto_reset
+        self.rng = np.random.default_rng(seed)
+
+        self.cells: NDArray = np.full((num_games, self.size + 1), CELL_EMPTY, dtype=GRID_DTYPE)
+        self.cells[:, self.size] = CELL_OBSTACLE
+        self.player: NDArray = np.zeros(num_games, dtype=np.intp)
+        self.zombies: NDArray = np.full((num_games, num_zombies), self.size, dtype=np.intp)
+        self.vaccine: NDArray = np.full(num_games, self.size, dtype=np.intp)
+        self.exit: NDArray = np.zeros(num_games, dtype=np.intp)
+        self.pit: NDArray = np.zeros(num_games, dtype=np.intp)
+
+        self.shoot: NDArray = np.zeros(num_games, dtype=np.int64)
+        self.has_vaccine: NDArray = np.zeros(num_games, dtype=bool)
+        self.num_zombie_cure: NDArray = np.zeros(num_games, dtype=np.int64)
+        self.score: NDArray = np.zeros(num_games, dtype=np.int64)
+        self.steps: NDArray = np.zeros(num_games, dtype=np.int64)
+
+        # Step outcome, refreshed by resolve()
+        self.captured: NDArray = np.zeros(num_games, dtype=bool)
+        self.fell_into_pit: NDArray = np.zeros(num_games, dtype=bool)
+        self.exit_exists: NDArray = np.ones(num_games, dtype=bool)
+        self.num_zombies: NDArray = np.zeros(num_games, dtype=np.int64)
+        self.outcome: NDArray = np.zeros(num_games, dtype=np.int8)
+        self.done: NDArray = np.zeros(num_games, dtype=bool)
+
+        # Neighbour lookups: moves in action-code order, cure order, shots
+        self._moves = _offset_table(height, width, MOVE_DELTAS)
+        self._neighbours = _offset_table(height, width, NEIGHBOUR_OFFSETS)
+        self._shots = _offset_table(height, width, SHOOT_OFFSETS)
+
+        self._games = np.arange(num_games)
+        # Flat view of cells and each game's first index in it, for gathers
+        self._flat_cells = self.cells.reshape(-1)
+        self._game_starts = self._games * (self.size + 1)
+        self.reset()
+
+    @classmethod
+    def from_boards(cls, boards: List['Board'], seed: Optional[int] = None, auto_reset: bool = True) -> 'BatchBoard':
+        """Build a batch holding copies of existing boards.
+
+        The batch is configured like boards[0] (zombie count, obstacles,
+        starting shots), so later resets start games like Board.reset().
+
+        Args:
+            boards: Boards of equal size and configuration to copy
+            seed: Seed for the placement generator (used by later resets)
+            auto_reset: Reset games as soon as step() finishes them
+
+        Returns:
+            BatchBoard whose game i matches boards[i]
+
+        Raises:
+            ValueError: If a board holds more zombies than boards[0] is
+                configured with (e.g. a layout bank placement)
+        """
+        first = boards[0]
+        if any(len(board.zombies_positions) > first.num_zombies for board in boards):
+            raise ValueError(f"boards hold more than the configured {first.num_zombies} zombies")
+        batch = cls(
+            len(boards),
+            width=first.width,
+            height=first.height,
+            num_zombies=first.num_zombies,
+            num_obstacles=len(first.obstacle_positions),
+            num_shots=first.num_shots,
+            seed=seed,
+            auto_reset=auto_reset
+        )
+
+        width = batch.width
+        for game, board in enumerate(boards):
+            batch.cells[game, :batch.size] = board.cells.ravel()
+            batch.player[game] = board.player_position[0] * width + board.player_position[1]
+            batch.zombies[game] = batch.size
+            zombies = sorted(row * width + col for row, col in board.zombies_positions)
+            batch.zombies[game, :len(zombies)] = zombies
+            vaccine = board.vaccine_position
+            batch.vaccine[game] = vaccine[0] * width + vaccine[1] if vaccine else batch.size
+            batch.exit[game] = board.exit_position[0] * width + board.exit_position[1]
+            batch.pit[game] = board.pit_position[0] * width + board.pit_position[1]
+            batch.shoot[game] = board.shoot
+            batch.has_vaccine[game] = board.has_vaccine
+            batch.num_zombie_cure[game] = board.num_zombie_cure
+            batch.score[game] = board.score
+        batch.steps[:] = 0
+        # Drop the outcomes of the placeholder games placed by cls()
+        batch.done[:] = False
+        live = np.ones(batch.num_games, dtype=bool)
+        batch._update_status(live)
+        batch._record_outcome(live)
+        return batch
+
+    @property
+    def grids(self) -> NDArray:
+        """(N, height, width) view of the cell codes."""
+        return self.cells[:, :self.size].reshape(self.num_games, self.height, self.width)
+
+    # =========================================================================
+    # PLACEMENT
+    # =========================================================================
+
+    def reset(self, games: Optional[NDArray] = None) -> None:
+        """Start new games in the given slots and resolve their first state.
+
+        Like a Board episode's first is_game_over(), the initial state is
+        resolved, so a game that starts with a zombie next to Pac-Man is
+        done (captured) before its first move.
+
+        Args:
+            games: Indices of games to reset (all games if None)
+        """
+        if games is None:
+            games = self._games
+        count = len(games)
+        if count == 0:
+            return
+
+        num_zombies = self.zombies.shape[1]
+        picks = self._draw_layouts(count)
+        player = picks[:, 0]
+        zombies = np.sort(picks[:, 1:1 + num_zombies], axis=1)
+        obstacles = picks[:, 1 + num_zombies:1 + num_zombies + self.num_obstacles]
+        vaccine, exit_cell, pit = picks[:, -3], picks[:, -2], picks[:, -1]
+
+        self.cells[games, :self.size] = CELL_EMPTY
+        rows = games[:, None]
+        self.cells[rows, obstacles] = CELL_OBSTACLE
+        self.cells[rows, zombies] = CELL_ZOMBIE
+        self.cells[games, player] = CELL_PLAYER
+        self.cells[games, vaccine] = CELL_VACCINE
+        self.cells[games, exit_cell] = CELL_EXIT
+        self.cells[games, pit] = CELL_PIT
+
+        self.player[games] = player
+        self.zombies[games] = zombies
+        self.vaccine[games] = vaccine
+        self.exit[games] = exit_cell
+        self.pit[games] = pit
+        self.shoot[games] = self.num_shots
+        self.has_vaccine[games] = False
+        self.num_zombie_cure[games] = 0
+        self.score[games] = 0
+        self.steps[games] = 0
+
+        # Resolve the initial state, as resolve() would: a fresh game has no
+        # zombie on the pit and no vaccine in hand, so only a capture can
+        # end it, and the rule pass can be skipped
+        captured = (self.cells[rows, self._neighbours[player]] == CELL_ZOMBIE).any(axis=1)
+        self.captured[games] = captured
+        self.fell_into_pit[games] = False
+        self.exit_exists[games] = True
+        self.num_zombies[games] = num_zombies
+        self.outcome[games] = np.where(captured, OUTCOME_CAPTURED, OUTCOME_NONE)
+        self.done[games] = captured
+
+    def _draw_layouts(self, count: int) -> NDArray:
+        """Draw connected layouts, redrawing only the rejected ones.
+
+        Each round draws a few more layouts than are still missing, so a
+        typical reset needs a single round even though some are rejected.
+
+        Args:
+            count: Number of layouts
+
+        Returns:
+            (count, entities) distinct flat cells per layout: player,
+            zombies, obstacles, vaccine, exit, pit
+
+        Raises:
+            ValueError: If some layout is still not connected after
+                DEFAULT_MAX_ATTEMPTS draws
+        """
+        num_entities = 1 + self.zombies.shape[1] + self.num_obstacles + 3
+        picks = np.empty((count, num_entities), dtype=np.intp)
+        pending = np.arange(count)
+        for _ in range(DEFAULT_MAX_ATTEMPTS):
+            draws = len(pending) + len(pending) // 8 + 2
+            cells = np.broadcast_to(np.arange(self.size), (draws, self.size))
+            drawn = self.rng.permuted(cells, axis=1)[:, :num_entities]
+            connected = self._connected(drawn)
+            accepted = drawn[connected][:len(pending)]
+            placement_stats.accepted += int(connected.sum())
+            placement_stats.rejected += draws - int(connected.sum())
+            picks[pending[:len(accepted)]] = accepted
+            pending = pending[len(accepted):]
+            if not len(pending):
+                return picks
+        raise ValueError(
+            f"No connected layout found in {DEFAULT_MAX_ATTEMPTS} attempts "
+            f"({self.num_obstacles} obstacles on a {self.height}x{self.width} board)"
+        )
+
+    def _connected(self, layouts: NDArray) -> NDArray:
+        """Vectorized core.placement.is_connected for flat layouts.
+
+        Flood fills every layout at once from Pac-Man, one move per pass,
+        until no layout reaches a new cell. Each layout is a flat row of
+        its grid with a closed one-cell border, so the four moves are the
+        row shifted by 1 and by the padded width. The rows are filled as one
+        contiguous array: a shift that crosses into a neighbouring row only
+        lands on border cells, which are never open.
+
+        Args:
+            layouts: (n, entities) flat cells as drawn by _draw_layouts()
+
+        Returns:
+            (n,) bool mask of layouts where every cell other than obstacles,
+            pit and exit is reachable and the exit borders a reachable cell
+        """
+        count = len(layouts)
+        rows = np.arange(count)[:, None]
+        stride = self.width + 2
+        # Flat cell -> cell of the bordered grid
+        cell_rows, cell_cols = np.divmod(layouts, self.width)
+        bordered = (cell_rows + 1) * stride + cell_cols + 1
+        first_obstacle = 1 + self.zombies.shape[1]
+
+        open_cells = np.zeros((count, (self.height + 2) * stride), dtype=bool)
+        open_cells.reshape(count, self.height + 2, stride)[:, 1:-1, 1:-1] = True
+        open_cells[rows, bordered[:, first_obstacle:first_obstacle + self.num_obstacles]] = False
+        open_cells[rows, bordered[:, -2:]] = False
+
+        start = np.zeros_like(open_cells)
+        start[rows[:, 0], bordered[:, 0]] = True
+        open_cells, reached, grown = open_cells.ravel(), start.ravel(), np.empty(start.size, dtype=bool)
+        while True:
+            # Four passes per convergence check: extra passes on a finished
+            # fill are cheaper than comparing after every one
+            for _ in range(4):
+                np.copyto(grown, reached)
+                grown[1:] |= reached[:-1]
+                grown[:-1] |= reached[1:]
+                grown[stride:] |= reached[:-stride]
+                grown[:-stride] |= reached[stride:]
+                grown &= open_cells
+                reached, grown = grown, reached
+            if np.array_equal(grown, reached):
+                break
+        reached = reached.reshape(count, -1)
+
+        # Distinct cells: everything but the obstacles, pit and exit is open
+        filled = reached.sum(axis=1) == self.size - self.num_obstacles - 2
+        exit_cell = bordered[:, -2:-1]
+        exit_neighbours = exit_cell + np.array([-stride, stride, -1, 1])
+        return filled & reached[rows, exit_neighbours].any(axis=1)
+
+    def _sample(self, games: NDArray, allowed: NDArray) -> NDArray:
+        """Pick one allowed cell per game, uniformly at random.
+
+        Args:
+            games: Game indices (one per row of allowed)
+            allowed: (len(games), size) mask of acceptable cells
+
+        Returns:
+            Flat cell index per game
+        """
+        keys = self.rng.random(allowed.shape)
+        keys[~allowed] = -1.0
+        return np.argmax(keys, axis=1)
+
+    # =========================================================================
+    # HELPERS
+    # =========================================================================
+
+    def _remove_zombies(self, games: NDArray, positions: NDArray) -> None:
+        """Drop zombies at the given cells from the zombie arrays (not the cells)."""
+        if len(games) == 0:
+            return
+        rows = self.zombies[games]
+        rows[rows == positions[:, None]] = self.size
+        rows.sort(axis=1)
+        self.zombies[games] = rows
+
+    def _lookup(self, cells: NDArray) -> NDArray:
+        """Gather cell codes, one leading row of cells per game.
+
+        Equivalent to ``self.cells[games, cells]`` with games broadcast
+        along the leading axis, as one flat gather.
+
+        Args:
+            cells: (N, ...) flat cells
+
+        Returns:
+            Cell codes shaped like cells
+        """
+        starts = self._game_starts.reshape((-1,) + (1,) * (cells.ndim - 1))
+        return self._flat_cells[starts + cells]
+
+    def _update_status(self, live: NDArray) -> NDArray:
+        """Recompute the status arrays of the given games without resolving rules.
+
+        Args:
+            live: (N,) bool mask of games to update
+
+        Returns:
+            (N, 8) mask of zombies around Pac-Man, in cure order
+        """
+        adjacent = self._lookup(self._neighbours[self.player]) == CELL_ZOMBIE
+        self.captured = np.where(live, adjacent.any(axis=1) & ~self.has_vaccine, self.captured)
+        self.fell_into_pit = np.where(live, self._lookup(self.pit) == CELL_PLAYER, self.fell_into_pit)
+        self.exit_exists = np.where(live, self._lookup(self.exit) == CELL_EXIT, self.exit_exists)
+        self.num_zombies = np.where(live, (self.zombies < self.size).sum(axis=1), self.num_zombies)
+        return adjacent
+
+    # =========================================================================
+    # LEGAL ACTIONS
+    # =========================================================================
+
+    def legal_player_actions(self) -> NDArray:
+        """Legal Pac-Man actions of every game (see Board.get_possible_action).
+
+        Returns:
+            (N, 5) bool mask indexed by batch action code
+        """
+        zombies_left = (self.zombies < self.size).any(axis=1)
+        legal = np.empty((self.num_games, len(BATCH_ACTIONS)), dtype=bool)
+
+        target = self._lookup(self._moves[self.player])
+        legal[:, :ACTION_CODE_SHOOT] = (target != CELL_OBSTACLE) & ~(zombies_left[:, None] & (target == CELL_EXIT))
+
+        in_range = (self._lookup(self._shots[self.player]) == CELL_ZOMBIE).any(axis=1)
+        legal[:, ACTION_CODE_SHOOT] = zombies_left & (self.shoot > 0) & in_range
+
+        return legal
+
+    def legal_zombie_actions(self) -> NDArray:
+        """Legal moves of every zombie (see Board.get_possible_action_zombie).
+
+        Returns:
+            (N, max_zombies, 4) bool mask indexed by move code, aligned with
+            the zombies array
+        """
+        # Zombies off the board sit on the padding cell, whose moves all
+        # lead back to it, and it reads as an obstacle
+        target = self._lookup(self._moves[self.zombies])
+        return ~_ZOMBIE_BLOCKED[target]
+
+    # =========================================================================
+    # RULES
+    # =========================================================================
+
+    def player_action(self, actions: NDArray) -> None:
+        """Apply one Pac-Man action per game (see Board.player_action).
+
+        Args:
+            actions: (N,) batch action codes, NO_ACTION to skip a game;
+                done games are skipped
+        """
+        size = self.size
+        live = ~self.done
+
+        moving = (actions >= 0) & (actions < ACTION_CODE_SHOOT) & live
+        if moving.any():
+            games = self._games[moving]
+            codes = actions[moving]
+            position = self.player[games]
+            target = self._moves[position, codes]
+            entered = self.cells[games, target]
+            free = entered != CELL_OBSTACLE
+            games, position, target, entered = games[free], position[free], target[free], entered[free]
+
+            # Entering a zombie or vaccine cell removes it
+            eaten = entered == CELL_ZOMBIE
+            self._remove_zombies(games[eaten], target[eaten])
+            self.vaccine[games[entered == CELL_VACCINE]] = size
+
+            self.cells[games, position] = CELL_EMPTY
+            self.cells[games, target] = CELL_PLAYER
+            self.player[games] = target
+
+        shooting = (actions == ACTION_CODE_SHOOT) & live
+        if shooting.any():
+            games = self._games[shooting]
+            position = self.player[games]
+            for index in range(self._shots.shape[1]):
+                target = self._shots[position, index]
+                hit = (self.cells[games, target] == CELL_ZOMBIE) & (self.shoot[games] > 0)
+                hit_games, hit_target = games[hit], target[hit]
+                self.cells[hit_games, hit_target] = CELL_EMPTY
+                self._remove_zombies(hit_games, hit_target)
+                self.shoot[hit_games] -= 1
+
+    def zombies_action(self, actions: NDArray) -> None:
+        """Apply one move per zombie (see Board.zombies_action).
+
+        Zombies move one rank at a time in row-major order, so within a
+        game an earlier zombie's move is visible to later ones, as in Board.
+
+        Args:
+            actions: (N, max_zombies) move codes aligned with the zombies
+                array, NO_ACTION to keep a zombie in place; zombies of done
+                games stay in place
+        """
+        size = self.size
+        live = ~self.done
+        for rank in range(self.zombies.shape[1]):
+            position = self.zombies[:, rank]
+            codes = actions[:, rank]
+            games = np.flatnonzero((position < size) & (codes >= 0) & live)
+            if not len(games):
+                continue
+            position = position[games]
+            target = self._moves[position, codes[games]]
+            starts = self._game_starts[games]
+            entered = self._flat_cells[starts + target]
+            free = (entered == CELL_EMPTY) | (entered == CELL_PIT)
+            games, starts, position, target = games[free], starts[free], position[free], target[free]
+
+            self._flat_cells[starts + position] = CELL_EMPTY
+            self._flat_cells[starts + target] = CELL_ZOMBIE
+            self.zombies[games, rank] = target
+
+        self.zombies.sort(axis=1)
+
+    def _record_outcome(self, live: NDArray) -> None:
+        """Set the outcome of the given games from their status and mark finished ones done.
+
+        Args:
+            live: (N,) bool mask of games to update
+        """
+        outcome = np.full(self.num_games, OUTCOME_NONE, dtype=np.int8)
+        outcome[~self.exit_exists & (self.num_zombies == 0)] = OUTCOME_WIN
+        outcome[self.fell_into_pit] = OUTCOME_PIT
+        outcome[self.captured] = OUTCOME_CAPTURED
+        self.outcome[live] = outcome[live]
+        self.done |= self.outcome != OUTCOME_NONE
+
+    def resolve(self) -> NDArray:
+        """Resolve the turn for every game (see Board.is_game_over).
+
+        Applies the rules in Board order: pit respawn, vaccine pickup, cure,
+        then capture and pit checks, and refreshes the status arrays and
+        outcome. Games that finish are marked done; games already done keep
+        their state and outcome.
+
+        Returns:
+            (N,) bool mask of games Pac-Man has lost
+        """
+        games = self._games
+        size = self.size
+        live = ~self.done
+
+        # A zombie on the pit is respawned on a random free cell
+        in_pit = (self._lookup(self.pit) == CELL_ZOMBIE) & live
+        if in_pit.any():
+            fallen = games[in_pit]
+            pit = self.pit[fallen]
+            self.cells[fallen, pit] = CELL_PIT
+            self._remove_zombies(fallen, pit)
+            allowed = self.cells[fallen, :size] == CELL_EMPTY
+            allowed[np.arange(len(fallen)), self.exit[fallen]] = False
+            respawn = self._sample(fallen, allowed)
+            self.cells[fallen, respawn] = CELL_ZOMBIE
+            self.zombies[fallen, -1] = respawn
+            self.zombies[fallen] = np.sort(self.zombies[fallen], axis=1)
+
+        # Pac-Man holds the vaccine once none is left on the board
+        self.has_vaccine = np.where(live, self.vaccine == size, self.has_vaccine)
+
+        # Cure the first adjacent zombie if Pac-Man holds the vaccine
+        adjacent = self._update_status(live)
+        cure = self.has_vaccine & adjacent.any(axis=1) & live
+        if cure.any():
+            curing = games[cure]
+            first = np.argmax(adjacent[cure], axis=1)
+            zombie = self._neighbours[self.player[curing], first]
+            self.cells[curing, zombie] = CELL_EMPTY
+            self._remove_zombies(curing, zombie)
+            self.score[curing] += 10
+            self.has_vaccine[curing] = False
+            self.num_zombie_cure[curing] += 1
+
+            restock = curing[self.num_zombie_cure[curing] < VACCINE_RESPAWN_LIMIT]
+            if len(restock):
+                vaccine = self._sample(restock, self.cells[restock, :size] == CELL_EMPTY)
+                self.cells[restock, vaccine] = CELL_VACCINE
+                self.vaccine[restock] = vaccine
+
+            # The rest of the neighbourhood still decides capture
+            self.captured[curing] = adjacent[cure].sum(axis=1) > 1
+            self.num_zombies[curing] -= 1
+
+        self._record_outcome(live)
+        return self.captured | self.fell_into_pit
+
+    def step(
+        self,
+        player_actions: NDArray,
+        zombie_policy: Optional[Callable[['BatchBoard'], NDArray]] = None
+    ) -> NDArray:
+        """Play one turn in every game: Pac-Man, then zombies, then rules.
+
+        Zombies decide after Pac-Man has moved, as in PacmanTrainer and
+        play.py, so their actions come from a policy called on the batch.
+
+        Args:
+            player_actions: (N,) batch action codes
+            zombie_policy: Callable returning (N, max_zombies) move codes
+                for the current state (uniformly random legal moves if None)
+
+        Returns:
+            (N,) OUTCOME_* code per game; games with an outcome other than
+            OUTCOME_NONE have been reset if auto_reset is set, and are
+            otherwise done, repeating their outcome until reset(). A game
+            that was already done when the step began (e.g. captured in
+            its initial state) reports its outcome without moving.
+        """
+        self.player_action(player_actions)
+        if zombie_policy is None:
+            zombie_actions = self.random_zombie_actions()
+        else:
+            zombie_actions = zombie_policy(self)
+        self.zombies_action(zombie_actions)
+        live = ~self.done
+        self.resolve()
+        self.steps[live] += 1
+
+        outcome = self.outcome.copy()
+        if self.auto_reset:
+            finished = self._games[outcome != OUTCOME_NONE]
+            self.reset(finished)
+
+        return outcome
+
+    def random_player_actions(self) -> NDArray:
+        """Draw a uniformly random legal Pac-Man action per game.
+
+        Returns:
+            (N,) batch action codes (NO_ACTION where nothing is legal)
+        """
+        return _random_choice(self.rng, self.legal_player_actions())
+
+    def random_zombie_actions(self) -> NDArray:
+        """Draw a uniformly random legal move per zombie.
+
+        Returns:
+            (N, max_zombies) move codes (NO_ACTION where nothing is legal)
+        """
+        return _random_choice(self.rng, self.legal_zombie_actions())
+
+
+@lru_cache(maxsize=None)
+def _choice_table(width: int) -> Tuple[NDArray, NDArray, NDArray]:
+    """Set bits of every mask of `width` (at most 8) bits.
+
+    Returns:
+        (bits, choices, counts): bits are the uint8 bit values, choices is
+        the flattened (2 ** width, width) table whose entry [mask, k] is
+        the k-th set bit of mask (NO_ACTION for mask 0), and counts[mask]
+        is the number of set bits
+    """
+    choices = np.full((1 << width, width), NO_ACTION, dtype=np.intp)
+    counts = np.zeros(1 << width, dtype=np.intp)
+    for mask in range(1 << width):
+        set_bits = [bit for bit in range(width) if mask >> bit & 1]
+        choices[mask, :len(set_bits)] = set_bits
+        counts[mask] = len(set_bits)
+    return (1 << np.arange(width)).astype(np.uint8), choices.ravel(), counts
+
+
+def _random_choice(rng: np.random.Generator, legal: NDArray) -> NDArray:
+    """Pick a random True index along the last axis (NO_ACTION if none).
+
+    Each row of legal is packed into a bit mask, and one uniform draw per
+    row indexes that mask's list of set bits.
+    """
+    width = legal.shape[-1]
+    bits, choices, counts = _choice_table(width)
+    masks = (legal.view(np.uint8) @ bits).astype(np.intp)
+    picks = (rng.random(masks.shape) * counts[masks]).astype(np.intp)
+    return choices[masks * width + picks]
@@ -1,745 +1,1138 @@
-"""Game board implementation.
-
-This module contains the Board class which manages the game state, enforces rules,
-and provides methods for agent interaction. The board is represented as a 2D grid
-where each cell can contain game entities.
-
-IMPORTANT: This class contains game logic that is integral to the learning algorithm.
-Feature extraction methods are included here and should be moved to agents/features.py
-in a future refactoring phase.
-"""
-
-import copy
-import math
-import random
-from typing import List, Optional, Tuple
-
-import numpy as np
-from numpy.typing import NDArray
-
-from .constants import *
-
-
-class Board:
-    """Game board managing state and rules.
-
-    The board is represented as a 2D grid where each cell can contain:
-    - None (empty cell)
-    - "A" (Pac-Man player)
-    - "Z" (Zombie)
-    - "O" (Obstacle)
-    - "V" (Vaccine)
-    - "E" (Exit)
-    - "P" (Pit)
-
-    The board handles:
-    - Entity placement and movement
-    - Game rule enforcement (win/loss conditions)
-    - Feature extraction for learning agents
-    - State successor generation for planning
-    """
-
-    def __init__(
-        self,
-        width: int = DEFAULT_BOARD_WIDTH,
-        height: int = DEFAULT_BOARD_HEIGHT,
-        num_zombies: int = DEFAULT_NUM_ZOMBIES,
-        num_obstacles: int = DEFAULT_NUM_OBSTACLES,
-        num_vaccines: int = DEFAULT_NUM_VACCINES,
-        num_shots: int = DEFAULT_NUM_SHOTS
-    ):
-        """Initialize board with configurable dimensions and entity counts.
-
-        Args:
-            width: Board width in cells
-            height: Board height in cells
-            num_zombies: Number of zombies to place
-            num_obstacles: Number of obstacles to place
-            num_vaccines: Total vaccines available in game
-            num_shots: Number of shots Pac-Man starts with
-        """
-        self.width = width
-        self.height = height
-        self.grid: List[List[Optional[str]]] = [[None for _ in range(self.width)] for _ in range(self.height)]
-
-        # Entity positions
-        self.player_position: Optional[Tuple[int, int]] = None
-        self.zombies_positions: List[Optional[Tuple[int, int]]] = [None for _ in range(num_zombies)]
-        self.obstacle_positions: List[Optional[Tuple[int, int]]] = [None for _ in range(num_obstacles)]
-        self.vaccine_position: Optional[Tuple[int, int]] = None
-        self.exit_position: Optional[Tuple[int, int]] = None
-        self.pit_position: Optional[Tuple[int, int]] = None
-
-        # Game state
-        self.score: int = 0
-        self.num_zombie_cure: int = 0
-        self.shoot: int = num_shots
-        self.has_vaccine: bool = False
-        self.num_shooted_zombie: int = 0
-        self.num_remain_vaccine: int = num_vaccines
-        self.play_pickup: bool = True  # Sound flag for UI
-
-        # Initialize grid with random entity placement
-        self.player_position = self.generate_random_position()
-        self.zombies_positions = [self.generate_random_position() for _ in range(num_zombies)]
-        self.obstacle_positions = [self.generate_random_position() for _ in range(num_obstacles)]
-        self.vaccine_position = self.generate_random_position()
-        self.exit_position = self.generate_random_position()
-        self.pit_position = self.generate_random_position()
-
-        # Place entities on grid
-        self.grid[self.player_position[0]][self.player_position[1]] = SYMBOL_PLAYER
-        for zombie_pos in self.zombies_positions:
-            self.grid[zombie_pos[0]][zombie_pos[1]] = SYMBOL_ZOMBIE
-        for obstacle_pos in self.obstacle_positions:
-            self.grid[obstacle_pos[0]][obstacle_pos[1]] = SYMBOL_OBSTACLE
-        self.grid[self.vaccine_position[0]][self.vaccine_position[1]] = SYMBOL_VACCINE
-        self.grid[self.exit_position[0]][self.exit_position[1]] = SYMBOL_EXIT
-        self.grid[self.pit_position[0]][self.pit_position[1]] = SYMBOL_PIT
-
-        # Movement mapping
-        self.move_dict = MOVE_DELTAS
-
-    def generate_random_position(self) -> Tuple[int, int]:
-        """Generate random unoccupied position on board.
-
-        Recursively tries random positions until finding an empty one.
-
-        Returns:
-            (row, col) tuple of unoccupied position
-        """
-        x = random.randint(0, self.height - 1)
-        y = random.randint(0, self.width - 1)
-        position = (x, y)
-
-        occupied_positions = (
-            [self.player_position] +
-            self.zombies_positions +
-            self.obstacle_positions +
-            [self.vaccine_position, self.exit_position, self.pit_position]
-        )
-
-        if any(pos == position for pos in occupied_positions if pos is not None):
-            return self.generate_random_position()
-
-        return position
-
-    def player_action(self, action: str) -> None:
-        """Execute Pac-Man's action on the board.
-
-        Moves Pac-Man or shoots zombies based on action. Does not validate
-        action legality - caller should use get_possible_action() first.
-
-        Args:
-            action: One of UP, DOWN, LEFT, RIGHT, SHOOT
-        """
-        if action == MOVE_UP:
-            if self.player_position[0] > 0 and self.grid[self.player_position[0]-1][self.player_position[1]] != SYMBOL_OBSTACLE:
-                self.grid[self.player_position[0]][self.player_position[1]] = None
-                self.player_position = (self.player_position[0]-1, self.player_position[1])
-                self.grid[self.player_position[0]][self.player_position[1]] = SYMBOL_PLAYER
-
-        elif action == MOVE_DOWN:
-            if self.player_position[0] < self.height-1 and self.grid[self.player_position[0]+1][self.player_position[1]] != SYMBOL_OBSTACLE:
-                self.grid[self.player_position[0]][self.player_position[1]] = None
-                self.player_position = (self.player_position[0]+1, self.player_position[1])
-                self.grid[self.player_position[0]][self.player_position[1]] = SYMBOL_PLAYER
-
-        elif action == MOVE_LEFT:
-            if self.player_position[1] > 0 and self.grid[self.player_position[0]][self.player_position[1]-1] != SYMBOL_OBSTACLE:
-                self.grid[self.player_position[0]][self.player_position[1]] = None
-                self.player_position = (self.player_position[0], self.player_position[1]-1)
-                self.grid[self.player_position[0]][self.player_position[1]] = SYMBOL_PLAYER
-
-        elif action == MOVE_RIGHT:
-            if self.player_position[1] < self.width-1 and self.grid[self.player_position[0]][self.player_position[1]+1] != SYMBOL_OBSTACLE:
-                self.grid[self.player_position[0]][self.player_position[1]] = None
-                self.player_position = (self.player_position[0], self.player_position[1]+1)
-                self.grid[self.player_position[0]][self.player_position[1]] = SYMBOL_PLAYER
-
-        elif action == ACTION_SHOOT:
-            # Shoot zombies in straight lines within 2 cells
-            for i in range(self.height):
-                for j in range(self.width):
-                    if i-2 >= 0:
-                        if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i-2][j] == SYMBOL_ZOMBIE and self.shoot != 0:
-                            self.grid[i-2][j] = None
-                            self.shoot -= 1
-                    if i+2 < self.height:
-                        if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i+2][j] == SYMBOL_ZOMBIE and self.shoot != 0:
-                            self.grid[i+2][j] = None
-                            self.shoot -= 1
-                    if j-2 >= 0:
-                        if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i][j-2] == SYMBOL_ZOMBIE and self.shoot != 0:
-                            self.grid[i][j-2] = None
-                            self.shoot -= 1
-                    if j+2 < self.width:
-                        if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i][j+2] == SYMBOL_ZOMBIE and self.shoot != 0:
-                            self.grid[i][j+2] = None
-                            self.shoot -= 1
-
-    def zombies_action(self, best_actions: List[Tuple[int, int, str]]) -> None:
-        """Execute multiple zombies' actions on the board.
-
-        Args:
-            best_actions: List of (row, col, action) tuples for each zombie
-        """
-        for acts in best_actions:
-            zombies_position = acts[0], acts[1]
-            action = acts[2]
-
-            if action == MOVE_UP:
-                if zombies_position[0] > 0 and (self.grid[zombies_position[0]-1][zombies_position[1]] == None or self.grid[zombies_position[0]-1][zombies_position[1]] == SYMBOL_PIT):
-                    self.grid[zombies_position[0]][zombies_position[1]] = None
-                    self.grid[zombies_position[0]-1][zombies_position[1]] = SYMBOL_ZOMBIE
-
-            elif action == MOVE_DOWN:
-                if zombies_position[0] < self.height-1 and (self.grid[zombies_position[0]+1][zombies_position[1]] == None or self.grid[zombies_position[0]+1][zombies_position[1]] == SYMBOL_PIT):
-                    self.grid[zombies_position[0]][zombies_position[1]] = None
-                    self.grid[zombies_position[0]+1][zombies_position[1]] = SYMBOL_ZOMBIE
-
-            elif action == MOVE_LEFT:
-                if zombies_position[1] > 0 and (self.grid[zombies_position[0]][zombies_position[1]-1] == None or self.grid[zombies_position[0]][zombies_position[1]-1] == SYMBOL_PIT):
-                    self.grid[zombies_position[0]][zombies_position[1]] = None
-                    self.grid[zombies_position[0]][zombies_position[1]-1] = SYMBOL_ZOMBIE
-
-            elif action == MOVE_RIGHT:
-                if zombies_position[1] < self.width-1 and (self.grid[zombies_position[0]][zombies_position[1]+1] == None or self.grid[zombies_position[0]][zombies_position[1]+1] == SYMBOL_PIT):
-                    self.grid[zombies_position[0]][zombies_position[1]] = None
-                    self.grid[zombies_position[0]][zombies_position[1]+1] = SYMBOL_ZOMBIE
-
-    def use_vaccine(self) -> None:
-        """Update has_vaccine flag based on whether vaccine still exists on board."""
-        self.has_vaccine = True
-        for i in range(self.height):
-            for j in range(self.width):
-                if self.grid[i][j] == SYMBOL_VACCINE:
-                    self.has_vaccine = False
-
-    def can_shoot(self) -> bool:
-        """Check if Pac-Man can shoot a zombie.
-
-        Returns:
-            True if there's a zombie within shooting range in a straight line
-        """
-        for i in range(self.height):
-            for j in range(self.width):
-                if i-2 >= 0:
-                    if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i-2][j] == SYMBOL_ZOMBIE and self.shoot != 0:
-                        return True
-                if i+2 < self.height:
-                    if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i+2][j] == SYMBOL_ZOMBIE and self.shoot != 0:
-                        return True
-                if j-2 >= 0:
-                    if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i][j-2] == SYMBOL_ZOMBIE and self.shoot != 0:
-                        return True
-                if j+2 < self.width:
-                    if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i][j+2] == SYMBOL_ZOMBIE and self.shoot != 0:
-                        return True
-        return False
-
-    def is_game_over(self) -> bool:
-        """Check if game has ended (win or loss).
-
-        Returns:
-            True if game is over, False otherwise
-        """
-        self.zombie_fell_into_pit()
-        self.use_vaccine()
-        self.player_cure_zombie()
-
-        if self.player_captured_by_zombies():
-            return True
-
-        if self.player_fell_into_pit():
-            return True
-
-        return False
-
-    def exit_exist(self) -> bool:
-        """Check if exit still exists on board.
-
-        Returns:
-            True if exit exists, False if Pac-Man reached it
-        """
-        for i in range(self.height):
-            for j in range(self.width):
-                if self.grid[i][j] == SYMBOL_EXIT:
-                    return True
-        return False
-
-    def put_vaccine(self) -> None:
-        """Spawn a new vaccine at random empty position."""
-        while True:
-            row = random.randint(0, self.height-1)
-            col = random.randint(0, self.width-1)
-            if self.grid[row][col] == None:
-                self.grid[row][col] = SYMBOL_VACCINE
-                self.play_pickup = True
-                break
-
-    def player_cure_zombie(self) -> bool:
-        """Check and execute zombie curing if Pac-Man with vaccine is adjacent.
-
-        Returns:
-            True if a zombie was cured, False otherwise
-        """
-        for i in range(self.height):
-            for j in range(self.width):
-                # Check all 8 adjacent positions
-                if i-1 >= 0:
-                    if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i-1][j] == SYMBOL_ZOMBIE and self.has_vaccine:
-                        self.grid[i-1][j] = None
-                        self.score += 10
-                        self.has_vaccine = False
-                        self.num_zombie_cure += 1
-                        if self.num_zombie_cure < VACCINE_RESPAWN_LIMIT:
-                            self.put_vaccine()
-                        return True
-
-                if i+1 < self.height:
-                    if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i+1][j] == SYMBOL_ZOMBIE and self.has_vaccine:
-                        self.grid[i+1][j] = None
-                        self.score += 10
-                        self.has_vaccine = False
-                        self.num_zombie_cure += 1
-                        if self.num_zombie_cure < VACCINE_RESPAWN_LIMIT:
-                            self.put_vaccine()
-                        return True
-
-                if j-1 >= 0:
-                    if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i][j-1] == SYMBOL_ZOMBIE and self.has_vaccine:
-                        self.grid[i][j-1] = None
-                        self.score += 10
-                        self.has_vaccine = False
-                        self.num_zombie_cure += 1
-                        if self.num_zombie_cure < VACCINE_RESPAWN_LIMIT:
-                            self.put_vaccine()
-                        return True
-
-                if j+1 < self.width:
-                    if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i][j+1] == SYMBOL_ZOMBIE and self.has_vaccine:
-                        self.grid[i][j+1] = None
-                        self.score += 10
-                        self.has_vaccine = False
-                        self.num_zombie_cure += 1
-                        if self.num_zombie_cure < VACCINE_RESPAWN_LIMIT:
-                            self.put_vaccine()
-                        return True
-
-                # Diagonal positions
-                if i-1 >= 0 and j-1 >= 0:
-                    if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i-1][j-1] == SYMBOL_ZOMBIE and self.has_vaccine:
-                        self.grid[i-1][j-1] = None
-                        self.score += 10
-                        self.has_vaccine = False
-                        self.num_zombie_cure += 1
-                        if self.num_zombie_cure < VACCINE_RESPAWN_LIMIT:
-                            self.put_vaccine()
-                        return True
-
-                if i-1 >= 0 and j+1 < self.width:
-                    if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i-1][j+1] == SYMBOL_ZOMBIE and self.has_vaccine:
-                        self.grid[i-1][j+1] = None
-                        self.score += 10
-                        self.has_vaccine = False
-                        self.num_zombie_cure += 1
-                        if self.num_zombie_cure < VACCINE_RESPAWN_LIMIT:
-                            self.put_vaccine()
-                        return True
-
-                if i+1 < self.height and j-1 >= 0:
-                    if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i+1][j-1] == SYMBOL_ZOMBIE and self.has_vaccine:
-                        self.grid[i+1][j-1] = None
-                        self.score += 10
-                        self.has_vaccine = False
-                        self.num_zombie_cure += 1
-                        if self.num_zombie_cure < VACCINE_RESPAWN_LIMIT:
-                            self.put_vaccine()
-                        return True
-
-                if i+1 < self.height and j+1 < self.width:
-                    if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i+1][j+1] == SYMBOL_ZOMBIE and self.has_vaccine:
-                        self.grid[i+1][j+1] = None
-                        self.score += 10
-                        self.has_vaccine = False
-                        self.num_zombie_cure += 1
-                        if self.num_zombie_cure < VACCINE_RESPAWN_LIMIT:
-                            self.put_vaccine()
-                        return True
-
-        return False
-
-    def player_captured_by_zombies(self) -> bool:
-        """Check if Pac-Man is captured by zombies.
-
-        Returns:
-            True if zombie is adjacent to Pac-Man (and Pac-Man doesn't have vaccine)
-        """
-        for i in range(self.height):
-            for j in range(self.width):
-                # Check all 8 adjacent positions
-                if i-1 >= 0:
-                    if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i-1][j] == SYMBOL_ZOMBIE and not self.has_vaccine:
-                        return True
-                if i+1 < self.height:
-                    if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i+1][j] == SYMBOL_ZOMBIE and not self.has_vaccine:
-                        return True
-                if j-1 >= 0:
-                    if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i][j-1] == SYMBOL_ZOMBIE and not self.has_vaccine:
-                        return True
-                if j+1 < self.width:
-                    if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i][j+1] == SYMBOL_ZOMBIE and not self.has_vaccine:
-                        return True
-                if i-1 >= 0 and j-1 >= 0:
-                    if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i-1][j-1] == SYMBOL_ZOMBIE and not self.has_vaccine:
-                        return True
-                if i-1 >= 0 and j+1 < self.width:
-                    if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i-1][j+1] == SYMBOL_ZOMBIE and not self.has_vaccine:
-                        return True
-                if i+1 < self.height and j-1 >= 0:
-                    if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i+1][j-1] == SYMBOL_ZOMBIE and not self.has_vaccine:
-                        return True
-                if i+1 < self.height and j+1 < self.width:
-                    if self.grid[i][j] == SYMBOL_PLAYER and self.grid[i+1][j+1] == SYMBOL_ZOMBIE and not self.has_vaccine:
-                        return True
-
-        return False
-
-    def zombie_captured_player(self) -> bool:
-        """Alias for player_captured_by_zombies for zombie perspective.
-
-        Returns:
-            True if zombie captured Pac-Man
-        """
-        return self.player_captured_by_zombies()
-
-    def player_fell_into_pit(self) -> bool:
-        """Check if Pac-Man fell into pit.
-
-        Returns:
-            True if Pac-Man is on pit position
-        """
-        for i in range(self.height):
-            for j in range(self.width):
-                if self.grid[i][j] == SYMBOL_PIT:
-                    return False
-        if self.grid[self.pit_position[0]][self.pit_position[1]] == SYMBOL_PLAYER:
-            return True
-        return False
-
-    def zombie_fell_into_pit(self) -> bool:
-        """Check and handle zombie falling into pit.
-
-        If zombie fell into pit, respawn it at random location.
-
-        Returns:
-            True if a zombie fell into pit (and was respawned)
-        """
-        for i in range(self.height):
-            for j in range(self.width):
-                if self.grid[i][j] == SYMBOL_PIT:
-                    return False
-        if self.grid[self.pit_position[0]][self.pit_position[1]] == SYMBOL_ZOMBIE:
-            self.grid[self.pit_position[0]][self.pit_position[1]] = SYMBOL_PIT
-            self.zombies_positions = [self.generate_random_position()]
-            self.grid[self.zombies_positions[0][0]][self.zombies_positions[0][1]] = SYMBOL_ZOMBIE
-            return True
-        return False
-
-    def find_zombies_number(self) -> int:
-        """Count number of zombies currently on board.
-
-        Returns:
-            Number of zombies
-        """
-        num = 0
-        for i in range(self.height):
-            for j in range(self.width):
-                if self.grid[i][j] == SYMBOL_ZOMBIE:
-                    num += 1
-        return num
-
-    def get_possible_action(self) -> List[str]:
-        """Get list of legal actions for Pac-Man.
-
-        Returns:
-            List of action strings (UP, DOWN, LEFT, RIGHT, SHOOT)
-        """
-        actions = []
-        row, col = 0, 0
-        num_zombies = 0
-
-        for i in range(self.height):
-            for j in range(self.width):
-                if self.grid[i][j] == SYMBOL_PLAYER:
-                    row, col = i, j
-                if self.grid[i][j] == SYMBOL_ZOMBIE:
-                    num_zombies += 1
-
-        if num_zombies > 0:
-            # While zombies exist, cannot move to exit
-            if row > 0 and self.grid[row-1][col] != SYMBOL_OBSTACLE and self.grid[row-1][col] != SYMBOL_EXIT:
-                actions.append(MOVE_UP)
-            if row < self.height-1 and self.grid[row+1][col] != SYMBOL_OBSTACLE and self.grid[row+1][col] != SYMBOL_EXIT:
-                actions.append(MOVE_DOWN)
-            if col > 0 and self.grid[row][col-1] != SYMBOL_OBSTACLE and self.grid[row][col-1] != SYMBOL_EXIT:
-                actions.append(MOVE_LEFT)
-            if col < self.width-1 and self.grid[row][col+1] != SYMBOL_OBSTACLE and self.grid[row][col+1] != SYMBOL_EXIT:
-                actions.append(MOVE_RIGHT)
-            if self.can_shoot():
-                actions.append(ACTION_SHOOT)
-        else:
-            # No zombies, can move to exit
-            if row > 0 and self.grid[row-1][col] != SYMBOL_OBSTACLE:
-                actions.append(MOVE_UP)
-            if row < self.height-1 and self.grid[row+1][col] != SYMBOL_OBSTACLE:
-                actions.append(MOVE_DOWN)
-            if col > 0 and self.grid[row][col-1] != SYMBOL_OBSTACLE:
-                actions.append(MOVE_LEFT)
-            if col < self.width-1 and self.grid[row][col+1] != SYMBOL_OBSTACLE:
-                actions.append(MOVE_RIGHT)
-
-        return actions
-
-    def get_possible_action_zombie(self, row: int, col: int) -> List[str]:
-        """Get list of legal actions for a zombie at given position.
-
-        Args:
-            row: Zombie's row position
-            col: Zombie's column position
-
-        Returns:
-            List of action strings (UP, DOWN, LEFT, RIGHT)
-        """
-        actions = []
-
-        if row > 0 and self.grid[row-1][col] != SYMBOL_OBSTACLE and self.grid[row-1][col] != SYMBOL_VACCINE and self.grid[row-1][col] != SYMBOL_EXIT:
-            actions.append(MOVE_UP)
-        if row < self.height-1 and self.grid[row+1][col] != SYMBOL_OBSTACLE and self.grid[row+1][col] != SYMBOL_VACCINE and self.grid[row+1][col] != SYMBOL_EXIT:
-            actions.append(MOVE_DOWN)
-        if col > 0 and self.grid[row][col-1] != SYMBOL_OBSTACLE and self.grid[row][col-1] != SYMBOL_VACCINE and self.grid[row][col-1] != SYMBOL_EXIT:
-            actions.append(MOVE_LEFT)
-        if col < self.width-1 and self.grid[row][col+1] != SYMBOL_OBSTACLE and self.grid[row][col+1] != SYMBOL_VACCINE and self.grid[row][col+1] != SYMBOL_EXIT:
-            actions.append(MOVE_RIGHT)
-
-        return actions
-
-    def get_successor_state(self, action: str) -> List[List[Optional[str]]]:
-        """Get hypothetical next state if Pac-Man takes given action.
-
-        Used for planning - does not modify actual board state.
-
-        Args:
-            action: Action to simulate
-
-        Returns:
-            Deep copy of grid after action
-        """
-        for i in range(self.height):
-            for j in range(self.width):
-                if self.grid[i][j] == SYMBOL_PLAYER:
-                    player_position = [i, j]
-
-        grid_copy = copy.deepcopy(self.grid)
-
-        if action == ACTION_SHOOT:
-            for i in range(self.height):
-                for j in range(self.width):
-                    if i-2 >= 0:
-                        if grid_copy[i][j] == SYMBOL_PLAYER and grid_copy[i-2][j] == SYMBOL_ZOMBIE and self.shoot != 0:
-                            grid_copy[i-2][j] = None
-                    if i+2 < self.height:
-                        if grid_copy[i][j] == SYMBOL_PLAYER and grid_copy[i+2][j] == SYMBOL_ZOMBIE and self.shoot != 0:
-                            grid_copy[i+2][j] = None
-                    if j-2 >= 0:
-                        if grid_copy[i][j] == SYMBOL_PLAYER and grid_copy[i][j-2] == SYMBOL_ZOMBIE and self.shoot != 0:
-                            grid_copy[i][j-2] = None
-                    if j+2 < self.width:
-                        if grid_copy[i][j] == SYMBOL_PLAYER and grid_copy[i][j+2] == SYMBOL_ZOMBIE and self.shoot != 0:
-                            grid_copy[i][j+2] = None
-            return grid_copy
-        else:
-            grid_copy[player_position[0]][player_position[1]] = None
-            grid_copy[player_position[0]+self.move_dict[action][0]][player_position[1]+self.move_dict[action][1]] = SYMBOL_PLAYER
-            return grid_copy
-
-    def get_successor_state_zombie(self, action: str, row: int, col: int) -> List[List[Optional[str]]]:
-        """Get hypothetical next state if zombie takes given action.
-
-        Used for planning - does not modify actual board state.
-
-        Args:
-            action: Action to simulate
-            row: Zombie's current row
-            col: Zombie's current column
-
-        Returns:
-            Deep copy of grid after action
-        """
-        zombie_position = [row, col]
-        grid_copy = copy.deepcopy(self.grid)
-        grid_copy[zombie_position[0]][zombie_position[1]] = None
-        grid_copy[zombie_position[0]+self.move_dict[action][0]][zombie_position[1]+self.move_dict[action][1]] = SYMBOL_ZOMBIE
-        return grid_copy
-
-    def get_zombies_position(self) -> List[List[int]]:
-        """Get positions of all zombies on board.
-
-        Returns:
-            List of [row, col] positions
-        """
-        zombies_positions = []
-        for i in range(self.height):
-            for j in range(self.width):
-                if self.grid[i][j] == SYMBOL_ZOMBIE:
-                    zombie_position = [i, j]
-                    zombies_positions.append(zombie_position)
-        return zombies_positions
-
-    # =========================================================================
-    # FEATURE EXTRACTION METHODS
-    # =========================================================================
-    # TODO: These should be moved to agents/features.py in future refactoring
-    # They are kept here temporarily to maintain compatibility with existing code
-
-    def extract_features(self, successor_state: List[List[Optional[str]]]) -> NDArray:
-        """Extract 8-dimensional feature vector for Pac-Man agent.
-
-        CRITICAL: This exact formula is integral to learned weights.
-        DO NOT MODIFY without retraining agents.
-
-        Args:
-            successor_state: Hypothetical next state after action
-
-        Returns:
-            8-element numpy array of features
-        """
-        features = []
-
-        player_position = None
-        number_of_zombie = 0
-        distance_from_all_obstacle = []
-        distance_from_vaccines = 0
-        distance_from_all_zombies = []
-        distance_from_pit = 0
-        distance_from_exit = 0
-
-        # Feature multipliers
-        go_to_exit = 0
-        shoot = MULTIPLIER_SHOOT_DEFAULT
-        go_to_vaccine = 1
-        go_to_zombies = 1
-        distance_from_nearest_zombies = 0
-        pit = MULTIPLIER_PIT_DEFAULT
-        has_vaccine = 0
-
-        if self.has_vaccine:
-            has_vaccine = 1
-            go_to_zombies = -1
-            shoot = MULTIPLIER_SHOOT_WITH_VACCINE
-
-        # Find player position
-        for i in range(self.height):
-            for j in range(self.width):
-                if successor_state[i][j] == SYMBOL_PLAYER:
-                    player_position = [i, j]
-
-        # Calculate distances to all entities
-        for i in range(self.height):
-            for j in range(self.width):
-                if successor_state[i][j] == SYMBOL_EXIT:
-                    distance_from_exit = math.dist(player_position, [i, j])
-                if successor_state[i][j] == SYMBOL_ZOMBIE:
-                    number_of_zombie += 1
-                    distance_from_all_zombies.append(math.dist(player_position, [i, j]))
-                if successor_state[i][j] == SYMBOL_OBSTACLE:
-                    distance_from_all_obstacle.append(math.dist(player_position, [i, j]))
-                if successor_state[i][j] == SYMBOL_VACCINE:
-                    distance_from_vaccines = math.dist(player_position, [i, j])
-                if successor_state[i][j] == SYMBOL_PIT:
-                    distance_from_pit = math.dist(player_position, [i, j])
-
-        # Adjust multipliers based on game state
-        if number_of_zombie == 0:
-            go_to_exit = MULTIPLIER_GO_TO_EXIT_ACTIVE
-            distance_from_nearest_zombies = 0
-            go_to_vaccine = 0
-            has_vaccine = 0
-            go_to_zombies = 0
-            pit = MULTIPLIER_PIT_ZOMBIES_CLEARED
-        else:
-            go_to_exit = MULTIPLIER_GO_TO_EXIT_INACTIVE
-            distance_from_nearest_zombies = min(distance_from_all_zombies)
-            go_to_vaccine = 1
-
-        # Build feature vector
-        features.append(go_to_exit * (distance_from_exit / FEATURE_DISTANCE_SCALE))
-        features.append(shoot * number_of_zombie)
-        remain_vaccine = VACCINE_RESPAWN_LIMIT - self.num_zombie_cure
-        features.append(remain_vaccine)
-        features.append(go_to_vaccine * distance_from_vaccines / FEATURE_DISTANCE_SCALE)
-        features.append(go_to_zombies * distance_from_nearest_zombies / FEATURE_DISTANCE_SCALE)
-        features.append(has_vaccine)
-        features.append(min(distance_from_all_obstacle) / FEATURE_DISTANCE_SCALE)
-        features.append(pit * distance_from_pit / FEATURE_DISTANCE_SCALE)
-
-        return np.array(features)
-
-    def extract_features_zombie(self, successor_state: List[List[Optional[str]]], row: int, col: int) -> NDArray:
-        """Extract 3-dimensional feature vector for Zombie agent.
-
-        CRITICAL: This exact formula is integral to learned weights.
-        DO NOT MODIFY without retraining agents.
-
-        Args:
-            successor_state: Hypothetical next state after action
-            row: Zombie's row position in successor state
-            col: Zombie's column position in successor state
-
-        Returns:
-            3-element numpy array of features
-        """
-        features = []
-
-        distance_from_all_obstacle = []
-        distance_from_pit = 0
-        go_to_player = MULTIPLIER_ZOMBIE_CHASE
-        zombie_position = [row, col]
-        distance_from_player = 0
-
-        # Calculate distances
-        for i in range(self.height):
-            for j in range(self.width):
-                if successor_state[i][j] == SYMBOL_PLAYER:
-                    distance_from_player = math.dist(zombie_position, [i, j])
-                if successor_state[i][j] == SYMBOL_OBSTACLE:
-                    distance_from_all_obstacle.append(math.dist(zombie_position, [i, j]))
-                if successor_state[i][j] == SYMBOL_PIT:
-                    distance_from_pit = math.dist(zombie_position, [i, j])
-
-        # Flee if Pac-Man has vaccine
-        if self.has_vaccine:
-            go_to_player = MULTIPLIER_ZOMBIE_FLEE
-
-        # Build feature vector
-        features.append(go_to_player * distance_from_player / FEATURE_DISTANCE_SCALE)
-        features.append(distance_from_pit / FEATURE_DISTANCE_SCALE)
-        features.append(min(distance_from_all_obstacle) / FEATURE_OBSTACLE_SCALE)
-
-        return np.array(features)
-
-
-def print_grid(grid: List[List[Optional[str]]]) -> None:
-    """Print board grid to terminal (for debugging).
-
-    Args:
-        grid: 2D grid to print
-    """
-    print("===============================")
-    for i in range(len(grid)):
-        row = ""
-        for j in range(len(grid[i])):
-            row += grid[i][j] + "|" if grid[i][j] != None else " |"
-        print(row + "|")
-    print("===============================")
+"""Game board implementation.
+
+This module contains the Board class which manages the game state, enforces rules,
+and provides methods for agent interaction. The board is stored as a contiguous
+np.int8 array of cell codes, with a symbol-level view for code that indexes it
+as a 2D grid of entity symbols.
+
+IMPORTANT: This class contains game logic that is integral to the learning algorithm.
+Feature extraction methods are included here and should be moved to agents/features.py
+in a future refactoring phase.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import List, Optional, Set, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .constants import *
+from .distances import CellDistances, StaticFields, cell_distances, static_fields
+from .grid import GRID_DTYPE, GridView, as_cells
+from .layout_bank import LayoutBank, load_layout_bank
+from .placement import Placement, sample_placement
+from .rng import SeedLike, make_rng
+from .rules import (
+    MASK_ACTIONS,
+    SHOOT_BIT,
+    CellTables,
+    cell_tables,
+    step_bit,
+    wall_masks,
+    zombies_among,
+)
+from .zobrist import HAS_VACCINE_KEY, ZobristKeys, cure_key, shoot_key, zobrist_keys
+
+
+def _positions(cells: NDArray, code: int) -> List[Tuple[int, int]]:
+    """List cells holding the given code, in row-major order.
+
+    Args:
+        cells: Cell code array
+        code: Cell code to look for
+
+    Returns:
+        List of (row, col) tuples
+    """
+    return [(row, col) for row, col in np.argwhere(cells == code).tolist()]
+
+
+def _last_position(cells: NDArray, code: int) -> Optional[Tuple[int, int]]:
+    """Return the last cell (row-major order) holding the given code, or None."""
+    positions = _positions(cells, code)
+    return positions[-1] if positions else None
+
+
+@dataclass(frozen=True)
+class BoardStatus:
+    """Outcome of the current position, resolved around Pac-Man's cell.
+
+    Attributes:
+        adjacent_zombies: Zombies in Pac-Man's 8-neighbourhood, in cure order
+        captured: Pac-Man is next to a zombie without holding a vaccine
+        fell_into_pit: Pac-Man stands on the pit
+        exit_exists: Exit is still on the board
+        num_zombies: Number of zombies on the board
+    """
+    adjacent_zombies: Tuple[Tuple[int, int], ...]
+    captured: bool
+    fell_into_pit: bool
+    exit_exists: bool
+    num_zombies: int
+
+    @property
+    def game_over(self) -> bool:
+        """True if Pac-Man has lost (captured or fell into pit)."""
+        return self.captured or self.fell_into_pit
+
+
+class Board:
+    """Game board managing state and rules.
+
+    The board is stored in ``cells``, a (height, width) np.int8 array where
+    each cell holds one of the CELL_* codes. ``grid`` exposes the same array
+    as read-only symbols, where each cell can contain:
+    - None (empty cell)
+    - "A" (Pac-Man player)
+    - "Z" (Zombie)
+    - "O" (Obstacle)
+    - "V" (Vaccine)
+    - "E" (Exit)
+    - "P" (Pit)
+
+    Alongside the cells the board keeps an entity index that every mutation
+    updates, so rule checks never scan the grid:
+    - player_position: Pac-Man's cell
+    - zombies_positions: set of cells holding a zombie
+    - vaccine_position: cell of the vaccine on the board (None if none)
+    - exit_position / pit_position: fixed layout cells; whether the exit or
+      pit is currently visible is a single cell lookup
+
+    The step outcome (capture, pit, exit, zombie count) is cached as a
+    BoardStatus until the next mutation; see status().
+
+    Feature terms that depend only on the layout (nearest obstacle, exit
+    and pit distances) are precomputed for every cell in static_fields and
+    rebuilt only when the layout changes; see refresh_static_fields().
+    Likewise wall_masks holds each cell's 4-bit mask of moves that stay on
+    the board and off obstacles, and the legal-action masks combine it with
+    the exit and vaccine cells; see core.rules.
+
+    New boards draw their layout with core.placement: entities take distinct
+    cells and the layout is redrawn until Pac-Man can reach every open cell
+    and the exit; placement_attempts records how many draws that took.
+    reset() starts a new game on an existing board, reusing its buffers;
+    BoardPool hands out reset boards for episode loops.
+
+    All randomness (layout, zombie respawns, vaccine drops) comes from the
+    board's own random.Random, rng; see core.rng.
+
+    zobrist_hash is a 64-bit hash of the cells, has_vaccine, shoot and
+    num_zombie_cure, updated incrementally by every mutation (including
+    push_*_action()/pop_action()); see core.zobrist.
+
+    The board handles:
+    - Entity placement and movement
+    - Game rule enforcement (win/loss conditions)
+    - Feature extraction for learning agents
+    - State successor generation for planning
+    """
+
+    def __init__(
+        self,
+        width: int = DEFAULT_BOARD_WIDTH,
+        height: int = DEFAULT_BOARD_HEIGHT,
+        num_zombies: int = DEFAULT_NUM_ZOMBIES,
+        num_obstacles: int = DEFAULT_NUM_OBSTACLES,
+        num_vaccines: int = DEFAULT_NUM_VACCINES,
+        num_shots: int = DEFAULT_NUM_SHOTS,
+        placement: Optional[Placement] = None,
+        rng: Optional[random.Random] = None
+    ):
+        """Initialize board with configurable dimensions and entity counts.
+
+        Args:
+            width: Board width in cells
+            height: Board height in cells
+            num_zombies: Number of zombies to place
+            num_obstacles: Number of obstacles to place
+            num_vaccines: Total vaccines available in game
+            num_shots: Number of shots Pac-Man starts with
+            placement: Starting layout to use instead of drawing one; its
+                zombie and obstacle counts override num_zombies/num_obstacles
+            rng: Random stream for the layout, respawns and vaccine drops.
+                If None, a private stream seeded from OS entropy is used.
+        """
+        self.rng: random.Random = rng if rng is not None else make_rng()
+        self.width = width
+        self.height = height
+        self.num_zombies = num_zombies
+        self.num_obstacles = num_obstacles
+        self.num_vaccines = num_vaccines
+        self.num_shots = num_shots
+        self.cells: NDArray = np.zeros((self.height, self.width), dtype=GRID_DTYPE)
+        self._status: Optional[BoardStatus] = None
+
+        # Euclidean distance lookup and neighbourhood tables shared by all
+        # boards of this size
+        self._cell_distances: CellDistances = cell_distances(self.height, self.width)
+        self._tables: CellTables = cell_tables(self.height, self.width)
+        self.static_fields: Optional[StaticFields] = None
+        self.wall_masks: Tuple[int, ...] = ()
+
+        # Zobrist keys shared by all boards of this size; the hash is rebuilt
+        # once placement is done and maintained incrementally afterwards
+        self._zobrist: ZobristKeys = zobrist_keys(self.height, self.width)
+        self.zobrist_hash: int = 0
+
+        # Entity index, filled by reset()
+        self.player_position: Optional[Tuple[int, int]] = None
+        self.zombies_positions: Set[Tuple[int, int]] = set()
+        self.obstacle_positions: List[Tuple[int, int]] = []
+        self.vaccine_position: Optional[Tuple[int, int]] = None
+        self.exit_position: Optional[Tuple[int, int]] = None
+        self.pit_position: Optional[Tuple[int, int]] = None
+        self.placement_attempts: int = 0
+
+        # Movement deltas, indexed by action code
+        self.move_deltas = MOVE_DELTAS
+
+        # Undo records for push_*_action()/pop_action()
+        self._undo_stack: List[List[Tuple[Tuple[int, int], int]]] = []
+
+        self.reset(layout=placement)
+
+    def reset(self, seed: SeedLike = None, layout: Optional[Placement] = None) -> None:
+        """Start a new game on this board, reusing its buffers.
+
+        Clears the cells array, entity index, counters and undo stack in
+        place and places a new layout, so pooled boards can be replayed
+        without allocating a new Board per episode. Zobrist hash and static
+        fields are rebuilt for the new layout.
+
+        Args:
+            seed: If given, restart the board's random stream from this
+                seed (an int or SeedSequence, see core.rng); if None, the
+                current stream continues
+            layout: Layout to place instead of drawing one; its zombie and
+                obstacle counts override the board's
+        """
+        # Game state
+        self.score = 0
+        self._num_zombie_cure = 0
+        self._shoot = self.num_shots
+        self._has_vaccine = False
+        self.num_shooted_zombie = 0
+        self.num_remain_vaccine = self.num_vaccines
+        self.play_pickup = True  # Sound flag for UI
+        self._undo_stack.clear()
+
+        # Initialize grid with a random layout Pac-Man can fully walk
+        if seed is not None:
+            self.rng = make_rng(seed)
+        if layout is None:
+            layout = sample_placement(self.height, self.width, self.num_zombies, self.num_obstacles, rng=self.rng)
+        self.placement_attempts = layout.attempts
+        self.obstacle_positions[:] = layout.obstacles
+        self.exit_position = layout.exit
+        self.pit_position = layout.pit
+
+        # Place entities on an empty grid
+        self.cells.fill(CELL_EMPTY)
+        self.zombies_positions.clear()
+        self.player_position = None
+        self.vaccine_position = None
+        self._set_cell(layout.player, CELL_PLAYER)
+        for zombie_pos in layout.zombies:
+            self._set_cell(zombie_pos, CELL_ZOMBIE)
+        for obstacle_pos in self.obstacle_positions:
+            self._set_cell(obstacle_pos, CELL_OBSTACLE)
+        self._set_cell(layout.vaccine, CELL_VACCINE)
+        self._set_cell(self.exit_position, CELL_EXIT)
+        self._set_cell(self.pit_position, CELL_PIT)
+        self.zobrist_hash = self.compute_zobrist_hash()
+
+        self.refresh_static_fields()
+
+    @classmethod
+    def from_layout(
+        cls,
+        bank: LayoutBank,
+        index: int,
+        num_vaccines: int = DEFAULT_NUM_VACCINES,
+        num_shots: int = DEFAULT_NUM_SHOTS
+    ) -> 'Board':
+        """Create a board from a pre-generated layout.
+
+        Args:
+            bank: Layout bank to read from
+            index: Layout index within the bank
+            num_vaccines: Total vaccines available in game
+            num_shots: Number of shots Pac-Man starts with
+
+        Returns:
+            New board starting from layout `index`
+        """
+        return cls(
+            width=bank.width,
+            height=bank.height,
+            num_vaccines=num_vaccines,
+            num_shots=num_shots,
+            placement=bank.placement(index)
+        )
+
+    def refresh_static_fields(self) -> None:
+        """Rebuild the static feature fields and wall masks if the layout has changed.
+
+        Must be called after obstacle_positions, exit_position or
+        pit_position are reassigned.
+        """
+        layout = (tuple(self.obstacle_positions), self.exit_position, self.pit_position)
+        if self.static_fields is None or self.static_fields.layout != layout:
+            self.static_fields = static_fields(self.height, self.width, *layout)
+            self.wall_masks = wall_masks(self.height, self.width, layout[0])
+
+    @property
+    def has_vaccine(self) -> bool:
+        """Whether Pac-Man currently holds a vaccine."""
+        return self._has_vaccine
+
+    @has_vaccine.setter
+    def has_vaccine(self, value: bool) -> None:
+        if value != self._has_vaccine:
+            self._has_vaccine = value
+            self._status = None
+            self.zobrist_hash ^= HAS_VACCINE_KEY
+
+    @property
+    def shoot(self) -> int:
+        """Shots Pac-Man has left."""
+        return self._shoot
+
+    @shoot.setter
+    def shoot(self, value: int) -> None:
+        self.zobrist_hash ^= shoot_key(self._shoot) ^ shoot_key(value)
+        self._shoot = value
+
+    @property
+    def num_zombie_cure(self) -> int:
+        """Zombies cured so far."""
+        return self._num_zombie_cure
+
+    @num_zombie_cure.setter
+    def num_zombie_cure(self, value: int) -> None:
+        self.zobrist_hash ^= cure_key(self._num_zombie_cure) ^ cure_key(value)
+        self._num_zombie_cure = value
+
+    def compute_zobrist_hash(self) -> int:
+        """Hash the current state from scratch (zobrist_hash must equal this).
+
+        Returns:
+            64-bit Zobrist hash
+        """
+        return self._zobrist.full_hash(self.cells, self._has_vaccine, self._shoot, self._num_zombie_cure)
+
+    @property
+    def grid(self) -> GridView:
+        """Read-only symbol view of the board (``grid[i][j]`` is None or an entity symbol).
+
+        Writes would bypass the entity index, Zobrist hash and cached status,
+        so they raise TypeError; deepcopy the view for a writeable copy.
+        """
+        cells = self.cells.view()
+        cells.flags.writeable = False
+        return GridView(cells)
+
+    def generate_random_position(self) -> Tuple[int, int]:
+        """Generate random unoccupied position on board.
+
+        Tries random positions until finding an empty one. Initial placement
+        uses core.placement instead; this serves respawns on a live board.
+
+        Returns:
+            (row, col) tuple of unoccupied position
+        """
+        while True:
+            position = (self.rng.randint(0, self.height - 1), self.rng.randint(0, self.width - 1))
+            if self.cells.item(position) == CELL_EMPTY:
+                return position
+
+    def _set_cell(self, position: Tuple[int, int], code: int) -> None:
+        """Write a cell code and keep the entity index in sync.
+
+        All board mutations go through here, so the index always matches
+        the cells.
+
+        Args:
+            position: (row, col) of the cell to write
+            code: New CELL_* code
+        """
+        self._status = None
+        old_code = self.cells.item(position)
+        keys = self._zobrist.cells[position[0] * self.width + position[1]]
+        self.zobrist_hash ^= keys[old_code] ^ keys[code]
+        if old_code == CELL_ZOMBIE:
+            self.zombies_positions.discard(position)
+        elif old_code == CELL_VACCINE:
+            self.vaccine_position = None
+
+        self.cells[position] = code
+        if code == CELL_ZOMBIE:
+            self.zombies_positions.add(position)
+        elif code == CELL_PLAYER:
+            self.player_position = position
+        elif code == CELL_VACCINE:
+            self.vaccine_position = position
+
+    def _shoot_targets(self, cells: NDArray, row: int, col: int) -> List[Tuple[int, int]]:
+        """List zombie cells exactly SHOOTING_RANGE away from (row, col) in a straight line.
+
+        Args:
+            cells: Cell code array to inspect
+            row: Shooter's row
+            col: Shooter's column
+
+        Returns:
+            Zombie positions in firing order (up, down, left, right)
+        """
+        return zombies_among(cells, self._tables.shots[row * self.width + col])
+
+    def _move_target(self, position: Tuple[int, int], action: int) -> Optional[Tuple[int, int]]:
+        """Cell a move from position leads to (None if it leaves the board)."""
+        return self._tables.moves[position[0] * self.width + position[1]][action]
+
+    def player_action(self, action: int) -> None:
+        """Execute Pac-Man's action on the board.
+
+        Moves Pac-Man or shoots zombies based on action. Does not validate
+        action legality - caller should use get_possible_action() first.
+
+        Args:
+            action: Action code (UP, DOWN, LEFT, RIGHT or SHOOT)
+        """
+        if 0 <= action < ACTION_SHOOT:
+            target = self._move_target(self.player_position, action)
+            if target is not None and self.cells.item(target) != CELL_OBSTACLE:
+                self._set_cell(self.player_position, CELL_EMPTY)
+                self._set_cell(target, CELL_PLAYER)
+
+        elif action == ACTION_SHOOT:
+            # Shoot zombies in straight lines within 2 cells
+            for target in self._shoot_targets(self.cells, *self.player_position):
+                if self.shoot == 0:
+                    break
+                self._set_cell(target, CELL_EMPTY)
+                self.shoot -= 1
+
+    def zombies_action(self, best_actions: List[Tuple[int, int, Optional[int]]]) -> None:
+        """Execute multiple zombies' actions on the board.
+
+        Args:
+            best_actions: List of (row, col, action) tuples for each zombie,
+                with a move Action code (or None to stay put)
+        """
+        for acts in best_actions:
+            zombies_position = acts[0], acts[1]
+            action = acts[2]
+
+            # Trapped zombies have no action; zombies cannot shoot
+            if action is None or not 0 <= action < ACTION_SHOOT:
+                continue
+            target = self._move_target(zombies_position, action)
+            if target is not None and (self.cells.item(target) == CELL_EMPTY or self.cells.item(target) == CELL_PIT):
+                self._set_cell(zombies_position, CELL_EMPTY)
+                self._set_cell(target, CELL_ZOMBIE)
+
+    def use_vaccine(self) -> None:
+        """Update has_vaccine flag based on whether vaccine still exists on board."""
+        self.has_vaccine = self.vaccine_position is None
+
+    def can_shoot(self) -> bool:
+        """Check if Pac-Man can shoot a zombie.
+
+        Returns:
+            True if there's a zombie within shooting range in a straight line
+        """
+        if self.shoot == 0:
+            return False
+        return len(self._shoot_targets(self.cells, *self.player_position)) > 0
+
+    def status(self) -> BoardStatus:
+        """Get the outcome of the current position.
+
+        Computed in one pass over Pac-Man's neighbourhood plus the pit and
+        exit cells, then cached until the board next changes.
+
+        Returns:
+            BoardStatus for the current cells and vaccine flag
+        """
+        if self._status is None:
+            player = self.player_position
+            adjacent_zombies = zombies_among(self.cells, self._tables.neighbours[player[0] * self.width + player[1]])
+
+            self._status = BoardStatus(
+                adjacent_zombies=tuple(adjacent_zombies),
+                captured=bool(adjacent_zombies) and not self.has_vaccine,
+                fell_into_pit=self.cells.item(self.pit_position) == CELL_PLAYER,
+                exit_exists=self.cells.item(self.exit_position) == CELL_EXIT,
+                num_zombies=len(self.zombies_positions)
+            )
+        return self._status
+
+    def is_game_over(self) -> bool:
+        """Check if game has ended (win or loss).
+
+        Resolves the step in rule order: pit respawn, vaccine pickup, cure,
+        then capture and pit checks. The resulting status stays cached for
+        the predicates called afterwards (exit_exist, find_zombies_number,
+        player_captured_by_zombies, player_fell_into_pit).
+
+        Returns:
+            True if game is over, False otherwise
+        """
+        self.zombie_fell_into_pit()
+        self.use_vaccine()
+
+        status = self.status()
+        if self.has_vaccine and status.adjacent_zombies:
+            self._cure_zombie(status.adjacent_zombies[0])
+            # Curing only removes that zombie and spends the vaccine, so the
+            # rest of the neighbourhood pass still holds
+            remaining = status.adjacent_zombies[1:]
+            status = BoardStatus(
+                adjacent_zombies=remaining,
+                captured=bool(remaining),
+                fell_into_pit=status.fell_into_pit,
+                exit_exists=status.exit_exists,
+                num_zombies=status.num_zombies - 1
+            )
+            self._status = status
+
+        return status.game_over
+
+    def exit_exist(self) -> bool:
+        """Check if exit still exists on board.
+
+        Returns:
+            True if exit exists, False if Pac-Man reached it
+        """
+        return self.status().exit_exists
+
+    def put_vaccine(self) -> None:
+        """Spawn a new vaccine at random empty position."""
+        while True:
+            row = self.rng.randint(0, self.height-1)
+            col = self.rng.randint(0, self.width-1)
+            if self.cells.item(row, col) == CELL_EMPTY:
+                self._set_cell((row, col), CELL_VACCINE)
+                self.play_pickup = True
+                break
+
+    def _cure_zombie(self, zombie: Tuple[int, int]) -> None:
+        """Cure the zombie at the given cell, spending Pac-Man's vaccine.
+
+        Args:
+            zombie: Position of the zombie to cure
+        """
+        self._set_cell(zombie, CELL_EMPTY)
+        self.score += 10
+        self.has_vaccine = False
+        self.num_zombie_cure += 1
+        if self.num_zombie_cure < VACCINE_RESPAWN_LIMIT:
+            self.put_vaccine()
+
+    def player_cure_zombie(self) -> bool:
+        """Check and execute zombie curing if Pac-Man with vaccine is adjacent.
+
+        Returns:
+            True if a zombie was cured, False otherwise
+        """
+        if not self.has_vaccine:
+            return False
+
+        adjacent_zombies = self.status().adjacent_zombies
+        if not adjacent_zombies:
+            return False
+
+        self._cure_zombie(adjacent_zombies[0])
+        return True
+
+    def player_captured_by_zombies(self) -> bool:
+        """Check if Pac-Man is captured by zombies.
+
+        Returns:
+            True if zombie is adjacent to Pac-Man (and Pac-Man doesn't have vaccine)
+        """
+        return self.status().captured
+
+    def zombie_captured_player(self) -> bool:
+        """Alias for player_captured_by_zombies for zombie perspective.
+
+        Returns:
+            True if zombie captured Pac-Man
+        """
+        return self.player_captured_by_zombies()
+
+    def player_fell_into_pit(self) -> bool:
+        """Check if Pac-Man fell into pit.
+
+        Returns:
+            True if Pac-Man is on pit position
+        """
+        return self.status().fell_into_pit
+
+    def zombie_fell_into_pit(self) -> bool:
+        """Check and handle zombie falling into pit.
+
+        If zombie fell into pit, respawn it at random location.
+
+        Returns:
+            True if a zombie fell into pit (and was respawned)
+        """
+        if self.cells.item(self.pit_position) == CELL_ZOMBIE:
+            self._set_cell(self.pit_position, CELL_PIT)
+            self._set_cell(self.generate_random_position(), CELL_ZOMBIE)
+            return True
+        return False
+
+    def find_zombies_number(self) -> int:
+        """Count number of zombies currently on board.
+
+        Returns:
+            Number of zombies
+        """
+        return self.status().num_zombies
+
+    def legal_action_mask(self) -> int:
+        """Get Pac-Man's legal actions as a bitmask.
+
+        Bit k is set if Action k is legal (see core.rules). Moves come from
+        the cell's wall mask; the exit is blocked while zombies exist, and
+        SHOOT needs a zombie in range and a shot left.
+
+        Returns:
+            5-bit action mask
+        """
+        player = self.player_position
+        mask = self.wall_masks[player[0] * self.width + player[1]]
+
+        if self.find_zombies_number() > 0:
+            # While zombies exist, cannot move to exit
+            mask &= ~step_bit(player, self.exit_position)
+            if self.can_shoot():
+                mask |= SHOOT_BIT
+
+        return mask
+
+    def legal_zombie_mask(self, row: int, col: int) -> int:
+        """Get a zombie's legal moves as a bitmask.
+
+        Zombies cannot enter obstacles (the wall mask), the vaccine or the
+        exit.
+
+        Args:
+            row: Zombie's row position
+            col: Zombie's column position
+
+        Returns:
+            4-bit move mask
+        """
+        position = (row, col)
+        blocked = step_bit(position, self.exit_position) | step_bit(position, self.vaccine_position)
+        return self.wall_masks[row * self.width + col] & ~blocked
+
+    def get_possible_action(self) -> List[Action]:
+        """Get list of legal actions for Pac-Man.
+
+        Returns:
+            List of Action codes, moves in code order then SHOOT
+        """
+        return list(MASK_ACTIONS[self.legal_action_mask()])
+
+    def get_possible_action_zombie(self, row: int, col: int) -> List[Action]:
+        """Get list of legal actions for a zombie at given position.
+
+        Args:
+            row: Zombie's row position
+            col: Zombie's column position
+
+        Returns:
+            List of move Action codes, in code order
+        """
+        return list(MASK_ACTIONS[self.legal_zombie_mask(row, col)])
+
+    def get_successor_state(self, action: int) -> GridView:
+        """Get hypothetical next state if Pac-Man takes given action.
+
+        Used for planning - does not modify actual board state.
+
+        Args:
+            action: Action to simulate
+
+        Returns:
+            Grid view over a copy of the cells after action
+        """
+        player_position = self.player_position
+        cells_copy = self.cells.copy()
+
+        if action == ACTION_SHOOT:
+            if self.shoot != 0:
+                for target in self._shoot_targets(cells_copy, *player_position):
+                    cells_copy[target] = CELL_EMPTY
+        else:
+            cells_copy[player_position] = CELL_EMPTY
+            cells_copy[self._move_target(player_position, action)] = CELL_PLAYER
+
+        return GridView(cells_copy)
+
+    def get_successor_state_zombie(self, action: int, row: int, col: int) -> GridView:
+        """Get hypothetical next state if zombie takes given action.
+
+        Used for planning - does not modify actual board state.
+
+        Args:
+            action: Action to simulate
+            row: Zombie's current row
+            col: Zombie's current column
+
+        Returns:
+            Grid view over a copy of the cells after action
+        """
+        cells_copy = self.cells.copy()
+        cells_copy[row, col] = CELL_EMPTY
+        cells_copy[self._move_target((row, col), action)] = CELL_ZOMBIE
+        return GridView(cells_copy)
+
+    # =========================================================================
+    # IN-PLACE SUCCESSOR EVALUATION (make/unmake)
+    # =========================================================================
+
+    def push_player_action(self, action: int) -> None:
+        """Apply Pac-Man's action to the board in place for evaluation.
+
+        Produces exactly the state get_successor_state() would return, but on
+        the live cells instead of a copy. Game counters (shots, vaccine flag,
+        score) are left untouched, as in get_successor_state(). Every push
+        must be undone with pop_action() before the board is used for play.
+
+        Args:
+            action: Action to simulate (UP, DOWN, LEFT, RIGHT, SHOOT)
+        """
+        player_position = self.player_position
+        changes = []
+
+        if action == ACTION_SHOOT:
+            if self.shoot != 0:
+                for target in self._shoot_targets(self.cells, *player_position):
+                    changes.append((target, CELL_ZOMBIE))
+                    self._set_cell(target, CELL_EMPTY)
+        else:
+            target = self._move_target(player_position, action)
+            changes.append((player_position, CELL_PLAYER))
+            changes.append((target, self.cells.item(target)))
+            self._set_cell(player_position, CELL_EMPTY)
+            self._set_cell(target, CELL_PLAYER)
+
+        self._undo_stack.append(changes)
+
+    def push_zombie_action(self, action: int, row: int, col: int) -> None:
+        """Apply a zombie's action to the board in place for evaluation.
+
+        Produces exactly the state get_successor_state_zombie() would return.
+        Must be undone with pop_action().
+
+        Args:
+            action: Action to simulate (UP, DOWN, LEFT, RIGHT)
+            row: Zombie's current row
+            col: Zombie's current column
+        """
+        target = self._move_target((row, col), action)
+        changes = [((row, col), self.cells.item(row, col)), (target, self.cells.item(target))]
+        self._set_cell((row, col), CELL_EMPTY)
+        self._set_cell(target, CELL_ZOMBIE)
+        self._undo_stack.append(changes)
+
+    def pop_action(self) -> None:
+        """Undo the most recent push_player_action()/push_zombie_action()."""
+        for position, code in reversed(self._undo_stack.pop()):
+            self._set_cell(position, code)
+
+    def _entity_positions(self, successor_state: Optional[GridView]) -> Tuple:
+        """Collect entity positions visible in a state.
+
+        For the board's own cells (successor_state None) this reads the
+        entity index; an explicit successor state is scanned.
+
+        Args:
+            successor_state: Grid to inspect, or None for the board's cells
+
+        Returns:
+            Tuple (player, zombies, obstacles, vaccine, exit, pit) where
+            zombies and obstacles are collections of (row, col) and the
+            others are (row, col) or None when not on the grid
+        """
+        if successor_state is None:
+            exit_position = self.exit_position if self.cells.item(self.exit_position) == CELL_EXIT else None
+            pit_position = self.pit_position if self.cells.item(self.pit_position) == CELL_PIT else None
+            return (
+                self.player_position,
+                self.zombies_positions,
+                self.obstacle_positions,
+                self.vaccine_position,
+                exit_position,
+                pit_position
+            )
+
+        cells = as_cells(successor_state)
+        return (
+            _last_position(cells, CELL_PLAYER),
+            _positions(cells, CELL_ZOMBIE),
+            _positions(cells, CELL_OBSTACLE),
+            _last_position(cells, CELL_VACCINE),
+            _last_position(cells, CELL_EXIT),
+            _last_position(cells, CELL_PIT)
+        )
+
+    def get_zombies_position(self) -> List[List[int]]:
+        """Get positions of all zombies on board.
+
+        Returns:
+            List of [row, col] positions
+        """
+        return [[row, col] for row, col in sorted(self.zombies_positions)]
+
+    # =========================================================================
+    # FEATURE EXTRACTION METHODS
+    # =========================================================================
+    # TODO: These should be moved to agents/features.py in future refactoring
+    # They are kept here temporarily to maintain compatibility with existing code
+
+    def extract_features(self, successor_state: Optional[GridView] = None, out: Optional[NDArray] = None) -> NDArray:
+        """Extract 8-dimensional feature vector for Pac-Man agent.
+
+        CRITICAL: This exact formula is integral to learned weights.
+        DO NOT MODIFY without retraining agents.
+
+        Args:
+            successor_state: Hypothetical next state after action (GridView,
+                cell array or list-of-lists symbol grid). If None, the board's
+                own cells are used (e.g. after push_player_action()).
+            out: Optional float64 array of length 8 to write the features
+                into instead of allocating a new one
+
+        Returns:
+            8-element numpy array of features (out, if given)
+        """
+        # Feature multipliers
+        go_to_exit = 0
+        shoot = MULTIPLIER_SHOOT_DEFAULT
+        go_to_vaccine = 1
+        go_to_zombies = 1
+        distance_from_nearest_zombies = 0
+        pit = MULTIPLIER_PIT_DEFAULT
+        has_vaccine = 0
+
+        if self.has_vaccine:
+            has_vaccine = 1
+            go_to_zombies = -1
+            shoot = MULTIPLIER_SHOOT_WITH_VACCINE
+
+        # Calculate distances to all entities
+        player_position, zombies, obstacles, vaccine, exit_position, pit_position = (
+            self._entity_positions(successor_state)
+        )
+        # Distances are looked up by flat cell index (bit-identical to math.dist)
+        width = self.width
+        distance = self._cell_distances.from_cell(*player_position)
+        distance_from_all_zombies = [distance[z_row * width + z_col] for z_row, z_col in zombies]
+        number_of_zombie = len(distance_from_all_zombies)
+        distance_from_vaccines = distance[vaccine[0] * width + vaccine[1]] if vaccine else 0
+
+        # Adjust multipliers based on game state
+        if number_of_zombie == 0:
+            go_to_exit = MULTIPLIER_GO_TO_EXIT_ACTIVE
+            distance_from_nearest_zombies = 0
+            go_to_vaccine = 0
+            has_vaccine = 0
+            go_to_zombies = 0
+            pit = MULTIPLIER_PIT_ZOMBIES_CLEARED
+        else:
+            go_to_exit = MULTIPLIER_GO_TO_EXIT_INACTIVE
+            distance_from_nearest_zombies = min(distance_from_all_zombies)
+            go_to_vaccine = 1
+
+        # Layout terms: static field lookups on the board's own cells
+        if successor_state is None:
+            fields = self.static_fields
+            cell = player_position[0] * width + player_position[1]
+            exit_feature = fields.pacman_exit.item(cell) if exit_position else 0.0
+            obstacle_feature = fields.pacman_obstacle.item(cell)
+            if pit_position:
+                pit_field = fields.pacman_pit_cleared if number_of_zombie == 0 else fields.pacman_pit
+                pit_feature = pit_field.item(cell)
+            else:
+                pit_feature = 0.0
+        else:
+            distance_from_all_obstacle = [distance[o_row * width + o_col] for o_row, o_col in obstacles]
+            distance_from_exit = distance[exit_position[0] * width + exit_position[1]] if exit_position else 0
+            distance_from_pit = distance[pit_position[0] * width + pit_position[1]] if pit_position else 0
+            exit_feature = distance_from_exit / FEATURE_DISTANCE_SCALE
+            obstacle_feature = min(distance_from_all_obstacle) / FEATURE_DISTANCE_SCALE
+            pit_feature = pit * distance_from_pit / FEATURE_DISTANCE_SCALE
+
+        # Build feature vector
+        remain_vaccine = VACCINE_RESPAWN_LIMIT - self.num_zombie_cure
+        features = (
+            go_to_exit * exit_feature,
+            shoot * number_of_zombie,
+            remain_vaccine,
+            go_to_vaccine * distance_from_vaccines / FEATURE_DISTANCE_SCALE,
+            go_to_zombies * distance_from_nearest_zombies / FEATURE_DISTANCE_SCALE,
+            has_vaccine,
+            obstacle_feature,
+            pit_feature
+        )
+
+        if out is None:
+            return np.array(features)
+        out[:] = features
+        return out
+
+    def extract_features_batch(self, actions: List[int]) -> NDArray:
+        """Extract Pac-Man features for the successors of several actions.
+
+        Equivalent to pushing each action, calling extract_features() and
+        popping it again (row i is bit-identical to the features after
+        actions[i]), but each successor is derived from the entity index
+        and the static fields without touching the cells.
+
+        Args:
+            actions: Legal Pac-Man actions (see get_possible_action())
+
+        Returns:
+            (len(actions), 8) float64 array of feature vectors
+        """
+        width = self.width
+        fields = self.static_fields
+        player_position = self.player_position
+        zombies = self.zombies_positions
+
+        # Entities a successor can cover, as flat cells (-1 if not visible)
+        vaccine = self.vaccine_position
+        vaccine_cell = vaccine[0] * width + vaccine[1] if vaccine else -1
+        exit_cell = self.exit_position[0] * width + self.exit_position[1]
+        if self.cells.item(self.exit_position) != CELL_EXIT:
+            exit_cell = -1
+        pit_cell = self.pit_position[0] * width + self.pit_position[1]
+        if self.cells.item(self.pit_position) != CELL_PIT:
+            pit_cell = -1
+
+        # Terms that do not depend on the action
+        if self.has_vaccine:
+            has_vaccine, go_to_zombies, shoot = 1, -1, MULTIPLIER_SHOOT_WITH_VACCINE
+        else:
+            has_vaccine, go_to_zombies, shoot = 0, 1, MULTIPLIER_SHOOT_DEFAULT
+        remain_vaccine = VACCINE_RESPAWN_LIMIT - self.num_zombie_cure
+        shot_zombies = self._shoot_targets(self.cells, *player_position) if self.shoot != 0 else []
+
+        rows = []
+        for action in actions:
+            # Pac-Man's cell and the zombies left after the action
+            if action == ACTION_SHOOT:
+                position = player_position
+                remaining = [zombie for zombie in zombies if zombie not in shot_zombies]
+            else:
+                position = self._move_target(player_position, action)
+                remaining = [zombie for zombie in zombies if zombie != position]
+            cell = position[0] * width + position[1]
+            distance = self._cell_distances.from_cell(*position)
+            number_of_zombie = len(remaining)
+            distance_from_vaccines = distance[vaccine_cell] if vaccine_cell not in (-1, cell) else 0
+            exit_feature = fields.pacman_exit.item(cell) if exit_cell not in (-1, cell) else 0.0
+
+            # Same multipliers and operator order as extract_features()
+            if number_of_zombie == 0:
+                pit_feature = fields.pacman_pit_cleared.item(cell) if pit_cell not in (-1, cell) else 0.0
+                rows.append((
+                    MULTIPLIER_GO_TO_EXIT_ACTIVE * exit_feature,
+                    shoot * number_of_zombie,
+                    remain_vaccine,
+                    0 * distance_from_vaccines / FEATURE_DISTANCE_SCALE,
+                    0 * 0 / FEATURE_DISTANCE_SCALE,
+                    0,
+                    fields.pacman_obstacle.item(cell),
+                    pit_feature
+                ))
+            else:
+                distance_from_nearest_zombies = min([distance[z_row * width + z_col] for z_row, z_col in remaining])
+                pit_feature = fields.pacman_pit.item(cell) if pit_cell not in (-1, cell) else 0.0
+                rows.append((
+                    MULTIPLIER_GO_TO_EXIT_INACTIVE * exit_feature,
+                    shoot * number_of_zombie,
+                    remain_vaccine,
+                    1 * distance_from_vaccines / FEATURE_DISTANCE_SCALE,
+                    go_to_zombies * distance_from_nearest_zombies / FEATURE_DISTANCE_SCALE,
+                    has_vaccine,
+                    fields.pacman_obstacle.item(cell),
+                    pit_feature
+                ))
+
+        return np.array(rows, dtype=np.float64).reshape(len(actions), 8)
+
+    def extract_features_zombie(
+        self,
+        successor_state: Optional[GridView],
+        row: int,
+        col: int,
+        out: Optional[NDArray] = None
+    ) -> NDArray:
+        """Extract 3-dimensional feature vector for Zombie agent.
+
+        CRITICAL: This exact formula is integral to learned weights.
+        DO NOT MODIFY without retraining agents.
+
+        Args:
+            successor_state: Hypothetical next state after action (GridView,
+                cell array or list-of-lists symbol grid). If None, the board's
+                own cells are used (e.g. after push_zombie_action()).
+            row: Zombie's row position in successor state
+            col: Zombie's column position in successor state
+            out: Optional float64 array of length 3 to write the features
+                into instead of allocating a new one
+
+        Returns:
+            3-element numpy array of features (out, if given)
+        """
+        go_to_player = MULTIPLIER_ZOMBIE_CHASE
+
+        # Calculate distances (looked up by flat cell index)
+        player_position, _, obstacles, _, _, pit_position = self._entity_positions(successor_state)
+        width = self.width
+        distance = self._cell_distances.from_cell(row, col)
+        distance_from_player = distance[player_position[0] * width + player_position[1]] if player_position else 0
+
+        # Layout terms: static field lookups on the board's own cells
+        if successor_state is None:
+            fields = self.static_fields
+            cell = row * width + col
+            pit_feature = fields.zombie_pit.item(cell) if pit_position else 0.0
+            obstacle_feature = fields.zombie_obstacle.item(cell)
+        else:
+            distance_from_pit = distance[pit_position[0] * width + pit_position[1]] if pit_position else 0
+            distance_from_all_obstacle = [distance[o_row * width + o_col] for o_row, o_col in obstacles]
+            pit_feature = distance_from_pit / FEATURE_DISTANCE_SCALE
+            obstacle_feature = min(distance_from_all_obstacle) / FEATURE_OBSTACLE_SCALE
+
+        # Flee if Pac-Man has vaccine
+        if self.has_vaccine:
+            go_to_player = MULTIPLIER_ZOMBIE_FLEE
+
+        # Build feature vector
+        features = (
+            go_to_player * distance_from_player / FEATURE_DISTANCE_SCALE,
+            pit_feature,
+            obstacle_feature
+        )
+
+        if out is None:
+            return np.array(features)
+        out[:] = features
+        return out
+
+    def extract_features_zombie_field(self) -> NDArray:
+        """Extract zombie features for every cell of the board at once.
+
+        A zombie's successor features depend only on its own cell (the
+        player, pit and obstacles do not move during a zombie turn), so
+        row ``r * width + c`` equals extract_features_zombie() after moving
+        a zombie to (r, c) with push_zombie_action(). Computed once per turn,
+        the field scores every zombie's moves.
+
+        Returns:
+            (height * width, 3) float64 array of feature vectors
+        """
+        fields = self.static_fields
+        pit_visible = self.cells.item(self.pit_position) == CELL_PIT
+        go_to_player = MULTIPLIER_ZOMBIE_FLEE if self.has_vaccine else MULTIPLIER_ZOMBIE_CHASE
+        distance_from_player = self._cell_distances.array_from_cell(*self.player_position)
+
+        features = np.empty((self.height * self.width, 3))
+        features[:, 0] = go_to_player * distance_from_player / FEATURE_DISTANCE_SCALE
+        features[:, 1] = fields.zombie_pit if pit_visible else 0.0
+        features[:, 2] = fields.zombie_obstacle
+
+        return features
+
+
+class BoardPool:
+    """A few boards reused round-robin for episode starts.
+
+    board(i) resets and returns slot i % size, so a board stays valid until
+    its slot comes round again. Each slot is constructed on first use.
+    Passing a seed restarts the board's random stream for that episode
+    (see core.rng.episode_seeds); otherwise its stream continues.
+
+    Example:
+        >>> boards = BoardPool(layouts='layouts.bin')
+        >>> for episode in range(10000):
+        ...     board_seed, _ = episode_seeds(run_seed, episode)
+        ...     trainer.train_episode(boards.board(episode, board_seed), opponent_weights)
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        layouts: Optional[str] = None,
+        rng: Optional[random.Random] = None,
+        **board_kwargs
+    ):
+        """Initialize an empty pool.
+
+        Args:
+            size: Number of boards kept
+            layouts: Layout bank file; board(i) starts from layout i (modulo
+                the bank size). If None, each board draws a fresh layout.
+            rng: Random stream shared by the pooled boards until a seed is
+                passed to board(). If None, each board gets its own stream.
+            **board_kwargs: Board arguments for the pooled boards
+        """
+        if size < 1:
+            raise ValueError(f"size must be at least 1, got {size}")
+
+        self.size = size
+        self.layouts = layouts
+        self.rng = rng
+        self.board_kwargs = board_kwargs
+        self._boards: List[Optional[Board]] = [None] * size
+
+    def board(self, index: int, seed: SeedLike = None) -> Board:
+        """Get a freshly reset board for episode `index`.
+
+        Args:
+            index: Episode index; selects the slot and, with a bank, the layout
+            seed: Seed for the board's random stream this episode, or None
+
+        Returns:
+            Board at the start of a new game
+        """
+        layout = None
+        kwargs = self.board_kwargs
+        if self.layouts is not None:
+            bank = load_layout_bank(self.layouts)
+            layout = bank.placement(index % len(bank))
+            kwargs = dict(kwargs, width=bank.width, height=bank.height)
+
+        slot = index % self.size
+        board = self._boards[slot]
+        if board is None:
+            rng = self.rng if seed is None else make_rng(seed)
+            board = self._boards[slot] = Board(placement=layout, rng=rng, **kwargs)
+        else:
+            board.reset(seed=seed, layout=layout)
+        return board
+
+
+def print_grid(grid: GridView) -> None:
+    """Print board grid to terminal (for debugging).
+
+    Args:
+        grid: 2D grid to print (GridView or list-of-lists symbol grid)
+    """
+    print("===============================")
+    for i in range(len(grid)):
+        row = ""
+        for j in range(len(grid[i])):
+            row += grid[i][j] + "|" if grid[i][j] != None else " |"
+        print(row + "|")
+    print("===============================")
@@ -0,0 +1,201 @@
+"""Precomputed Euclidean distance lookups for feature extraction.
+
+Board coordinates are small integers, so every distance the feature
+extractors need is one of height * width values indexed by the absolute
+row and column offsets. The offset table is built once per board size
+with math.dist itself, so lookups return exactly the floats math.dist
+would; CellDistances expands it into per-cell rows indexed by flat cell
+index for the hot feature loops.
+
+Obstacles, the exit and the pit never move during an episode, so the
+feature terms built from them are also precomputed for every cell as
+StaticFields, once per layout.
+"""
+
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .constants import (
+    FEATURE_DISTANCE_SCALE,
+    FEATURE_OBSTACLE_SCALE,
+    MULTIPLIER_PIT_DEFAULT,
+    MULTIPLIER_PIT_ZOMBIES_CLEARED,
+)
+
+
+@lru_cache(maxsize=None)
+def distance_table(height: int, width: int) -> NDArray:
+    """Get the offset distance table for a board size.
+
+    Args:
+        height: Board height in cells
+        width: Board width in cells
+
+    Returns:
+        Read-only (height, width) float64 array where entry [dr, dc] is
+        math.dist((0, 0), (dr, dc))
+    """
+    table = np.array(
+        [[math.dist((0, 0), (d_row, d_col)) for d_col in range(width)] for d_row in range(height)],
+        dtype=np.float64
+    )
+    table.setflags(write=False)
+    return table
+
+
+def _distance_field(table: NDArray, position: Tuple[int, int]) -> NDArray:
+    """Distances from every cell to one position, as a (height, width) array."""
+    height, width = table.shape
+    rows = np.abs(np.arange(height) - position[0])[:, None]
+    cols = np.abs(np.arange(width) - position[1])[None, :]
+    return table[rows, cols]
+
+
+class CellDistances:
+    """Distances between cell pairs of one board size, by flat cell index.
+
+    ``from_cell(row, col)[r * width + c]`` is the distance from (row, col)
+    to (r, c). Rows are expanded from distance_table() the first time a
+    source cell is used and kept both as arrays (for vectorized fields) and
+    as Python lists, so per-entity lookups in the feature loops are a
+    single list index.
+
+    Attributes:
+        height: Board height in cells
+        width: Board width in cells
+        table: Offset table from distance_table(height, width)
+    """
+
+    def __init__(self, height: int, width: int):
+        """Initialize lookups for a board size.
+
+        Args:
+            height: Board height in cells
+            width: Board width in cells
+        """
+        self.height = height
+        self.width = width
+        self.table = distance_table(height, width)
+        self._arrays: List[Optional[NDArray]] = [None] * (height * width)
+        self._rows: List[Optional[List[float]]] = [None] * (height * width)
+
+    def array_from_cell(self, row: int, col: int) -> NDArray:
+        """Get distances from (row, col) to every cell as a flat array.
+
+        Args:
+            row: Source row
+            col: Source column
+
+        Returns:
+            Read-only float64 array of height * width distances
+        """
+        distances = self._arrays[row * self.width + col]
+        if distances is None:
+            distances = _distance_field(self.table, (row, col)).ravel()
+            distances.setflags(write=False)
+            self._arrays[row * self.width + col] = distances
+        return distances
+
+    def from_cell(self, row: int, col: int) -> List[float]:
+        """Get distances from (row, col) to every cell, by flat index.
+
+        Args:
+            row: Source row
+            col: Source column
+
+        Returns:
+            List of height * width distances
+        """
+        distances = self._rows[row * self.width + col]
+        if distances is None:
+            distances = self.array_from_cell(row, col).tolist()
+            self._rows[row * self.width + col] = distances
+        return distances
+
+
+@lru_cache(maxsize=None)
+def cell_distances(height: int, width: int) -> CellDistances:
+    """Get the shared cell-pair distance lookup for a board size.
+
+    Args:
+        height: Board height in cells
+        width: Board width in cells
+
+    Returns:
+        CellDistances instance shared by all boards of this size
+    """
+    return CellDistances(height, width)
+
+
+@dataclass(frozen=True)
+class StaticFields:
+    """Per-cell feature terms that depend only on the board layout.
+
+    Each field is a read-only flat float64 array indexed by
+    ``row * width + col`` and holds the term exactly as extract_features /
+    extract_features_zombie compute it for an agent standing on that cell,
+    scale constants included.
+
+    Attributes:
+        layout: (obstacles, exit, pit) positions the fields were built for
+        pacman_obstacle: Nearest obstacle distance / FEATURE_DISTANCE_SCALE
+        pacman_exit: Exit distance / FEATURE_DISTANCE_SCALE
+        pacman_pit: (MULTIPLIER_PIT_DEFAULT * pit distance) / FEATURE_DISTANCE_SCALE
+        pacman_pit_cleared: Same with MULTIPLIER_PIT_ZOMBIES_CLEARED
+        zombie_pit: Pit distance / FEATURE_DISTANCE_SCALE
+        zombie_obstacle: Nearest obstacle distance / FEATURE_OBSTACLE_SCALE
+    """
+    layout: Tuple
+    pacman_obstacle: NDArray
+    pacman_exit: NDArray
+    pacman_pit: NDArray
+    pacman_pit_cleared: NDArray
+    zombie_pit: NDArray
+    zombie_obstacle: NDArray
+
+
+@lru_cache(maxsize=64)
+def static_fields(
+    height: int,
+    width: int,
+    obstacles: Tuple[Tuple[int, int], ...],
+    exit_position: Tuple[int, int],
+    pit_position: Tuple[int, int]
+) -> StaticFields:
+    """Build (or reuse) the static feature fields for a layout.
+
+    Args:
+        height: Board height in cells
+        width: Board width in cells
+        obstacles: Obstacle positions
+        exit_position: Exit position
+        pit_position: Pit position
+
+    Returns:
+        StaticFields for the layout, shared by boards with the same layout
+    """
+    # Per-cell distance rows are cached, so a new layout only costs the min
+    distances = cell_distances(height, width)
+    nearest_obstacle = np.min([distances.array_from_cell(*obstacle) for obstacle in obstacles], axis=0)
+    exit_distance = distances.array_from_cell(*exit_position)
+    pit_distance = distances.array_from_cell(*pit_position)
+
+    fields = {
+        'pacman_obstacle': nearest_obstacle / FEATURE_DISTANCE_SCALE,
+        'pacman_exit': exit_distance / FEATURE_DISTANCE_SCALE,
+        'pacman_pit': MULTIPLIER_PIT_DEFAULT * pit_distance / FEATURE_DISTANCE_SCALE,
+        'pacman_pit_cleared': MULTIPLIER_PIT_ZOMBIES_CLEARED * pit_distance / FEATURE_DISTANCE_SCALE,
+        'zombie_pit': pit_distance / FEATURE_DISTANCE_SCALE,
+        'zombie_obstacle': nearest_obstacle / FEATURE_OBSTACLE_SCALE,
+    }
+    for name, field in fields.items():
+        field = field.ravel()
+        field.setflags(write=False)
+        fields[name] = field
+
+    return StaticFields(layout=(obstacles, exit_position, pit_position), **fields)
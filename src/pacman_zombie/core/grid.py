@@ -0,0 +1,114 @@
+"""Integer grid storage and symbol-level compatibility views.
+
+The board stores its cells as a contiguous np.int8 array of cell codes
+(see CELL_* in constants). Code that still indexes the board as a list of
+symbol lists (``board.grid[i][j] == "Z"``) goes through GridView, which
+translates codes to symbols on access without copying the array. The
+view a Board hands out is read-only; its rule methods are the only way to
+change a live board.
+"""
+
+from typing import Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .constants import CELL_SYMBOLS, SYMBOL_TO_CELL
+
+GRID_DTYPE = np.int8
+"""Storage dtype of board grids."""
+
+
+class GridRowView:
+    """Symbol view over a single grid row."""
+
+    __slots__ = ('row',)
+
+    def __init__(self, row: NDArray):
+        self.row = row
+
+    def __getitem__(self, col: int) -> Optional[str]:
+        return CELL_SYMBOLS[self.row[col]]
+
+    def __setitem__(self, col: int, symbol: Optional[str]) -> None:
+        if not self.row.flags.writeable:
+            raise TypeError("Read-only grid view; change the board through its rule methods")
+        self.row[col] = SYMBOL_TO_CELL[symbol]
+
+    def __len__(self) -> int:
+        return len(self.row)
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        return (CELL_SYMBOLS[code] for code in self.row.tolist())
+
+
+class GridView:
+    """Symbol view over an int8 cell grid.
+
+    Supports ``view[i][j]`` reads and writes with entity symbols, ``len``,
+    iteration and ``copy.deepcopy`` (which copies the underlying array).
+    Writes raise TypeError when the array is not writeable, as for the
+    view returned by Board.grid; a deepcopy is always writeable.
+
+    Attributes:
+        cells: Underlying (height, width) np.int8 array of cell codes
+    """
+
+    __slots__ = ('cells',)
+
+    def __init__(self, cells: NDArray):
+        self.cells = cells
+
+    def __getitem__(self, row: int) -> GridRowView:
+        return GridRowView(self.cells[row])
+
+    def __len__(self) -> int:
+        return self.cells.shape[0]
+
+    def __iter__(self) -> Iterator[GridRowView]:
+        return (GridRowView(row) for row in self.cells)
+
+    def __deepcopy__(self, memo: dict) -> 'GridView':
+        return GridView(self.cells.copy())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, GridView):
+            return np.array_equal(self.cells, other.cells)
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def to_list(self) -> List[List[Optional[str]]]:
+        """Decode grid to a list of symbol lists."""
+        return [[CELL_SYMBOLS[code] for code in row] for row in self.cells.tolist()]
+
+
+def encode_grid(grid: Sequence[Sequence[Optional[str]]]) -> NDArray:
+    """Encode a list-of-lists symbol grid to an int8 cell array.
+
+    Args:
+        grid: 2D grid of entity symbols (None for empty)
+
+    Returns:
+        (height, width) np.int8 array of cell codes
+    """
+    return np.array(
+        [[SYMBOL_TO_CELL[symbol] for symbol in row] for row in grid],
+        dtype=GRID_DTYPE
+    )
+
+
+def as_cells(state: Union[GridView, NDArray, Sequence[Sequence[Optional[str]]]]) -> NDArray:
+    """Return the int8 cell array behind any supported grid representation.
+
+    Args:
+        state: GridView, int8 cell array, or list-of-lists symbol grid
+
+    Returns:
+        (height, width) np.int8 array of cell codes (not copied when possible)
+    """
+    if isinstance(state, GridView):
+        return state.cells
+    if isinstance(state, np.ndarray):
+        return state
+    return encode_grid(state)
@@ -0,0 +1,181 @@
+"""Pre-generated starting layouts in a memory-mapped file.
+
+A layout bank stores many accepted core.placement layouts so episodes can
+start from a fixed, shared set of boards without sampling or flood fills.
+The file is a 64-byte header followed by one row of flat cell indices per
+layout, in Placement order: player, zombies, obstacles, vaccine, exit, pit.
+Rows are uint8 when the board has at most 256 cells, else uint16, so the
+default board takes 18 bytes per layout.
+
+Banks are opened as read-only np.memmap arrays: loading layout k reads one
+row of the file, and worker processes share the operating system's page
+cache instead of each holding a copy.
+"""
+
+import struct
+from functools import lru_cache
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .placement import Placement
+
+MAGIC = b'PZLAYOUT'
+VERSION = 1
+
+# magic, version, height, width, zombies, obstacles, cell itemsize, count
+_HEADER = struct.Struct('<8s6IQ')
+HEADER_SIZE = 64
+"""Bytes before the first layout row."""
+
+
+def _cell_dtype(height: int, width: int) -> np.dtype:
+    """Smallest unsigned dtype that holds every flat cell index."""
+    return np.dtype(np.uint8) if height * width <= 256 else np.dtype('<u2')
+
+
+class LayoutBank:
+    """A file of starting layouts for one board configuration.
+
+    Example:
+        >>> bank = LayoutBank('layouts.bin')
+        >>> board = Board.from_layout(bank, 42)
+
+    Attributes:
+        path: Path of the bank file
+        height: Board height in cells
+        width: Board width in cells
+        num_zombies: Zombies per layout
+        num_obstacles: Obstacles per layout
+        cells: (count, num_entities) memory-mapped flat cell indices
+    """
+
+    def __init__(self, path: Union[str, Path], mode: str = 'r'):
+        """Open an existing bank.
+
+        Args:
+            path: Bank file
+            mode: np.memmap mode, 'r' (read-only) or 'r+' (writable)
+
+        Raises:
+            ValueError: If the file is not a layout bank of a known version
+        """
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size or header[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"Not a layout bank: {self.path}")
+
+        _, version, height, width, num_zombies, num_obstacles, itemsize, count = _HEADER.unpack(header)
+        if version != VERSION:
+            raise ValueError(f"Unsupported layout bank version {version} in {self.path}")
+
+        self.height = height
+        self.width = width
+        self.num_zombies = num_zombies
+        self.num_obstacles = num_obstacles
+        dtype = _cell_dtype(height, width)
+        if dtype.itemsize != itemsize:
+            raise ValueError(f"Layout bank {self.path} has {itemsize}-byte cells, expected {dtype.itemsize}")
+
+        self.cells: NDArray = np.memmap(
+            self.path, dtype=dtype, mode=mode, offset=HEADER_SIZE,
+            shape=(count, num_zombies + num_obstacles + 4)
+        )
+
+    @classmethod
+    def create(
+        cls,
+        path: Union[str, Path],
+        count: int,
+        height: int,
+        width: int,
+        num_zombies: int,
+        num_obstacles: int
+    ) -> 'LayoutBank':
+        """Create a zero-filled bank of `count` layouts, opened for writing.
+
+        Args:
+            path: Bank file to create (overwritten if it exists)
+            count: Number of layouts
+            height: Board height in cells
+            width: Board width in cells
+            num_zombies: Zombies per layout
+            num_obstacles: Obstacles per layout
+
+        Returns:
+            Writable LayoutBank; fill it with store() and call flush()
+        """
+        dtype = _cell_dtype(height, width)
+        num_entities = num_zombies + num_obstacles + 4
+        header = _HEADER.pack(MAGIC, VERSION, height, width, num_zombies, num_obstacles, dtype.itemsize, count)
+        with open(path, 'wb') as f:
+            f.write(header.ljust(HEADER_SIZE, b'\0'))
+            f.truncate(HEADER_SIZE + count * num_entities * dtype.itemsize)
+        return cls(path, mode='r+')
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def placement(self, index: int) -> Placement:
+        """Decode layout `index`.
+
+        Args:
+            index: Layout index
+
+        Returns:
+            Placement of the stored layout (attempts is 0: nothing was drawn)
+        """
+        cells = [divmod(cell, self.width) for cell in self.cells[index].tolist()]
+        return Placement(
+            player=cells[0],
+            zombies=cells[1:1 + self.num_zombies],
+            obstacles=cells[1 + self.num_zombies:1 + self.num_zombies + self.num_obstacles],
+            vaccine=cells[-3],
+            exit=cells[-2],
+            pit=cells[-1],
+            attempts=0
+        )
+
+    def store(self, index: int, placement: Placement) -> None:
+        """Write a layout into slot `index`.
+
+        Args:
+            index: Layout index
+            placement: Layout with this bank's entity counts
+        """
+        if len(placement.zombies) != self.num_zombies or len(placement.obstacles) != self.num_obstacles:
+            raise ValueError(
+                f"Bank holds {self.num_zombies} zombies and {self.num_obstacles} obstacles, got "
+                f"{len(placement.zombies)} and {len(placement.obstacles)}"
+            )
+        positions = (
+            [placement.player] + list(placement.zombies) + list(placement.obstacles)
+            + [placement.vaccine, placement.exit, placement.pit]
+        )
+        self.cells[index] = [row * self.width + col for row, col in positions]
+
+    def flush(self) -> None:
+        """Write pending changes to disk."""
+        self.cells.flush()
+
+    def __repr__(self) -> str:
+        return (
+            f"LayoutBank({str(self.path)!r}, layouts={len(self)}, board={self.height}x{self.width}, "
+            f"zombies={self.num_zombies}, obstacles={self.num_obstacles})"
+        )
+
+
+@lru_cache(maxsize=8)
+def load_layout_bank(path: str) -> LayoutBank:
+    """Open a bank read-only, once per process and path.
+
+    Args:
+        path: Bank file
+
+    Returns:
+        Shared read-only LayoutBank
+    """
+    return LayoutBank(path)
@@ -0,0 +1,190 @@
+"""Random entity placement with a reachability check.
+
+A layout is drawn in one go: every entity gets a distinct cell sampled
+without replacement. A layout is accepted only if Pac-Man can walk to
+every open cell and reach the exit. Walls (obstacles), the pit and the
+exit split the board into open regions, and only one region may exist.
+This covers the vaccine and the zombies, and any cell a respawned
+vaccine or zombie can land on later. Rejected layouts are redrawn; the
+accept/reject counts are kept in placement_stats.
+"""
+
+import random
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .constants import MOVE_DELTAS
+
+DEFAULT_MAX_ATTEMPTS = 1000
+"""Layouts drawn before sample_placement() gives up."""
+
+
+@dataclass
+class Placement:
+    """Entity cells of a freshly generated board.
+
+    Attributes:
+        player: Pac-Man's cell
+        zombies: Zombie cells
+        obstacles: Obstacle cells
+        vaccine: Vaccine cell
+        exit: Exit cell
+        pit: Pit cell
+        attempts: Layouts drawn to find this one (1 if the first was accepted)
+    """
+    player: Tuple[int, int]
+    zombies: List[Tuple[int, int]]
+    obstacles: List[Tuple[int, int]]
+    vaccine: Tuple[int, int]
+    exit: Tuple[int, int]
+    pit: Tuple[int, int]
+    attempts: int = 1
+
+
+@dataclass
+class PlacementStats:
+    """Running counts of generated layouts.
+
+    Attributes:
+        accepted: Layouts accepted
+        rejected: Layouts rejected as not fully reachable
+    """
+    accepted: int = 0
+    rejected: int = 0
+
+    @property
+    def rejection_rate(self) -> float:
+        """Fraction of drawn layouts that were rejected (0.0 before any)."""
+        drawn = self.accepted + self.rejected
+        return self.rejected / drawn if drawn else 0.0
+
+    def reset(self) -> None:
+        """Zero the counts."""
+        self.accepted = 0
+        self.rejected = 0
+
+
+placement_stats = PlacementStats()
+"""Counts for every layout drawn in this process."""
+
+
+@lru_cache(maxsize=None)
+def _walk_neighbours(height: int, width: int) -> Tuple[Tuple[int, ...], ...]:
+    """Flat cells one MOVE_DELTAS step away from each flat cell."""
+    return tuple(
+        tuple(
+            (row + d_row) * width + col + d_col
+            for d_row, d_col in MOVE_DELTAS
+            if 0 <= row + d_row < height and 0 <= col + d_col < width
+        )
+        for row in range(height) for col in range(width)
+    )
+
+
+def reachable_cells(blocked: NDArray, start: Tuple[int, int]) -> NDArray:
+    """Flood fill the cells Pac-Man can walk to.
+
+    Args:
+        blocked: (height, width) bool array of cells that cannot be entered
+        start: (row, col) to fill from
+
+    Returns:
+        (height, width) bool array of cells reachable from start with
+        MOVE_DELTAS steps that never enter a blocked cell
+    """
+    height, width = blocked.shape
+    neighbours = _walk_neighbours(height, width)
+    reached = blocked.ravel().tolist()  # blocked cells count as visited
+    first = start[0] * width + start[1]
+    reached[first] = True
+    filled = [first]
+    for cell in filled:
+        for target in neighbours[cell]:
+            if not reached[target]:
+                reached[target] = True
+                filled.append(target)
+
+    result = np.zeros(height * width, dtype=bool)
+    result[filled] = True
+    return result.reshape(height, width)
+
+
+def is_connected(height: int, width: int, placement: Placement) -> bool:
+    """Check that a layout leaves no open cell or exit cut off from Pac-Man.
+
+    Args:
+        height: Board height in cells
+        width: Board width in cells
+        placement: Layout to check
+
+    Returns:
+        True if every cell other than obstacles, pit and exit is reachable
+        from Pac-Man and the exit borders a reachable cell
+    """
+    blocked = np.zeros((height, width), dtype=bool)
+    for position in placement.obstacles:
+        blocked[position] = True
+    blocked[placement.pit] = True
+    blocked[placement.exit] = True
+
+    reached = reachable_cells(blocked, placement.player)
+    if reached.sum() != blocked.size - blocked.sum():
+        return False
+
+    exit_cell = placement.exit[0] * width + placement.exit[1]
+    return reached.ravel()[list(_walk_neighbours(height, width)[exit_cell])].any()
+
+
+def sample_placement(
+    height: int,
+    width: int,
+    num_zombies: int,
+    num_obstacles: int,
+    rng=random,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+) -> Placement:
+    """Draw a random layout and redraw it until it is connected.
+
+    Args:
+        height: Board height in cells
+        width: Board width in cells
+        num_zombies: Number of zombies to place
+        num_obstacles: Number of obstacles to place
+        rng: random.Random instance or the random module
+        max_attempts: Layouts to draw before giving up
+
+    Returns:
+        Accepted Placement
+
+    Raises:
+        ValueError: If the entities do not fit on the board, or no
+            connected layout was found within max_attempts
+    """
+    num_entities = num_zombies + num_obstacles + 4  # player, vaccine, exit, pit
+    if num_entities > height * width:
+        raise ValueError(f"{num_entities} entities do not fit on a {height}x{width} board")
+
+    for attempt in range(1, max_attempts + 1):
+        cells = [divmod(cell, width) for cell in rng.sample(range(height * width), num_entities)]
+        placement = Placement(
+            player=cells[0],
+            zombies=cells[1:1 + num_zombies],
+            obstacles=cells[1 + num_zombies:1 + num_zombies + num_obstacles],
+            vaccine=cells[-3],
+            exit=cells[-2],
+            pit=cells[-1],
+            attempts=attempt
+        )
+        if is_connected(height, width, placement):
+            placement_stats.accepted += 1
+            return placement
+        placement_stats.rejected += 1
+
+    raise ValueError(
+        f"No connected layout found in {max_attempts} attempts "
+        f"({num_obstacles} obstacles on a {height}x{width} board)"
+    )
@@ -0,0 +1,85 @@
+"""Seeded random streams for boards, agents and trainers.
+
+Every Board, agent and trainer draws from its own random.Random instead of
+the global `random` module. Streams are derived from a run seed with
+np.random.SeedSequence, so each episode gets independent, reproducible
+streams that depend only on the run seed and the episode index, not on
+which process or worker plays it.
+
+Example:
+    >>> board_seed, agent_seed = episode_seeds(run_seed, episode)
+    >>> board = boards.board(episode, seed=board_seed)
+    >>> trainer.rng = make_rng(agent_seed)
+"""
+
+import random
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+SeedLike = Union[None, int, np.random.SeedSequence]
+"""A seed: None (fresh OS entropy), an int, or a SeedSequence."""
+
+# Child streams of a run seed
+EPISODE_STREAM = 0
+INIT_STREAM = 1
+
+
+def make_rng(seed: SeedLike = None) -> random.Random:
+    """Create a random.Random from a seed.
+
+    Args:
+        seed: None for fresh OS entropy, an int (used as random.Random's
+            seed), or a SeedSequence (128 bits of its state are used)
+
+    Returns:
+        New random.Random
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        seed = int.from_bytes(seed.generate_state(4, dtype=np.uint32).tobytes(), 'little')
+    return random.Random(seed)
+
+
+def fresh_seed() -> int:
+    """Draw a new run seed from OS entropy (print it to reproduce the run)."""
+    return np.random.SeedSequence().entropy
+
+
+def stream(seed: int, *key: int) -> np.random.SeedSequence:
+    """Child stream `key` of a run seed.
+
+    Args:
+        seed: Run seed
+        *key: Stream path, e.g. (EPISODE_STREAM, index)
+
+    Returns:
+        SeedSequence independent of every other key of the same seed
+    """
+    return np.random.SeedSequence(seed, spawn_key=key)
+
+
+def episode_seeds(seed: int, index: int) -> Tuple[np.random.SeedSequence, np.random.SeedSequence]:
+    """Board and agent seeds of episode `index` of a run.
+
+    Args:
+        seed: Run seed
+        index: Episode index within the run
+
+    Returns:
+        (board_seed, agent_seed) for Board.reset() and the trainer's rng
+    """
+    board_seed, agent_seed = stream(seed, EPISODE_STREAM, index).spawn(2)
+    return board_seed, agent_seed
+
+
+def init_generator(seed: Optional[int], *key: int) -> np.random.Generator:
+    """NumPy generator for a run's random weight initialization.
+
+    Args:
+        seed: Run seed (None for fresh OS entropy)
+        *key: Sub-stream, e.g. one per agent
+
+    Returns:
+        np.random.Generator on the run's INIT_STREAM
+    """
+    return np.random.default_rng(None if seed is None else stream(seed, INIT_STREAM, *key))
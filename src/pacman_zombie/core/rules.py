@@ -0,0 +1,184 @@
+"""Game rules shared by Board's live moves, successors and legal actions.
+
+Every rule that looks around a cell (moving, shooting, curing, capture)
+reads it through CellTables, built once per board size: for each flat cell
+(``row * width + col``) the target of each move, its on-board 8-neighbours
+in cure order and its on-board shooting targets in firing order. A check
+never tests bounds and touches at most 8 cells; the live move, the
+successor simulation and the legal-action generator all use the same
+tables, so they cannot disagree.
+
+Legal actions are bitmasks indexed by action code: bit k is set if Action k
+is legal (ACTION_BITS[k] == 1 << k), so the four moves fit in 4 bits and
+SHOOT adds a fifth.
+
+Obstacles never move during an episode, so which moves stay on the board
+and off an obstacle is fixed per layout. wall_masks() computes that once
+per layout as a 4-bit move mask per cell. Board combines it with a dynamic
+occupancy mask for the few cells whose blocking depends on the state: the
+exit while zombies remain, and the vaccine and exit for zombies (see
+step_bit()).
+
+MASK_ACTIONS and MASK_TABLE decode a mask into the Action codes in code
+order, as a tuple for one board or as a bool row for many masks at once.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .constants import ACTION_SHOOT, CELL_ZOMBIE, MOVE_DELTAS, SHOOTING_RANGE, Action
+
+Position = Tuple[int, int]
+
+# Pac-Man's 8 neighbours in the order the cure rule checks them
+NEIGHBOUR_OFFSETS: Tuple[Tuple[int, int], ...] = (
+    (-1, 0), (1, 0), (0, -1), (0, 1),
+    (-1, -1), (-1, 1), (1, -1), (1, 1)
+)
+
+# Cells Pac-Man can shoot, in the order shots are fired
+SHOOT_OFFSETS: Tuple[Tuple[int, int], ...] = (
+    (-SHOOTING_RANGE, 0), (SHOOTING_RANGE, 0),
+    (0, -SHOOTING_RANGE), (0, SHOOTING_RANGE)
+)
+
+ACTION_BITS: Tuple[int, ...] = tuple(1 << action for action in Action)
+"""Mask bit of each action, indexed by action code."""
+
+SHOOT_BIT: int = ACTION_BITS[ACTION_SHOOT]
+"""Mask bit of SHOOT."""
+
+MASK_ACTIONS: Tuple[Tuple[Action, ...], ...] = tuple(
+    tuple(action for action in Action if mask & ACTION_BITS[action])
+    for mask in range(1 << len(Action))
+)
+"""Actions set in each mask, in code order (indexed by mask)."""
+
+MASK_TABLE: NDArray = np.array(
+    [[bool(mask & bit) for bit in ACTION_BITS] for mask in range(1 << len(Action))]
+)
+"""(32, 5) read-only bool table: MASK_TABLE[masks] is a legality array."""
+MASK_TABLE.setflags(write=False)
+
+
+@dataclass(frozen=True)
+class CellTables:
+    """Per-cell neighbourhood tables for one board size, indexed by flat cell.
+
+    Attributes:
+        height: Board height in cells
+        width: Board width in cells
+        moves: Target of each move (indexed by action code), None if it
+            leaves the board
+        neighbours: On-board cells at NEIGHBOUR_OFFSETS, in cure order
+        shots: On-board cells at SHOOT_OFFSETS, in firing order
+    """
+    height: int
+    width: int
+    moves: Tuple[Tuple[Optional[Position], ...], ...]
+    neighbours: Tuple[Tuple[Position, ...], ...]
+    shots: Tuple[Tuple[Position, ...], ...]
+
+
+def _offset_cells(
+    height: int,
+    width: int,
+    offsets: Tuple[Tuple[int, int], ...],
+    keep_off_board: bool = False
+) -> Tuple[Tuple[Optional[Position], ...], ...]:
+    """Cells at each offset from every flat cell (off-board ones dropped or None)."""
+    table = []
+    for row in range(height):
+        for col in range(width):
+            cells = []
+            for d_row, d_col in offsets:
+                if 0 <= row + d_row < height and 0 <= col + d_col < width:
+                    cells.append((row + d_row, col + d_col))
+                elif keep_off_board:
+                    cells.append(None)
+            table.append(tuple(cells))
+    return tuple(table)
+
+
+@lru_cache(maxsize=None)
+def cell_tables(height: int, width: int) -> CellTables:
+    """Get the neighbourhood tables for a board size (built once per size).
+
+    Args:
+        height: Board height in cells
+        width: Board width in cells
+
+    Returns:
+        CellTables shared by all boards of this size
+    """
+    return CellTables(
+        height=height,
+        width=width,
+        moves=_offset_cells(height, width, MOVE_DELTAS, keep_off_board=True),
+        neighbours=_offset_cells(height, width, NEIGHBOUR_OFFSETS),
+        shots=_offset_cells(height, width, SHOOT_OFFSETS)
+    )
+
+
+def zombies_among(cells: NDArray, positions: Tuple[Position, ...]) -> List[Position]:
+    """Zombie cells among a table entry, in table order.
+
+    Serves the shooting rule (shots entry: zombies hit, in firing order) and
+    the cure/capture rule (neighbours entry: adjacent zombies, in cure order).
+
+    Args:
+        cells: Cell code array to inspect
+        positions: A CellTables.neighbours or CellTables.shots entry
+
+    Returns:
+        List of (row, col) holding a zombie
+    """
+    return [position for position in positions if cells.item(position) == CELL_ZOMBIE]
+
+
+_DELTA_BITS: Dict[Tuple[int, int], int] = {
+    delta: ACTION_BITS[action] for action, delta in enumerate(MOVE_DELTAS)
+}
+
+
+def step_bit(origin: Tuple[int, int], target: Optional[Tuple[int, int]]) -> int:
+    """Mask bit of the move from origin onto target.
+
+    Args:
+        origin: (row, col) of the mover
+        target: (row, col) of the cell to block, or None
+
+    Returns:
+        The move's bit, or 0 if target is None or not one move away
+    """
+    if target is None:
+        return 0
+    return _DELTA_BITS.get((target[0] - origin[0], target[1] - origin[1]), 0)
+
+
+@lru_cache(maxsize=64)
+def wall_masks(height: int, width: int, obstacles: Tuple[Position, ...]) -> Tuple[int, ...]:
+    """Build (or reuse) the static move masks for a layout.
+
+    Args:
+        height: Board height in cells
+        width: Board width in cells
+        obstacles: Obstacle positions
+
+    Returns:
+        Move mask of every flat cell (``row * width + col``): bit k is set if
+        move k stays on the board and does not enter an obstacle
+    """
+    blocked = set(obstacles)
+    return tuple(
+        sum(
+            ACTION_BITS[action]
+            for action, target in enumerate(targets)
+            if target is not None and target not in blocked
+        )
+        for targets in cell_tables(height, width).moves
+    )
@@ -0,0 +1,121 @@
+"""Zobrist hashing of board states.
+
+A state's 64-bit hash is the XOR of one key per (cell, cell code) pair plus
+keys for the game counters that affect decisions: the vaccine flag, the
+remaining shots and the number of cured zombies. Empty cells have key 0,
+so an empty grid hashes to the counter keys alone.
+
+Because XOR is its own inverse, Board updates the hash incrementally: a
+cell write XORs out the old code's key and XORs in the new one, and
+push_*_action()/pop_action() restore the exact previous hash.
+
+Keys are derived with splitmix64 from fixed indices, so hashes are
+identical across processes and runs and do not touch the `random` module.
+"""
+
+from functools import lru_cache
+from typing import List
+
+from numpy.typing import NDArray
+
+from .constants import CELL_EMPTY, CELL_SYMBOLS
+
+_MASK64 = (1 << 64) - 1
+
+# Key index bases; cell keys use indices below _COUNTER_BASE
+_COUNTER_BASE = 1 << 40
+_HAS_VACCINE_INDEX = _COUNTER_BASE
+_SHOOT_BASE = _COUNTER_BASE + (1 << 20)
+_CURE_BASE = _COUNTER_BASE + (2 << 20)
+
+
+def splitmix64(index: int) -> int:
+    """Derive a well-mixed 64-bit key from an integer index.
+
+    Args:
+        index: Key index
+
+    Returns:
+        64-bit unsigned key as a Python int
+    """
+    z = (index * 0x9E3779B97F4A7C15 + 0x9E3779B97F4A7C15) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+@lru_cache(maxsize=None)
+def shoot_key(shots: int) -> int:
+    """Key for a remaining-shots count."""
+    return splitmix64(_SHOOT_BASE + shots)
+
+
+@lru_cache(maxsize=None)
+def cure_key(cures: int) -> int:
+    """Key for a cured-zombies count."""
+    return splitmix64(_CURE_BASE + cures)
+
+
+HAS_VACCINE_KEY: int = splitmix64(_HAS_VACCINE_INDEX)
+"""Key XORed in while Pac-Man holds a vaccine."""
+
+
+class ZobristKeys:
+    """Cell keys for one board size.
+
+    ``cells[row * width + col][code]`` is the key of ``code`` standing on
+    (row, col); the CELL_EMPTY entry is 0.
+
+    Attributes:
+        height: Board height in cells
+        width: Board width in cells
+        cells: Per-cell lists of keys indexed by cell code
+    """
+
+    def __init__(self, height: int, width: int):
+        """Build the keys for a board size.
+
+        Args:
+            height: Board height in cells
+            width: Board width in cells
+        """
+        self.height = height
+        self.width = width
+        num_codes = len(CELL_SYMBOLS)
+        self.cells: List[List[int]] = [
+            [0 if code == CELL_EMPTY else splitmix64(cell * num_codes + code) for code in range(num_codes)]
+            for cell in range(height * width)
+        ]
+
+    def full_hash(self, cells: NDArray, has_vaccine: bool, shoot: int, num_zombie_cure: int) -> int:
+        """Hash a state from scratch.
+
+        Args:
+            cells: (height, width) cell code array
+            has_vaccine: Whether Pac-Man holds a vaccine
+            shoot: Remaining shots
+            num_zombie_cure: Zombies cured so far
+
+        Returns:
+            64-bit Zobrist hash
+        """
+        value = shoot_key(shoot) ^ cure_key(num_zombie_cure)
+        if has_vaccine:
+            value ^= HAS_VACCINE_KEY
+        for cell, code in enumerate(cells.ravel().tolist()):
+            value ^= self.cells[cell][code]
+        return value
+
+
+@lru_cache(maxsize=None)
+def zobrist_keys(height: int, width: int) -> ZobristKeys:
+    """Get the shared Zobrist keys for a board size.
+
+    Args:
+        height: Board height in cells
+        width: Board width in cells
+
+    Returns:
+        ZobristKeys instance shared by all boards of this size
+    """
+    return ZobristKeys(height, width)
@@ -1,12 +1,32 @@
 """Learning components for training agents."""
 
 from .weights import WeightManager, WeightMetadata, load_legacy_weights
-from .trainer import PacmanTrainer, ZombieTrainer
+from .trainer import PacmanTrainer, UpdateBatch, ZombieTrainer
+from .parallel import EpisodeRecord, ParallelEpisodeRunner
+from .hogwild import HogwildResult, HogwildRunner
+from .lstd import LSTDSolver, TransitionLog, TransitionLogInfo, read_log_info, transition_rows
+from .replay import ReplayBuffer
+from .param_server import ParameterClient, ParameterServer, ParameterWorker, WorkerMetrics
 
 __all__ = [
     'WeightManager',
     'WeightMetadata',
     'load_legacy_weights',
     'PacmanTrainer',
-    'ZombieTrainer'
+    'ZombieTrainer',
+    'UpdateBatch',
+    'EpisodeRecord',
+    'ParallelEpisodeRunner',
+    'HogwildResult',
+    'HogwildRunner',
+    'LSTDSolver',
+    'TransitionLog',
+    'TransitionLogInfo',
+    'read_log_info',
+    'transition_rows',
+    'ReplayBuffer',
+    'ParameterClient',
+    'ParameterServer',
+    'ParameterWorker',
+    'WorkerMetrics'
 ]
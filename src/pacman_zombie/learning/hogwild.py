@@ -0,0 +1,243 @@
+"""Asynchronous (Hogwild) training on shared-memory weights.
+
+The weight vector lives in a multiprocessing.shared_memory block. Every
+worker process plays its own Board episodes with a regular PacmanTrainer or
+ZombieTrainer whose weight array is a view of that block, so each step's
+TD update is written straight into the shared weights without locking and
+the other workers' next V_hat reads see it. Updates can interleave and
+occasionally overwrite each other; with 8 or 3 weights that is the
+trade-off accepted for lock-free throughput.
+
+While the run is active the parent trainer's weight attribute is also a
+view of the block, so checkpoints saved from it with WeightManager.save
+snapshot the live shared weights.
+
+Each worker resets one pooled Board per episode; with a layout bank,
+episode i starts from the same layout as in the serial and pool modes.
+"""
+
+import multiprocessing
+import queue
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Iterator, Optional, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ..core.board import BoardPool
+from ..core.rng import episode_seeds, fresh_seed, make_rng
+from .trainer import PacmanTrainer, ZombieTrainer
+
+
+@dataclass
+class HogwildResult:
+    """Result of one episode played by a Hogwild worker.
+
+    Attributes:
+        index: Episode index within the run
+        worker: Index of the worker that played it
+        V_train: Final V_train of the episode
+        steps: Steps taken
+        won: Whether the training agent won
+        outcome: Why the episode ended (trainer OUTCOME_* value)
+    """
+    index: int
+    worker: int
+    V_train: float
+    steps: int
+    won: bool
+    outcome: str
+
+
+def _weight_attribute(trainer: Union[PacmanTrainer, ZombieTrainer]) -> str:
+    """Name of the trainer attribute holding its weights."""
+    return 'w_hat_player' if isinstance(trainer, PacmanTrainer) else 'w_hat_zombie'
+
+
+def _hogwild_worker(
+    worker: int,
+    agent: str,
+    memory_name: str,
+    dimension: int,
+    opponent_weights: NDArray,
+    alpha: float,
+    max_steps: int,
+    seed: int,
+    episodes: int,
+    next_episode,
+    results,
+    max_repeats: Optional[int] = None,
+    layouts: Optional[str] = None
+) -> None:
+    """Play episodes against the shared weights until the run is done.
+
+    Args:
+        worker: Worker index
+        agent: 'pacman' or 'zombie'
+        memory_name: Name of the shared-memory weight block
+        dimension: Number of weights
+        opponent_weights: Fixed opponent weights
+        alpha: Learning rate
+        max_steps: Maximum steps per episode
+        seed: Run seed; episode i's streams come from episode_seeds(seed, i)
+        episodes: Total episodes in the run
+        next_episode: Shared counter handing out episode indices
+        results: Queue receiving one HogwildResult per episode
+        max_repeats: End episodes whose states repeat more than this many
+            times (see PacmanTrainer.train_episode)
+        layouts: Layout bank file for episode starting boards, or None
+    """
+    memory = shared_memory.SharedMemory(name=memory_name)
+    try:
+        weights = np.ndarray((dimension,), dtype=np.float64, buffer=memory.buf)
+        trainer = PacmanTrainer(weights) if agent == 'pacman' else ZombieTrainer(weights)
+        setattr(trainer, _weight_attribute(trainer), weights)
+        boards = BoardPool(layouts=layouts)
+
+        while True:
+            with next_episode.get_lock():
+                index = next_episode.value
+                next_episode.value += 1
+            if index >= episodes:
+                break
+
+            board_seed, agent_seed = episode_seeds(seed, index)
+            trainer.rng = make_rng(agent_seed)
+            V_train, steps, won = trainer.train_episode(
+                boards.board(index, board_seed), opponent_weights, alpha, max_steps, max_repeats=max_repeats
+            )
+            results.put(HogwildResult(index, worker, V_train, steps, won, trainer.last_outcome))
+
+        del weights, trainer, boards
+    finally:
+        memory.close()
+
+
+class HogwildRunner:
+    """Trains one agent with worker processes sharing its weights lock-free.
+
+    Example:
+        >>> trainer = ZombieTrainer()
+        >>> with HogwildRunner(trainer, player_weights, workers=4) as runner:
+        ...     for result in runner.run(1000):
+        ...         print(result.steps, trainer.w_hat_zombie)
+    """
+
+    def __init__(
+        self,
+        trainer: Union[PacmanTrainer, ZombieTrainer],
+        opponent_weights: NDArray,
+        workers: int,
+        alpha: float = 0.01,
+        max_steps: int = 1000,
+        seed: Optional[int] = None,
+        max_repeats: Optional[int] = None,
+        layouts: Optional[str] = None
+    ):
+        """Initialize the runner and move the trainer's weights to shared memory.
+
+        Args:
+            trainer: Trainer whose weights are trained
+            opponent_weights: Fixed weights of the opponent agent
+            workers: Number of worker processes
+            alpha: Learning rate
+            max_steps: Maximum steps per episode
+            seed: Run seed; episode i's streams come from episode_seeds(seed, i).
+                If None, a fresh run seed is drawn.
+            max_repeats: End episodes whose states repeat more than this
+                many times (see PacmanTrainer.train_episode)
+            layouts: Layout bank file; episode i starts from layout i
+                (modulo the bank size). If None, layouts are drawn.
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        if trainer.batch is not None:
+            raise ValueError("Hogwild workers apply per-step updates; the trainer must not use update_batch")
+
+        self.trainer = trainer
+        self.agent = 'pacman' if isinstance(trainer, PacmanTrainer) else 'zombie'
+        self.opponent_weights = np.array(opponent_weights, dtype=float)
+        self.workers = workers
+        self.alpha = alpha
+        self.max_steps = max_steps
+        self.seed = fresh_seed() if seed is None else seed
+        self.max_repeats = max_repeats
+        self.layouts = layouts
+
+        initial = np.array(getattr(trainer, _weight_attribute(trainer)), dtype=np.float64)
+        self._memory = shared_memory.SharedMemory(create=True, size=initial.nbytes)
+        self.weights = np.ndarray(initial.shape, dtype=np.float64, buffer=self._memory.buf)
+        self.weights[:] = initial
+        setattr(trainer, _weight_attribute(trainer), self.weights)
+
+    def snapshot(self) -> NDArray:
+        """Copy the current shared weights."""
+        return self.weights.copy()
+
+    def run(self, episodes: int) -> Iterator[HogwildResult]:
+        """Play episodes on the workers until all are done.
+
+        Args:
+            episodes: Number of episodes to play
+
+        Yields:
+            HogwildResult of each episode, in completion order
+        """
+        context = multiprocessing.get_context()
+        next_episode = context.Value('l', 0)
+        results = context.Queue()
+        processes = [
+            context.Process(
+                target=_hogwild_worker,
+                args=(
+                    worker, self.agent, self._memory.name, len(self.weights),
+                    self.opponent_weights, self.alpha, self.max_steps, self.seed,
+                    episodes, next_episode, results, self.max_repeats, self.layouts
+                ),
+                daemon=True
+            )
+            for worker in range(self.workers)
+        ]
+        for process in processes:
+            process.start()
+
+        try:
+            received = 0
+            while received < episodes:
+                try:
+                    result = results.get(timeout=1.0)
+                except queue.Empty:
+                    if not any(process.is_alive() for process in processes):
+                        raise RuntimeError("Hogwild workers exited before finishing the run")
+                    continue
+                received += 1
+                self.trainer.num_win += int(result.won)
+                self.trainer.num_episodes += 1
+                yield result
+            for process in processes:
+                process.join()
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+
+    def close(self) -> NDArray:
+        """Give the trainer a private copy of the weights and free the block.
+
+        Returns:
+            Final weights
+        """
+        final = self.snapshot()
+        setattr(self.trainer, _weight_attribute(self.trainer), final)
+        self.weights = final
+        self._memory.close()
+        self._memory.unlink()
+        return final
+
+    def __enter__(self) -> 'HogwildRunner':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
@@ -0,0 +1,315 @@
+"""Least-squares TD (LSTD) fitting of weights from logged transitions.
+
+The trainers' TD target is either a bootstrapped value or a fixed reward:
+
+    V_train = V_hat(next_features, w)   (the chosen successor's value)
+    V_train = reward                    (win, loss, pit, cure, exit)
+
+so every step is a transition (features, next_features, reward), with
+next_features zero when the target does not bootstrap. Given transitions,
+LSTD solves directly for the weights where the TD updates cancel out:
+
+    Σ features * (reward + γ * V_hat(next_features, w) - V_hat(features, w)) = 0
+    A w = b,  A = Σ features (features - γ next_features)ᵀ,  b = Σ features * reward
+
+A is only d x d (8 for Pac-Man, 3 for zombies), so transitions are streamed
+from disk into running A and b and the solve itself takes microseconds.
+
+A transition log is a 64-byte header (feature count, episodes and wins
+logged) followed by float64 rows of ``features, next_features, reward``
+(2 * d + 1 values). Logs are appended in chunks by TransitionLog and read
+back as read-only np.memmap arrays.
+"""
+
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+MAGIC = b'PZTRANS\0'
+VERSION = 1
+
+# magic, version, feature count, episodes, wins
+_HEADER = struct.Struct('<8s2I2Q')
+HEADER_SIZE = 64
+"""Bytes before the first transition row."""
+
+DEFAULT_CHUNK_ROWS = 65536
+"""Rows buffered by TransitionLog and read per chunk by LSTDSolver.add_log()."""
+
+
+@dataclass
+class TransitionLogInfo:
+    """Header of a transition log.
+
+    Attributes:
+        num_features: Feature dimension d
+        count: Transitions in the file
+        episodes: Episodes logged
+        wins: Episodes the logging agent won
+    """
+    num_features: int
+    count: int
+    episodes: int
+    wins: int
+
+
+def read_log_info(path: Union[str, Path]) -> TransitionLogInfo:
+    """Read a transition log's header.
+
+    Args:
+        path: Log file
+
+    Returns:
+        TransitionLogInfo of the file
+
+    Raises:
+        ValueError: If the file is not a transition log of a known version
+    """
+    path = Path(path)
+    with open(path, 'rb') as f:
+        header = f.read(_HEADER.size)
+    if len(header) < _HEADER.size or header[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"Not a transition log: {path}")
+    _, version, num_features, episodes, wins = _HEADER.unpack(header)
+    if version != VERSION:
+        raise ValueError(f"Unsupported transition log version {version} in {path}")
+    count = (path.stat().st_size - HEADER_SIZE) // ((2 * num_features + 1) * 8)
+    return TransitionLogInfo(num_features, count, episodes, wins)
+
+
+class TransitionLog:
+    """Appends (features, next_features, reward) transitions to a log file.
+
+    Rows are buffered in a preallocated chunk and written when it fills, so
+    logging a step copies two feature vectors and allocates nothing.
+
+    Example:
+        >>> with TransitionLog('pacman.trans', 8) as log:
+        ...     _, _, won = trainer.train_episode(board, zombie_weights, records=[], transitions=log)
+        ...     log.end_episode(won)
+        >>> weights = LSTDSolver(8).add_log('pacman.trans').solve()
+
+    Attributes:
+        path: Path of the log file
+        num_features: Feature dimension d
+        count: Transitions written so far, including buffered ones
+        episodes: Episodes logged (see end_episode())
+        wins: Episodes the logging agent won
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        num_features: int,
+        append: bool = False,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS
+    ):
+        """Create a log, or reopen one for appending.
+
+        Args:
+            path: Log file
+            num_features: Feature dimension (8 for Pac-Man, 3 for zombies)
+            append: Append to an existing log instead of overwriting it
+            chunk_rows: Rows buffered between writes
+
+        Raises:
+            ValueError: If an appended log has another feature dimension
+        """
+        self.path = Path(path)
+        self.num_features = num_features
+        if append and self.path.exists():
+            info = read_log_info(self.path)
+            if info.num_features != num_features:
+                raise ValueError(f"{self.path} holds {info.num_features} features, got {num_features}")
+            self.count, self.episodes, self.wins = info.count, info.episodes, info.wins
+            self._file = open(self.path, 'r+b')
+            # Drop a partial row left by an interrupted write
+            self._file.truncate(HEADER_SIZE + self.count * (2 * num_features + 1) * 8)
+            self._file.seek(0, 2)
+        else:
+            self.count = self.episodes = self.wins = 0
+            self._file = open(self.path, 'w+b')
+            self._write_header()
+
+        self._rows = np.zeros((chunk_rows, 2 * num_features + 1))
+        self._filled = 0
+
+    def append(self, features: NDArray, next_features: Optional[NDArray], reward: float) -> None:
+        """Log one transition.
+
+        Args:
+            features: Features of the updated state
+            next_features: Features whose value the target bootstraps from,
+                or None if the target is the reward alone
+            reward: Reward (0 for bootstrapped targets)
+        """
+        row = self._rows[self._filled]
+        d = self.num_features
+        row[:d] = features
+        if next_features is None:
+            row[d:2 * d] = 0.0
+        else:
+            row[d:2 * d] = next_features
+        row[-1] = reward
+        self._filled += 1
+        self.count += 1
+        if self._filled == len(self._rows):
+            self.flush()
+
+    def end_episode(self, won: bool) -> None:
+        """Count a finished episode in the header."""
+        self.episodes += 1
+        self.wins += int(won)
+
+    def _write_header(self) -> None:
+        """Write the header at the start of the file, leaving the position at the end."""
+        self._file.seek(0)
+        header = _HEADER.pack(MAGIC, VERSION, self.num_features, self.episodes, self.wins)
+        self._file.write(header.ljust(HEADER_SIZE, b'\0'))
+        self._file.seek(0, 2)
+
+    def flush(self) -> None:
+        """Write buffered rows and the episode counts to disk."""
+        if self._filled:
+            self._file.write(self._rows[:self._filled].tobytes())
+            self._filled = 0
+        self._write_header()
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> 'TransitionLog':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"TransitionLog({str(self.path)!r}, features={self.num_features}, "
+            f"transitions={self.count}, episodes={self.episodes})"
+        )
+
+
+def transition_rows(path: Union[str, Path]) -> NDArray:
+    """Open a transition log read-only.
+
+    Args:
+        path: Log file
+
+    Returns:
+        (count, 2 * d + 1) memory-mapped float64 rows of
+        features, next_features, reward
+
+    Raises:
+        ValueError: If the file is not a transition log of a known version
+    """
+    info = read_log_info(path)
+    width = 2 * info.num_features + 1
+    if info.count == 0:
+        return np.empty((0, width))
+    return np.memmap(path, dtype='<f8', mode='r', offset=HEADER_SIZE, shape=(info.count, width))
+
+
+class LSTDSolver:
+    """Running LSTD statistics A and b, solved for weights on demand.
+
+    Example:
+        >>> solver = LSTDSolver(3)
+        >>> solver.add_log('zombie.trans')
+        >>> weights = solver.solve()
+
+    Attributes:
+        num_features: Feature dimension d
+        gamma: Discount applied to next_features (the trainers use 1.0)
+        ridge: Added to A's diagonal before solving
+        A: (d, d) Σ features (features - gamma * next_features)ᵀ
+        b: (d,) Σ features * reward
+        count: Transitions accumulated
+        skipped: Transitions dropped for a non-finite value
+    """
+
+    def __init__(self, num_features: int, gamma: float = 1.0, ridge: float = 0.0):
+        """Initialize empty statistics.
+
+        Args:
+            num_features: Feature dimension (8 for Pac-Man, 3 for zombies)
+            gamma: Discount of the bootstrapped value
+            ridge: L2 regularization added to A's diagonal
+        """
+        self.num_features = num_features
+        self.gamma = gamma
+        self.ridge = ridge
+        self.A = np.zeros((num_features, num_features))
+        self.b = np.zeros(num_features)
+        self.count = 0
+        self.skipped = 0
+
+    def add(self, features: NDArray, next_features: NDArray, rewards: NDArray) -> None:
+        """Accumulate a block of transitions.
+
+        Rows with a non-finite value (e.g. the -inf target of a Pac-Man with
+        no legal move) are skipped and counted in `skipped`.
+
+        Args:
+            features: (n, d) features of the updated states
+            next_features: (n, d) bootstrap features (zero rows for fixed rewards)
+            rewards: (n,) rewards
+        """
+        finite = np.isfinite(rewards) & np.isfinite(features).all(axis=1) & np.isfinite(next_features).all(axis=1)
+        if not finite.all():
+            self.skipped += int(len(finite) - finite.sum())
+            features, next_features, rewards = features[finite], next_features[finite], rewards[finite]
+        self.A += features.T @ (features - self.gamma * next_features)
+        self.b += features.T @ rewards
+        self.count += len(rewards)
+
+    def add_rows(self, rows: NDArray) -> None:
+        """Accumulate transition log rows (features, next_features, reward)."""
+        d = self.num_features
+        self.add(rows[:, :d], rows[:, d:2 * d], rows[:, -1])
+
+    def add_log(self, path: Union[str, Path], chunk_rows: int = DEFAULT_CHUNK_ROWS) -> 'LSTDSolver':
+        """Stream a transition log into the statistics, one chunk at a time.
+
+        Args:
+            path: Log file written by TransitionLog
+            chunk_rows: Rows read per chunk
+
+        Returns:
+            self, so calls can be chained
+
+        Raises:
+            ValueError: If the log has another feature dimension
+        """
+        rows = transition_rows(path)
+        if rows.shape[1] != 2 * self.num_features + 1:
+            raise ValueError(f"{path} holds {(rows.shape[1] - 1) // 2} features, expected {self.num_features}")
+        for start in range(0, len(rows), chunk_rows):
+            self.add_rows(np.asarray(rows[start:start + chunk_rows]))
+        return self
+
+    def solve(self) -> NDArray:
+        """Solve (A + ridge * I) w = b.
+
+        Uses a least-squares solve, so a singular A (e.g. a feature that is
+        constant in the data) yields the minimum-norm solution.
+
+        Returns:
+            Weight vector of dimension d
+
+        Raises:
+            ValueError: If no transitions were accumulated
+        """
+        if self.count == 0:
+            raise ValueError("No transitions to fit")
+        A = self.A + self.ridge * np.eye(self.num_features)
+        return np.linalg.lstsq(A, self.b, rcond=None)[0]
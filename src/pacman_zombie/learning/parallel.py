@@ -0,0 +1,196 @@
+"""Parallel episode generation with a process pool.
+
+Worker processes play episodes with a snapshot of the current weights and
+send back compact per-step (features, V_train) records. The parent applies
+the trainers' TD updates from those records in episode and step order, and
+rebroadcasts a fresh weight snapshot every `broadcast_interval` episodes.
+
+Unlike the serial trainers, which update after every step, a worker's
+policy stays on its snapshot for the whole episode. Each episode's board
+and trainer streams are derived from the run seed and its index (see
+core.rng.episode_seeds), so results do not depend on which worker plays
+it; larger broadcast intervals trade policy freshness for pool
+throughput. With a layout bank, episode i starts from layout i (modulo the
+bank size), which each worker reads from the shared memory-mapped file.
+Each worker process resets one pooled Board per episode instead of
+constructing a new one.
+"""
+
+import multiprocessing
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator, Optional, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ..core.board import BoardPool
+from ..core.rng import episode_seeds, fresh_seed, make_rng
+from .trainer import PacmanTrainer, ZombieTrainer
+
+
+@lru_cache(maxsize=4)
+def _worker_boards(layouts: Optional[str]) -> BoardPool:
+    """Board pool of this worker process for a layout bank (or None)."""
+    return BoardPool(layouts=layouts)
+
+
+@dataclass
+class EpisodeRecord:
+    """Result of one episode played by a worker.
+
+    Attributes:
+        index: Episode index within the run
+        features: (steps, n) feature rows, one per TD update
+        V_trains: (steps,) V_train target of each update
+        V_train: Final V_train of the episode
+        steps: Steps taken
+        won: Whether the training agent won
+        outcome: Why the episode ended (trainer OUTCOME_* value)
+    """
+    index: int
+    features: NDArray
+    V_trains: NDArray
+    V_train: float
+    steps: int
+    won: bool
+    outcome: str
+
+
+def _play_episode(task: tuple) -> EpisodeRecord:
+    """Play one episode in a worker process (pool entry point).
+
+    Args:
+        task: (agent, index, seed, weights, opponent_weights, alpha, max_steps, max_repeats, layouts)
+
+    Returns:
+        EpisodeRecord with the episode's TD update records
+    """
+    agent, index, seed, weights, opponent_weights, alpha, max_steps, max_repeats, layouts = task
+    board_seed, agent_seed = episode_seeds(seed, index)
+
+    if agent == 'pacman':
+        trainer = PacmanTrainer(weights, rng=make_rng(agent_seed))
+    else:
+        trainer = ZombieTrainer(weights, rng=make_rng(agent_seed))
+
+    records = []
+    V_train, steps, won = trainer.train_episode(
+        _worker_boards(layouts).board(index, board_seed), opponent_weights, alpha, max_steps, records=records, max_repeats=max_repeats
+    )
+
+    return EpisodeRecord(
+        index=index,
+        features=np.array([features for features, _ in records], dtype=float).reshape(len(records), len(weights)),
+        V_trains=np.array([target for _, target in records], dtype=float),
+        V_train=V_train,
+        steps=steps,
+        won=won,
+        outcome=trainer.last_outcome
+    )
+
+
+class ParallelEpisodeRunner:
+    """Plays training episodes on a process pool and applies their updates.
+
+    Example:
+        >>> trainer = PacmanTrainer()
+        >>> with ParallelEpisodeRunner(trainer, zombie_weights, workers=4) as runner:
+        ...     for record in runner.run(1000):
+        ...         print(record.steps, record.won)
+    """
+
+    def __init__(
+        self,
+        trainer: Union[PacmanTrainer, ZombieTrainer],
+        opponent_weights: NDArray,
+        workers: int,
+        broadcast_interval: int = 32,
+        alpha: float = 0.01,
+        max_steps: int = 1000,
+        seed: Optional[int] = None,
+        max_repeats: Optional[int] = None,
+        layouts: Optional[str] = None
+    ):
+        """Initialize the runner and start its worker pool.
+
+        Args:
+            trainer: Trainer whose weights are played and updated
+            opponent_weights: Fixed weights of the opponent agent
+            workers: Number of worker processes
+            broadcast_interval: Episodes played per weight snapshot
+            alpha: Learning rate
+            max_steps: Maximum steps per episode
+            seed: Run seed; episode i's streams come from episode_seeds(seed, i).
+                If None, a fresh run seed is drawn.
+            max_repeats: End episodes whose states repeat more than this
+                many times (see PacmanTrainer.train_episode)
+            layouts: Layout bank file; episode i starts from layout i
+                (modulo the bank size). If None, layouts are drawn.
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        if broadcast_interval < 1:
+            raise ValueError(f"broadcast_interval must be at least 1, got {broadcast_interval}")
+
+        self.trainer = trainer
+        self.agent = 'pacman' if isinstance(trainer, PacmanTrainer) else 'zombie'
+        self.opponent_weights = np.array(opponent_weights, dtype=float)
+        self.workers = workers
+        self.broadcast_interval = broadcast_interval
+        self.alpha = alpha
+        self.max_steps = max_steps
+        self.seed = fresh_seed() if seed is None else seed
+        self.max_repeats = max_repeats
+        self.layouts = layouts
+        self.episodes_run = 0
+        self._pool = multiprocessing.Pool(processes=workers)
+
+    @property
+    def weights(self) -> NDArray:
+        """Current weights of the training agent."""
+        if self.agent == 'pacman':
+            return self.trainer.w_hat_player
+        return self.trainer.w_hat_zombie
+
+    def run(self, episodes: int) -> Iterator[EpisodeRecord]:
+        """Play episodes and apply their updates in episode order.
+
+        Args:
+            episodes: Number of episodes to play
+
+        Yields:
+            EpisodeRecord of each episode, after its updates were applied
+        """
+        end = self.episodes_run + episodes
+        while self.episodes_run < end:
+            round_size = min(self.broadcast_interval, end - self.episodes_run)
+            self.trainer.flush()  # broadcast every update applied so far
+            snapshot = self.weights.copy()
+            tasks = [
+                (
+                    self.agent, index, self.seed, snapshot,
+                    self.opponent_weights, self.alpha, self.max_steps, self.max_repeats, self.layouts
+                )
+                for index in range(self.episodes_run, self.episodes_run + round_size)
+            ]
+
+            for record in self._pool.imap(_play_episode, tasks):
+                self.trainer.apply_episode(record.features, record.V_trains, self.alpha, record.won)
+                self.episodes_run += 1
+                yield record
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self) -> 'ParallelEpisodeRunner':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._pool.terminate()
+            self._pool.join()
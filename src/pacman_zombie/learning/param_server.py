@@ -0,0 +1,515 @@
+"""TCP parameter server for training across machines.
+
+One ParameterServer process owns both the Pac-Man and the zombie weights.
+ParameterWorker processes on any host connect over plain TCP, pull the
+current weights, play a batch of train_episode calls locally (the trainers'
+usual per-step TD updates on a local copy) and push back the batch's weight
+delta, which the server adds to its weights.
+
+Pushes and pulls are pipelined: while one batch's delta is being pushed and
+the next weights pulled on a background thread, the worker already plays
+its next batch from the last weights it pulled plus its own unsent delta.
+Every push names the weight version its delta was computed from, and the
+server drops deltas more than `staleness` versions behind.
+
+Wire format: each message is a 4-byte big-endian length followed by a UTF-8
+JSON object. Requests carry an "op" ('pull', 'push' or 'metrics'); floats
+round-trip exactly through JSON, so deltas arrive bit for bit.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import struct
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ..core.board import BoardPool
+from ..core.rng import episode_seeds, fresh_seed, make_rng
+from .trainer import PacmanTrainer, ZombieTrainer
+
+AGENTS = ('pacman', 'zombie')
+OPPONENTS = {'pacman': 'zombie', 'zombie': 'pacman'}
+
+_HEADER = struct.Struct('>I')
+
+
+def send_message(sock: socket.socket, message: dict) -> None:
+    """Send one length-prefixed JSON message.
+
+    Args:
+        sock: Connected socket
+        message: JSON-serializable message
+    """
+    payload = json.dumps(message).encode('utf-8')
+    sock.sendall(_HEADER.pack(len(payload)) + payload)
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    """Read exactly `size` bytes, raising ConnectionError on EOF."""
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            raise ConnectionError("connection closed by peer")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def recv_message(sock: socket.socket) -> dict:
+    """Receive one length-prefixed JSON message.
+
+    Args:
+        sock: Connected socket
+
+    Returns:
+        Decoded message
+    """
+    (size,) = _HEADER.unpack(_recv_exactly(sock, _HEADER.size))
+    return json.loads(_recv_exactly(sock, size).decode('utf-8'))
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    """Parse a 'HOST:PORT' string.
+
+    Args:
+        address: Address such as '127.0.0.1:5555'
+
+    Returns:
+        (host, port) tuple
+    """
+    host, _, port = address.rpartition(':')
+    if not host or not port.isdigit():
+        raise ValueError(f"Expected HOST:PORT, got {address!r}")
+    return host, int(port)
+
+
+@dataclass
+class WorkerMetrics:
+    """Throughput counters for one worker.
+
+    Attributes:
+        worker: Worker identifier
+        agent: Agent the worker trains ('pacman' or 'zombie')
+        episodes: Episodes played
+        steps: Steps played
+        wins: Episodes won by the training agent
+        pushes: Deltas applied by the server
+        rejected: Deltas dropped as too stale
+        reconnects: Connections re-established after a failure
+        compute_seconds: Time spent playing episodes
+        wall_seconds: Time from the worker's first pull to its last push
+    """
+    worker: str
+    agent: str
+    episodes: int = 0
+    steps: int = 0
+    wins: int = 0
+    pushes: int = 0
+    rejected: int = 0
+    reconnects: int = 0
+    compute_seconds: float = 0.0
+    wall_seconds: float = 0.0
+
+    @property
+    def episodes_per_second(self) -> float:
+        """Episodes per wall-clock second."""
+        return self.episodes / self.wall_seconds if self.wall_seconds else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of wall-clock time spent playing episodes."""
+        return self.compute_seconds / self.wall_seconds if self.wall_seconds else 0.0
+
+
+class _ServerState:
+    """Weights, versions and counters shared by the server's handler threads."""
+
+    def __init__(self, weights: Dict[str, NDArray], staleness: int, episodes: Optional[int]):
+        self.weights = {agent: np.array(weights[agent], dtype=float) for agent in AGENTS}
+        self.versions = {agent: 0 for agent in AGENTS}
+        self.staleness = staleness
+        self.target_episodes = episodes
+        self.episodes = {agent: 0 for agent in AGENTS}
+        self.wins = {agent: 0 for agent in AGENTS}
+        self.workers: Dict[str, WorkerMetrics] = {}
+        self.first_seen: Dict[str, float] = {}
+        self.last_sequence: Dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    @property
+    def done(self) -> bool:
+        return self.target_episodes is not None and sum(self.episodes.values()) >= self.target_episodes
+
+    def pull(self, message: dict) -> dict:
+        if 'worker' in message:
+            self.first_seen.setdefault(message['worker'], time.perf_counter())
+        return {
+            'weights': {agent: self.weights[agent].tolist() for agent in AGENTS},
+            'versions': dict(self.versions),
+            'done': self.done,
+        }
+
+    def push(self, message: dict) -> dict:
+        worker, agent = message['worker'], message['agent']
+        now = time.perf_counter()
+        self.first_seen.setdefault(worker, now)
+        metrics = self.workers.setdefault(worker, WorkerMetrics(worker, agent))
+
+        # A push resent after a reconnect has already been counted
+        if self.last_sequence.get(worker, -1) >= message['sequence']:
+            return {'accepted': True, 'duplicate': True, 'version': self.versions[agent], 'done': self.done}
+        self.last_sequence[worker] = message['sequence']
+
+        metrics.episodes += message['episodes']
+        metrics.steps += message['steps']
+        metrics.wins += message['wins']
+        metrics.compute_seconds += message['compute_seconds']
+        metrics.reconnects = message['reconnects']
+        metrics.wall_seconds = now - self.first_seen[worker]
+
+        accepted = self.versions[agent] - message['version'] <= self.staleness
+        if accepted:
+            self.weights[agent] += np.array(message['delta'], dtype=float)
+            self.versions[agent] += 1
+            self.episodes[agent] += message['episodes']
+            self.wins[agent] += message['wins']
+            metrics.pushes += 1
+        else:
+            metrics.rejected += 1
+        return {'accepted': accepted, 'version': self.versions[agent], 'done': self.done}
+
+    def handle(self, message: dict) -> dict:
+        with self.lock:
+            if message['op'] == 'pull':
+                return self.pull(message)
+            if message['op'] == 'push':
+                return self.push(message)
+            if message['op'] == 'metrics':
+                return {'workers': [asdict(metrics) for metrics in self.workers.values()]}
+        return {'error': f"unknown op {message['op']!r}"}
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    """Serves one worker connection until it closes."""
+
+    def handle(self) -> None:
+        while True:
+            try:
+                message = recv_message(self.request)
+            except (ConnectionError, OSError):
+                return
+            send_message(self.request, self.server.state.handle(message))
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class ParameterServer:
+    """Owns the Pac-Man and zombie weights and serves them over TCP.
+
+    Example:
+        >>> server = ParameterServer(pacman_weights, zombie_weights, port=5555, episodes=10000)
+        >>> server.start()
+        >>> # ... workers connect with ParameterWorker(('host', 5555), 'zombie') ...
+        >>> server.wait()
+        >>> server.stop()
+    """
+
+    def __init__(
+        self,
+        pacman_weights: NDArray,
+        zombie_weights: NDArray,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        staleness: int = 4,
+        episodes: Optional[int] = None
+    ):
+        """Initialize the server (call start() to begin serving).
+
+        Args:
+            pacman_weights: Initial Pac-Man weights (8-dimensional)
+            zombie_weights: Initial zombie weights (3-dimensional)
+            host: Interface to listen on
+            port: TCP port (0 picks a free port; see address)
+            staleness: Largest accepted gap between a delta's base version
+                and the current version
+            episodes: Applied episodes after which workers are told to stop
+                (None runs until stop())
+        """
+        if len(pacman_weights) != 8:
+            raise ValueError(f"Pac-Man requires 8 weights, got {len(pacman_weights)}")
+        if len(zombie_weights) != 3:
+            raise ValueError(f"Zombie requires 3 weights, got {len(zombie_weights)}")
+
+        self.state = _ServerState({'pacman': pacman_weights, 'zombie': zombie_weights}, staleness, episodes)
+        self._server = _TCPServer((host, port), _Handler)
+        self._server.state = self.state
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """(host, port) the server listens on."""
+        return self._server.server_address[:2]
+
+    @property
+    def episodes(self) -> int:
+        """Episodes whose deltas were applied, over both agents."""
+        with self.state.lock:
+            return sum(self.state.episodes.values())
+
+    @property
+    def done(self) -> bool:
+        """Whether the episode target has been reached."""
+        with self.state.lock:
+            return self.state.done
+
+    def win_rate(self, agent: str) -> float:
+        """Win rate of the applied episodes of one agent."""
+        with self.state.lock:
+            episodes = self.state.episodes[agent]
+            return self.state.wins[agent] / episodes if episodes else 0.0
+
+    def snapshot(self, agent: str) -> NDArray:
+        """Copy the current weights of one agent."""
+        with self.state.lock:
+            return self.state.weights[agent].copy()
+
+    def metrics(self) -> List[WorkerMetrics]:
+        """Per-worker throughput counters."""
+        with self.state.lock:
+            return [WorkerMetrics(**asdict(metrics)) for metrics in self.state.workers.values()]
+
+    def start(self) -> None:
+        """Start serving on a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def wait(self, poll: float = 0.5) -> None:
+        """Block until the episode target has been reached."""
+        while not self.done:
+            time.sleep(poll)
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+class ParameterClient:
+    """Request/reply connection to a ParameterServer that reconnects on failure."""
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        retries: int = 20,
+        retry_delay: float = 0.5,
+        timeout: float = 60.0
+    ):
+        """Initialize the client (connects lazily).
+
+        Args:
+            address: (host, port) of the server
+            retries: Consecutive failed attempts before giving up
+            retry_delay: Initial delay between attempts, doubled up to 10s
+            timeout: Socket timeout per request in seconds
+        """
+        self.address = address
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.timeout = timeout
+        self.reconnects = 0
+        self._sock: Optional[socket.socket] = None
+        self._connected_once = False
+
+    def request(self, message: dict) -> dict:
+        """Send a request and return the reply, reconnecting as needed.
+
+        Args:
+            message: Request message
+
+        Returns:
+            Reply message
+
+        Raises:
+            ConnectionError: If the server stays unreachable for all retries
+        """
+        delay = self.retry_delay
+        for attempt in range(self.retries + 1):
+            try:
+                if self._sock is None:
+                    self._sock = socket.create_connection(self.address, timeout=self.timeout)
+                    if self._connected_once:
+                        self.reconnects += 1
+                    self._connected_once = True
+                send_message(self._sock, message)
+                return recv_message(self._sock)
+            except OSError as error:
+                self.close()
+                if attempt == self.retries:
+                    raise ConnectionError(f"parameter server {self.address} unreachable: {error}") from error
+                time.sleep(delay)
+                delay = min(delay * 2, 10.0)
+
+    def close(self) -> None:
+        """Close the connection (the next request reconnects)."""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+
+class ParameterWorker:
+    """Plays training batches against a ParameterServer's weights."""
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        agent: str,
+        worker_id: Optional[str] = None,
+        batch_episodes: int = 8,
+        alpha: float = 0.01,
+        max_steps: int = 1000,
+        seed: Optional[int] = None,
+        max_repeats: Optional[int] = None
+    ):
+        """Initialize a worker.
+
+        Args:
+            address: (host, port) of the server
+            agent: Agent to train ('pacman' or 'zombie'); the other agent
+                plays with the server's current weights
+            worker_id: Identifier reported to the server (default: host-pid
+                plus a random suffix, unique across forked workers)
+            batch_episodes: Episodes played per pushed delta
+            alpha: Learning rate
+            max_steps: Maximum steps per episode
+            seed: Seed of this worker's episode streams (see
+                core.rng.episode_seeds). If None, a fresh seed is drawn.
+            max_repeats: End episodes whose states repeat more than this
+                many times (see PacmanTrainer.train_episode)
+        """
+        if agent not in AGENTS:
+            raise ValueError(f"agent must be one of {AGENTS}, got {agent!r}")
+
+        self.client = ParameterClient(address)
+        self.agent = agent
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.batch_episodes = batch_episodes
+        self.alpha = alpha
+        self.max_steps = max_steps
+        self.seed = fresh_seed() if seed is None else seed
+        self.max_repeats = max_repeats
+        self.metrics = WorkerMetrics(self.worker_id, agent)
+        self._boards = BoardPool()
+        self._episodes = 0
+        self._sequence = 0
+
+    def _play_batch(self, weights: NDArray, opponent_weights: NDArray) -> Tuple[NDArray, dict]:
+        """Play one batch from `weights` and return the trained weights and counters."""
+        if self.agent == 'pacman':
+            trainer = PacmanTrainer(weights)
+        else:
+            trainer = ZombieTrainer(weights)
+
+        steps = 0
+        start = time.perf_counter()
+        for _ in range(self.batch_episodes):
+            board_seed, agent_seed = episode_seeds(self.seed, self._episodes)
+            board = self._boards.board(self._episodes, board_seed)
+            trainer.rng = make_rng(agent_seed)
+            self._episodes += 1
+            _, episode_steps, _ = trainer.train_episode(
+                board, opponent_weights, self.alpha, self.max_steps, max_repeats=self.max_repeats
+            )
+            steps += episode_steps
+        elapsed = time.perf_counter() - start
+
+        trained = trainer.w_hat_player if self.agent == 'pacman' else trainer.w_hat_zombie
+        counters = {
+            'episodes': self.batch_episodes,
+            'steps': steps,
+            'wins': trainer.num_win,
+            'compute_seconds': elapsed,
+        }
+        return trained, counters
+
+    def _exchange(self, delta: NDArray, version: int, counters: dict) -> Tuple[dict, dict]:
+        """Push one delta, then pull the latest weights."""
+        self._sequence += 1
+        push = self.client.request({
+            'op': 'push',
+            'worker': self.worker_id,
+            'agent': self.agent,
+            'sequence': self._sequence,
+            'version': version,
+            'delta': delta.tolist(),
+            'reconnects': self.client.reconnects,
+            **counters,
+        })
+        return push, self.client.request({'op': 'pull', 'worker': self.worker_id})
+
+    def run(self) -> WorkerMetrics:
+        """Train until the server reports its episode target reached.
+
+        Returns:
+            This worker's metrics
+        """
+        opponent = OPPONENTS[self.agent]
+        start = time.perf_counter()
+        reply = self.client.request({'op': 'pull', 'worker': self.worker_id})
+        weights = np.array(reply['weights'][self.agent], dtype=float)
+        opponent_weights = np.array(reply['weights'][opponent], dtype=float)
+        version = reply['versions'][self.agent]
+
+        with ThreadPoolExecutor(max_workers=1) as sender:
+            pending = None
+            done = reply['done']
+            while not done:
+                trained, counters = self._play_batch(weights, opponent_weights)
+                delta = trained - weights
+                base_version = version
+                self.metrics.episodes += counters['episodes']
+                self.metrics.steps += counters['steps']
+                self.metrics.wins += counters['wins']
+                self.metrics.compute_seconds += counters['compute_seconds']
+
+                if pending is not None:
+                    push, reply = pending.result()
+                    self._record_push(push)
+                    done = push['done'] or reply['done']
+                    weights = np.array(reply['weights'][self.agent], dtype=float)
+                    opponent_weights = np.array(reply['weights'][opponent], dtype=float)
+                    version = reply['versions'][self.agent]
+                pending = sender.submit(self._exchange, delta, base_version, counters)
+
+                # Next batch starts from the latest pulled weights plus this unsent delta
+                weights = weights + delta
+
+            if pending is not None:
+                push, _ = pending.result()
+                self._record_push(push)
+
+        self.client.close()
+        self.metrics.reconnects = self.client.reconnects
+        self.metrics.wall_seconds = time.perf_counter() - start
+        return self.metrics
+
+    def _record_push(self, push: dict) -> None:
+        """Count an applied or rejected push."""
+        if push['accepted']:
+            self.metrics.pushes += 1
+        else:
+            self.metrics.rejected += 1
@@ -0,0 +1,265 @@
+"""Fixed-size experience replay buffer backed by preallocated NumPy arrays.
+
+A ReplayBuffer stores transitions in the row layout of learning.lstd's
+transition logs: ``features, next_features, reward`` (2 * d + 1 float64
+values, d = 8 for Pac-Man, 3 for zombies). Rows live in one preallocated
+(capacity, 2 * d + 1) array used as a ring: appending writes one row and
+advances the write position, overwriting the oldest transition once the
+buffer is full.
+
+It has the same append() as TransitionLog, so a trainer fills it with
+``train_episode(..., transitions=buffer)``. Samples are index arrays, and
+the trainers learn from them with replay_update(). Neither step creates a
+Python object per transition.
+
+Sampling is uniform, or proportional to priority ** alpha when the buffer
+is prioritized (new transitions get the largest priority seen so far;
+replay_update() sets priorities to the absolute TD errors). Prioritized
+buffers keep priority ** alpha in an array-backed sum tree: a batch is
+drawn by descending all its samples through the tree level by level, and
+priority changes are propagated to the root one level at a time for all
+changed leaves at once, so both cost O(batch * log(capacity)) in a few
+array operations. Appends only write their leaf; the tree catches up
+before the next sample.
+
+With a path, the rows are an np.memmap on disk, so a multi-million
+transition buffer only keeps the pages in use in RAM; the sum tree stays
+in memory (16 bytes per transition).
+"""
+
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class ReplayBuffer:
+    """Ring buffer of (features, next_features, reward) transitions.
+
+    Example:
+        >>> replay = ReplayBuffer(100000, 3, prioritized=True)
+        >>> trainer.train_episode(board, player_weights, records=[], transitions=replay)
+        >>> trainer.replay_update(replay, batch_size=256, alpha=0.001)
+
+    Attributes:
+        capacity: Maximum number of transitions held
+        num_features: Feature dimension d
+        rows: (capacity, 2 * d + 1) storage, in memory or memory-mapped
+        priorities: (capacity,) priority ** alpha of each row, the sum
+            tree's leaves (None for uniform buffers)
+        prioritized: Whether sampling follows priorities
+        alpha: Priority exponent (0 is uniform)
+        size: Transitions currently held
+        position: Row the next transition is written to
+        rng: Generator used for sampling
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        num_features: int,
+        path: Optional[Union[str, Path]] = None,
+        prioritized: bool = False,
+        alpha: float = 0.6,
+        rng: Optional[np.random.Generator] = None
+    ):
+        """Allocate an empty buffer.
+
+        Args:
+            capacity: Maximum number of transitions held
+            num_features: Feature dimension (8 for Pac-Man, 3 for zombies)
+            path: If given, store the rows in this file as an np.memmap
+                (created or overwritten) instead of in RAM
+            prioritized: Sample proportionally to priority ** alpha
+            alpha: Priority exponent
+            rng: Sampling generator. If None, one seeded from OS entropy
+                is used.
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+
+        self.capacity = capacity
+        self.num_features = num_features
+        shape = (capacity, 2 * num_features + 1)
+        if path is None:
+            self.rows: NDArray = np.zeros(shape)
+        else:
+            self.rows = np.memmap(path, dtype='<f8', mode='w+', shape=shape)
+        # Plain ndarray over the same memory: row writes skip np.memmap's overhead
+        self._rows = self.rows.view(np.ndarray)
+
+        self.prioritized = prioritized
+        self.alpha = alpha
+        self.priorities: Optional[NDArray] = None
+        if prioritized:
+            # Sum tree: node k's children are 2k and 2k + 1, root 1, leaves from _leaf0
+            self._depth = max(int(np.ceil(np.log2(capacity))), 1)
+            self._leaf0 = 1 << self._depth
+            self._tree = np.zeros(2 * self._leaf0)
+            self.priorities = self._tree[self._leaf0:self._leaf0 + capacity]
+        self._max_priority = 1.0
+        self._stale_start = 0
+        self._stale_count = 0  # leaves appended since the tree was last summed
+        self.size = 0
+        self.position = 0
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def append(self, features: NDArray, next_features: Optional[NDArray], reward: float) -> None:
+        """Add one transition in O(1), overwriting the oldest when full.
+
+        Args:
+            features: Features of the updated state
+            next_features: Features whose value the target bootstraps from,
+                or None if the target is the reward alone
+            reward: Reward (0 for bootstrapped targets)
+        """
+        row = self._rows[self.position]
+        d = self.num_features
+        row[:d] = features
+        if next_features is None:
+            row[d:2 * d] = 0.0
+        else:
+            row[d:2 * d] = next_features
+        row[-1] = reward
+        if self.priorities is not None:
+            self.priorities[self.position] = self._max_priority ** self.alpha
+            self._mark_stale(1)
+        self.position = (self.position + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def extend(self, rows: NDArray) -> None:
+        """Add a block of transition rows, e.g. a chunk of a transition log.
+
+        Args:
+            rows: (n, 2 * d + 1) rows of features, next_features, reward;
+                only the last `capacity` rows are kept if n exceeds it
+        """
+        rows = rows[-self.capacity:]
+        count = len(rows)
+        first = min(count, self.capacity - self.position)
+        self._rows[self.position:self.position + first] = rows[:first]
+        self._rows[:count - first] = rows[first:]
+        if self.priorities is not None:
+            self.priorities[self.position:self.position + first] = self._max_priority ** self.alpha
+            self.priorities[:count - first] = self._max_priority ** self.alpha
+            self._mark_stale(count)
+        self.position = (self.position + count) % self.capacity
+        self.size = min(self.size + count, self.capacity)
+
+    def sample_indices(self, batch_size: int) -> NDArray:
+        """Draw row indices with replacement.
+
+        Args:
+            batch_size: Number of indices
+
+        Returns:
+            (batch_size,) indices into rows, uniform or by priority
+
+        Raises:
+            ValueError: If the buffer is empty
+        """
+        if self.size == 0:
+            raise ValueError("Cannot sample from an empty replay buffer")
+        if self.priorities is None:
+            return self.rng.integers(0, self.size, batch_size)
+
+        self._sum_stale()
+        tree = self._tree
+        targets = self.rng.random(batch_size) * tree[1]
+        nodes = np.ones(batch_size, dtype=np.int64)
+        for _ in range(self._depth):
+            nodes *= 2
+            left = tree[nodes]
+            right = targets >= left
+            targets -= left * right
+            nodes += right
+        return np.minimum(nodes - self._leaf0, self.size - 1)
+
+    def transitions(self, indices: NDArray) -> Tuple[NDArray, NDArray, NDArray]:
+        """Gather transitions by index.
+
+        Args:
+            indices: Row indices (e.g. from sample_indices())
+
+        Returns:
+            (features (n, d), next_features (n, d), rewards (n,)) copies
+        """
+        rows = self._rows[indices]
+        d = self.num_features
+        return rows[:, :d], rows[:, d:2 * d], rows[:, -1]
+
+    def sample(self, batch_size: int) -> Tuple[NDArray, NDArray, NDArray, NDArray]:
+        """Draw a batch of transitions.
+
+        Args:
+            batch_size: Number of transitions
+
+        Returns:
+            (indices, features, next_features, rewards); pass indices to
+            update_priorities() after computing new TD errors
+        """
+        indices = self.sample_indices(batch_size)
+        return (indices,) + self.transitions(indices)
+
+    def update_priorities(self, indices: NDArray, priorities: NDArray) -> None:
+        """Set the priorities of sampled rows (no-op for uniform buffers).
+
+        Args:
+            indices: Row indices
+            priorities: New priorities, e.g. absolute TD errors; a small
+                floor keeps every row sampleable, and non-finite values
+                get the floor
+        """
+        if self.priorities is None or not len(indices):
+            return
+        priorities = np.maximum(np.nan_to_num(priorities, nan=0.0, posinf=0.0), 1e-6)
+        self._max_priority = max(self._max_priority, float(priorities.max()))
+        self._sum_stale()
+        self.priorities[indices] = priorities ** self.alpha
+        self._sum_nodes(np.asarray(indices) + self._leaf0)
+
+    def _mark_stale(self, count: int) -> None:
+        """Record `count` leaves written from the current position."""
+        if not self._stale_count:
+            self._stale_start = self.position
+        self._stale_count = min(self._stale_count + count, self.capacity)
+
+    def _sum_stale(self) -> None:
+        """Propagate appended leaves up the tree."""
+        if not self._stale_count:
+            return
+        if self._stale_count == self.capacity:
+            # Everything changed: rebuild the tree bottom-up, one level per step
+            for level in range(self._depth - 1, -1, -1):
+                first, last = 1 << level, 2 << level
+                self._tree[first:last] = self._tree[2 * first:2 * last:2] + self._tree[2 * first + 1:2 * last:2]
+        else:
+            stale = (self._stale_start + np.arange(self._stale_count)) % self.capacity
+            self._sum_nodes(stale + self._leaf0)
+        self._stale_count = 0
+
+    def _sum_nodes(self, nodes: NDArray) -> None:
+        """Recompute the ancestors of the given tree nodes, one level at a time."""
+        tree = self._tree
+        nodes = np.unique(nodes // 2)
+        while len(nodes):
+            tree[nodes] = tree[2 * nodes] + tree[2 * nodes + 1]
+            # Still sorted, so duplicates are adjacent
+            nodes = nodes[nodes > 1] // 2
+            nodes = nodes[np.append(True, nodes[1:] != nodes[:-1])] if len(nodes) else nodes
+
+    def flush(self) -> None:
+        """Write a memory-mapped buffer's rows to disk (no-op in RAM)."""
+        if isinstance(self.rows, np.memmap):
+            self.rows.flush()
+
+    def __repr__(self) -> str:
+        storage = f"path={self.rows.filename!r}" if isinstance(self.rows, np.memmap) else 'in memory'
+        return (
+            f"ReplayBuffer({self.size}/{self.capacity} transitions, features={self.num_features}, "
+            f"{'prioritized' if self.prioritized else 'uniform'}, {storage})"
+        )
@@ -1,334 +1,730 @@
-"""Training module for Pac-Man and Zombie agents using temporal difference learning.
-
-This module implements the exact training algorithms from the original agent.py and zombie.py
-files, preserving the sacred weight update formulas:
-
-PAC-MAN:  w = w + α * (V_train - V_hat) * features  (COOPERATIVE)
-ZOMBIE:   w = w - α * (V_train - V_hat) * features  (ADVERSARIAL)
-
-CRITICAL: The difference is the operator (+ vs -). Do NOT modify these formulas.
-"""
-
-import copy
-import random
-from typing import TYPE_CHECKING, Optional, Tuple, List
-
-import numpy as np
-from numpy.typing import NDArray
-
-from ..agents.features import V_hat
-
-if TYPE_CHECKING:
-    from ..core.board import Board
-
-
-class PacmanTrainer:
-    """Trainer for Pac-Man agent using temporal difference learning.
-
-    Uses cooperative learning: agent improves by maximizing its own value function.
-
-    Weight Update Formula (SACRED - DO NOT MODIFY):
-        w_new = w_old + α * (V_train - V_hat(features, w_old)) * features
-    """
-
-    def __init__(self, initial_weights: Optional[NDArray] = None):
-        """Initialize Pac-Man trainer.
-
-        Args:
-            initial_weights: Starting weights (8-dimensional). If None, random init.
-        """
-        if initial_weights is None:
-            # Random initialization between -0.5 and 0.5
-            self.w_hat_player = np.random.rand(8) - 0.5
-        else:
-            if len(initial_weights) != 8:
-                raise ValueError(f"Pac-Man requires 8 weights, got {len(initial_weights)}")
-            self.w_hat_player = np.array(initial_weights, dtype=float)
-
-        # Training statistics
-        self.num_win = 0
-        self.num_episodes = 0
-
-    def train_episode(
-        self,
-        board: 'Board',
-        zombie_weights: NDArray,
-        alpha: float = 0.01,
-        max_steps: int = 1000
-    ) -> Tuple[float, int, bool]:
-        """Train Pac-Man for one episode against zombie agent.
-
-        Args:
-            board: Game board (fresh episode)
-            zombie_weights: Weights for zombie opponent (3-dimensional)
-            alpha: Learning rate (default: 0.01)
-            max_steps: Maximum steps per episode (default: 1000)
-
-        Returns:
-            Tuple of (final_V_train, steps_taken, won)
-
-        Algorithm (from agent.py lines 683-756):
-            1. Get current state and features
-            2. Select best action using greedy policy over w_hat_player
-            3. Execute player action
-            4. Zombies take their best actions using zombie_weights
-            5. Compute V_train based on game outcome
-            6. Update weights: w = w + α * (V_train - V_hat) * features
-            7. Repeat until game over or max_steps
-        """
-        V_train = 0
-        steps = 0
-
-        while not board.is_game_over():
-            steps += 1
-            if steps >= max_steps:
-                break
-
-            # Current state and features
-            current_state = copy.deepcopy(board.grid)
-            current_features_player = board.extract_features(current_state)
-
-            # Select best action for Pac-Man (greedy policy)
-            max_V_player = -np.inf
-            best_action_player = None
-            actions_player = board.get_possible_action()
-            random.shuffle(actions_player)  # Random tie-breaking
-
-            for action_player in actions_player:
-                successor_state_player = board.get_successor_state(action_player)
-                successor_features_player = board.extract_features(successor_state_player)
-                successor_V_player = V_hat(successor_features_player, self.w_hat_player)
-
-                if successor_V_player >= max_V_player:
-                    best_action_player = action_player
-                    max_V_player = successor_V_player
-
-            # Execute player action
-            board.player_action(best_action_player)
-
-            # Zombies take their actions
-            zombies_positions = board.get_zombies_position()
-            best_actions = []
-
-            for zombie_pos in zombies_positions:
-                row, col = zombie_pos[0], zombie_pos[1]
-                actions_zombie = board.get_possible_action_zombie(row, col)
-                max_V_zombie = -np.inf
-                best_action_zombie = None
-                random.shuffle(actions_zombie)
-
-                for action_zombie in actions_zombie:
-                    successor_state_zombie = board.get_successor_state_zombie(
-                        action_zombie, row, col
-                    )
-                    move_delta = board.move_dict[action_zombie]
-                    successor_row = row + move_delta[0]
-                    successor_col = col + move_delta[1]
-                    successor_features_zombie = board.extract_features_zombie(
-                        successor_state_zombie, successor_row, successor_col
-                    )
-                    successor_V_zombie = V_hat(successor_features_zombie, zombie_weights)
-
-                    if successor_V_zombie > max_V_zombie:
-                        best_action_zombie = action_zombie
-                        max_V_zombie = successor_V_zombie
-
-                best_actions.append((row, col, best_action_zombie))
-
-            board.zombies_action(best_actions)
-
-            # Compute V_train based on outcome
-            V_train = max_V_player  # Default
-
-            # Win condition: all zombies gone AND exit reached
-            if not board.exit_exist() and board.find_zombies_number() == 0:
-                V_train = 1000
-                self.num_win += 1
-                won = True
-                # SACRED WEIGHT UPDATE - PAC-MAN (ADDITION)
-                self.w_hat_player = (
-                    self.w_hat_player +
-                    alpha * (V_train - V_hat(current_features_player, self.w_hat_player)) *
-                    np.array(current_features_player)
-                )
-                break
-
-            # Early exit penalty
-            if not board.exit_exist():
-                V_train = -100
-
-            # Loss conditions
-            if board.player_captured_by_zombies():
-                V_train = -1000
-                won = False
-            elif board.player_fell_into_pit():
-                V_train = -1000
-                won = False
-            else:
-                won = False
-
-            # SACRED WEIGHT UPDATE - PAC-MAN (ADDITION)
-            # Formula from agent.py line 755
-            self.w_hat_player = (
-                self.w_hat_player +
-                alpha * (V_train - V_hat(current_features_player, self.w_hat_player)) *
-                np.array(current_features_player)
-            )
-
-        self.num_episodes += 1
-        return V_train, steps, won
-
-
-class ZombieTrainer:
-    """Trainer for Zombie agent using adversarial temporal difference learning.
-
-    Uses adversarial learning: agent improves by opposing the player's objectives.
-
-    Weight Update Formula (SACRED - DO NOT MODIFY):
-        w_new = w_old - α * (V_train - V_hat(features, w_old)) * features
-
-    CRITICAL: Note the MINUS sign (adversarial learning).
-    """
-
-    def __init__(self, initial_weights: Optional[NDArray] = None):
-        """Initialize Zombie trainer.
-
-        Args:
-            initial_weights: Starting weights (3-dimensional). If None, random init.
-        """
-        if initial_weights is None:
-            # Random initialization between -0.5 and 0.5
-            self.w_hat_zombie = np.random.rand(3) - 0.5
-        else:
-            if len(initial_weights) != 3:
-                raise ValueError(f"Zombie requires 3 weights, got {len(initial_weights)}")
-            self.w_hat_zombie = np.array(initial_weights, dtype=float)
-
-        # Training statistics
-        self.num_win = 0
-        self.num_episodes = 0
-
-    def train_episode(
-        self,
-        board: 'Board',
-        player_weights: NDArray,
-        alpha: float = 0.01,
-        max_steps: int = 1000
-    ) -> Tuple[float, int, bool]:
-        """Train Zombie for one episode against player agent.
-
-        Args:
-            board: Game board (fresh episode)
-            player_weights: Weights for player opponent (8-dimensional)
-            alpha: Learning rate (default: 0.01)
-            max_steps: Maximum steps per episode (default: 1000)
-
-        Returns:
-            Tuple of (final_V_train, steps_taken, won)
-
-        Algorithm (from zombie.py lines 686-762):
-            1. Get current state and features (for first zombie)
-            2. Select best zombie actions using greedy policy over w_hat_zombie
-            3. Player takes best action using player_weights
-            4. Execute zombie and player actions
-            5. Compute V_train based on game outcome
-            6. Update weights: w = w - α * (V_train - V_hat) * features (ADVERSARIAL)
-            7. Repeat until game over or max_steps
-        """
-        V_train = 0
-        steps = 0
-        won = False
-
-        while not board.is_game_over():
-            steps += 1
-            if steps >= max_steps:
-                break
-
-            # Current state and features (for zombie perspective)
-            current_state = copy.deepcopy(board.grid)
-            # Note: We use the first zombie's position for feature extraction
-            # This matches the original implementation's approach
-            zombies_positions = board.get_zombies_position()
-            if not zombies_positions:
-                # No zombies left, episode should end
-                break
-            first_zombie_row, first_zombie_col = zombies_positions[0][0], zombies_positions[0][1]
-            current_features_zombie = board.extract_features_zombie(
-                current_state, first_zombie_row, first_zombie_col
-            )
-
-            # Select best actions for all zombies
-            zombies_positions = board.get_zombies_position()
-            best_actions_zombies = []
-
-            for zombie_pos in zombies_positions:
-                row, col = zombie_pos[0], zombie_pos[1]
-                actions_zombie = board.get_possible_action_zombie(row, col)
-                max_V_zombie = -np.inf
-                best_action_zombie = None
-                random.shuffle(actions_zombie)
-
-                for action_zombie in actions_zombie:
-                    successor_state_zombie = board.get_successor_state_zombie(
-                        action_zombie, row, col
-                    )
-                    move_delta = board.move_dict[action_zombie]
-                    successor_row = row + move_delta[0]
-                    successor_col = col + move_delta[1]
-                    successor_features_zombie = board.extract_features_zombie(
-                        successor_state_zombie, successor_row, successor_col
-                    )
-                    successor_V_zombie = V_hat(successor_features_zombie, self.w_hat_zombie)
-
-                    if successor_V_zombie > max_V_zombie:
-                        best_action_zombie = action_zombie
-                        max_V_zombie = successor_V_zombie
-
-                best_actions_zombies.append((row, col, best_action_zombie))
-
-            # Select best action for player
-            max_V_player = -np.inf
-            best_action_player = None
-            actions_player = board.get_possible_action()
-            random.shuffle(actions_player)
-
-            for action_player in actions_player:
-                successor_state_player = board.get_successor_state(action_player)
-                successor_features_player = board.extract_features(successor_state_player)
-                successor_V_player = V_hat(successor_features_player, player_weights)
-
-                if successor_V_player > max_V_player:
-                    best_action_player = action_player
-                    max_V_player = successor_V_player
-
-            # Execute actions (zombies first, then player)
-            board.zombies_action(best_actions_zombies)
-            board.player_action(best_action_player)
-
-            # Compute V_train based on outcome
-            V_train = max_V_zombie  # Default (from first zombie calculation)
-
-            # Win condition for zombie: captured player
-            if board.player_captured_by_zombies():
-                V_train = 1000
-                self.num_win += 1
-                won = True
-
-            # Zombie fell into pit
-            if board.zombie_fell_into_pit():
-                V_train = -100
-
-            # Player cured zombie (zombie's loss)
-            if board.player_cure_zombie():
-                V_train = -1000
-
-            # SACRED WEIGHT UPDATE - ZOMBIE (SUBTRACTION - ADVERSARIAL)
-            # Formula from zombie.py line 762
-            self.w_hat_zombie = (
-                self.w_hat_zombie -
-                alpha * (V_train - V_hat(current_features_zombie, self.w_hat_zombie)) *
-                np.array(current_features_zombie)
-            )
-
-        self.num_episodes += 1
-        return V_train, steps, won
+"""Training module for Pac-Man and Zombie agents using temporal difference learning.
+
+This module implements the exact training algorithms from the original agent.py and zombie.py
+files, preserving the sacred weight update formulas:
+
+PAC-MAN:  w = w + α * (V_train - V_hat) * features  (COOPERATIVE)
+ZOMBIE:   w = w - α * (V_train - V_hat) * features  (ADVERSARIAL)
+
+CRITICAL: The difference is the operator (+ vs -). Do NOT modify these formulas.
+
+By default every step's update is applied immediately, in step order. With
+update_batch=N a trainer instead collects (features, V_train) rows in an
+UpdateBatch and applies the N updates of a batch at once, all evaluated at
+the weights the batch started from:
+
+PAC-MAN:  w = w + Σ α * (V_train - V_hat) * features
+ZOMBIE:   w = w - Σ α * (V_train - V_hat) * features
+"""
+
+import random
+from typing import TYPE_CHECKING, Optional, Tuple, List, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ..agents.features import V_hat, V_hat_batch, argmax_last
+from ..agents.transposition import TranspositionCache, weights_version
+from ..core.rng import make_rng
+
+if TYPE_CHECKING:
+    from ..core.board import Board
+    from .lstd import TransitionLog
+    from .replay import ReplayBuffer
+
+# Why an episode ended (trainer.last_outcome)
+OUTCOME_WON = 'won'              # Training agent won
+OUTCOME_GAME_OVER = 'game_over'  # Game ended without a win for the training agent
+OUTCOME_MAX_STEPS = 'max_steps'  # Step limit reached
+OUTCOME_CYCLE = 'cycle'          # A state repeated more than max_repeats times
+
+
+class UpdateBatch:
+    """Preallocated rows of pending TD updates for a mini-batch trainer.
+
+    Attributes:
+        features: (size, d) feature rows
+        V_trains: (size,) training targets
+        alphas: (size,) learning rate of each row
+        count: Rows filled so far
+    """
+
+    def __init__(self, size: int, num_features: int):
+        """Allocate an empty batch.
+
+        Args:
+            size: Rows per batch
+            num_features: Feature dimension (8 for Pac-Man, 3 for zombies)
+        """
+        if size < 1:
+            raise ValueError(f"update batch size must be at least 1, got {size}")
+        self.features = np.empty((size, num_features))
+        self.V_trains = np.empty(size)
+        self.alphas = np.empty(size)
+        self.count = 0
+
+    @property
+    def full(self) -> bool:
+        """Whether every row is filled."""
+        return self.count == len(self.V_trains)
+
+    def add(self, features: NDArray, V_train: float, alpha: float) -> None:
+        """Append one row (the batch must not be full)."""
+        self.features[self.count] = features
+        self.V_trains[self.count] = V_train
+        self.alphas[self.count] = alpha
+        self.count += 1
+
+    def extend(self, features: NDArray, V_trains: NDArray, alpha: float) -> int:
+        """Append as many rows as fit.
+
+        Args:
+            features: (n, d) feature rows
+            V_trains: (n,) training targets
+            alpha: Learning rate of every row
+
+        Returns:
+            Number of rows appended
+        """
+        added = min(len(V_trains), len(self.V_trains) - self.count)
+        rows = slice(self.count, self.count + added)
+        self.features[rows] = features[:added]
+        self.V_trains[rows] = V_trains[:added]
+        self.alphas[rows] = alpha
+        self.count += added
+        return added
+
+    def step(self, weights: NDArray) -> NDArray:
+        """Sum of the pending rows' steps at fixed weights, then empty the batch.
+
+        Args:
+            weights: Weights every row's V_hat is evaluated with
+
+        Returns:
+            Σ α * (V_train - V_hat(features, weights)) * features; the
+            trainer adds (Pac-Man) or subtracts (zombie) it
+        """
+        features = self.features[:self.count]
+        errors = self.alphas[:self.count] * (self.V_trains[:self.count] - V_hat_batch(features, weights))
+        self.count = 0
+        return errors @ features
+
+
+class PacmanTrainer:
+    """Trainer for Pac-Man agent using temporal difference learning.
+
+    Uses cooperative learning: agent improves by maximizing its own value function.
+
+    Weight Update Formula (SACRED - DO NOT MODIFY):
+        w_new = w_old + α * (V_train - V_hat(features, w_old)) * features
+
+    Updates are written into w_hat_player in place, so the trainer can also
+    train a weight vector shared with other processes (see learning.hogwild).
+    """
+
+    def __init__(
+        self,
+        initial_weights: Optional[NDArray] = None,
+        cache: Optional[TranspositionCache] = None,
+        rng: Optional[random.Random] = None,
+        update_batch: Optional[int] = None
+    ):
+        """Initialize Pac-Man trainer.
+
+        Args:
+            initial_weights: Starting weights (8-dimensional). If None, random init.
+            cache: Optional transposition cache for the zombies' turns. Only
+                the opponent is cached, since Pac-Man's own weights change
+                every step. Hits skip the tie-breaking shuffles, so cached
+                episodes differ from uncached ones with the same seed.
+            rng: Random stream for weight initialization and tie-breaking
+                shuffles. If None, a private stream seeded from OS entropy
+                is used.
+            update_batch: If given, collect this many (features, V_train)
+                rows and apply them as one vectorized update (see
+                flush()). If None, every step is applied immediately.
+        """
+        self.rng: random.Random = rng if rng is not None else make_rng()
+        if initial_weights is None:
+            # Random initialization between -0.5 and 0.5
+            self.w_hat_player = np.array([self.rng.random() for _ in range(8)]) - 0.5
+        else:
+            if len(initial_weights) != 8:
+                raise ValueError(f"Pac-Man requires 8 weights, got {len(initial_weights)}")
+            self.w_hat_player = np.array(initial_weights, dtype=float)
+
+        self.cache = cache
+
+        # Step buffers reused by every update (current features, weight step)
+        self._features = np.empty(8)
+        self._step = np.empty(8)
+        self.batch = UpdateBatch(update_batch, 8) if update_batch is not None else None
+
+        # Training statistics
+        self.num_win = 0
+        self.num_episodes = 0
+        self.last_outcome: Optional[str] = None
+
+    def train_episode(
+        self,
+        board: 'Board',
+        zombie_weights: NDArray,
+        alpha: float = 0.01,
+        max_steps: int = 1000,
+        records: Optional[List[Tuple[List[float], float]]] = None,
+        max_repeats: Optional[int] = None,
+        transitions: Optional[Union['TransitionLog', 'ReplayBuffer']] = None
+    ) -> Tuple[float, int, bool]:
+        """Train Pac-Man for one episode against zombie agent.
+
+        Args:
+            board: Game board (fresh episode)
+            zombie_weights: Weights for zombie opponent (3-dimensional)
+            alpha: Learning rate (default: 0.01)
+            max_steps: Maximum steps per episode (default: 1000)
+            records: If given, each step's (features, V_train) pair is
+                appended here instead of updating the weights, so the
+                episode is played with fixed weights and its updates can be
+                applied later with apply_episode()
+            max_repeats: If given, end the episode once any game state
+                (board.zobrist_hash at the start of a step) has been seen
+                more than this many times; last_outcome is then
+                OUTCOME_CYCLE
+            transitions: If given, each step is also logged as a
+                (features, next_features, reward) transition to this
+                learning.lstd TransitionLog or learning.replay ReplayBuffer:
+                next_features is the chosen successor's features when
+                V_train is its value, else None with V_train as the reward
+
+        Returns:
+            Tuple of (final_V_train, steps_taken, won); why the episode
+            ended is stored in last_outcome
+
+        Algorithm (from agent.py lines 683-756):
+            1. Get current state and features
+            2. Select best action using greedy policy over w_hat_player
+            3. Execute player action
+            4. Zombies take their best actions using zombie_weights
+            5. Compute V_train based on game outcome
+            6. Update weights: w = w + α * (V_train - V_hat) * features
+            7. Repeat until game over or max_steps
+        """
+        V_train = 0
+        steps = 0
+        won = False
+        zombie_version = weights_version(zombie_weights) if self.cache is not None else None
+
+        outcome = None
+        seen = {} if max_repeats is not None else None
+
+        while not board.is_game_over():
+            steps += 1
+            if steps >= max_steps:
+                outcome = OUTCOME_MAX_STEPS
+                break
+
+            # Oscillating episodes revisit the same few states
+            if seen is not None:
+                repeats = seen.get(board.zobrist_hash, 0) + 1
+                seen[board.zobrist_hash] = repeats
+                if repeats > max_repeats:
+                    outcome = OUTCOME_CYCLE
+                    break
+
+            # Current features, written into the step buffer
+            current_features_player = board.extract_features(out=self._features)
+
+            # Select best action for Pac-Man (greedy policy, later ties win)
+            max_V_player = -np.inf
+            best_action_player = None
+            actions_player = board.get_possible_action()
+            self.rng.shuffle(actions_player)  # Random tie-breaking
+
+            if actions_player:
+                successor_features_player = board.extract_features_batch(actions_player)
+                successor_V_player = V_hat_batch(successor_features_player, self.w_hat_player)
+                best_index = argmax_last(successor_V_player)
+                best_action_player = actions_player[best_index]
+                max_V_player = successor_V_player[best_index]
+
+            # Execute player action
+            board.player_action(best_action_player)
+
+            # Zombies take their actions (one value field shared by all zombies)
+            cached = None
+            if self.cache is not None:
+                zombie_key = (board.zobrist_hash, zombie_version, 'zombies')
+                cached = self.cache.get(zombie_key)
+            zombies_positions = board.get_zombies_position() if cached is None else []
+            best_actions = [] if cached is None else list(cached[0])
+            if zombies_positions:
+                zombie_values = V_hat_batch(board.extract_features_zombie_field(), zombie_weights).tolist()
+
+            for zombie_pos in zombies_positions:
+                row, col = zombie_pos[0], zombie_pos[1]
+                actions_zombie = board.get_possible_action_zombie(row, col)
+                max_V_zombie = -np.inf
+                best_action_zombie = None
+                self.rng.shuffle(actions_zombie)
+
+                for action_zombie in actions_zombie:
+                    move_delta = board.move_deltas[action_zombie]
+                    successor_row = row + move_delta[0]
+                    successor_col = col + move_delta[1]
+                    successor_V_zombie = zombie_values[successor_row * board.width + successor_col]
+
+                    if successor_V_zombie > max_V_zombie:
+                        best_action_zombie = action_zombie
+                        max_V_zombie = successor_V_zombie
+
+                best_actions.append((row, col, best_action_zombie))
+
+            if self.cache is not None and cached is None:
+                self.cache.put(zombie_key, tuple(best_actions))
+            board.zombies_action(best_actions)
+
+            # Compute V_train based on outcome
+            V_train = max_V_player  # Default
+            bootstraps = True
+
+            # Win condition: all zombies gone AND exit reached
+            if not board.exit_exist() and board.find_zombies_number() == 0:
+                V_train = 1000
+                self.num_win += 1
+                won = True
+                if transitions is not None:
+                    transitions.append(current_features_player, None, V_train)
+                if records is not None:
+                    records.append((current_features_player.copy(), V_train))
+                    break
+                self._update(current_features_player, V_train, alpha)
+                break
+
+            # Early exit penalty
+            if not board.exit_exist():
+                V_train = -100
+                bootstraps = False
+
+            # Loss conditions
+            if board.player_captured_by_zombies():
+                V_train = -1000
+                won = False
+                bootstraps = False
+            elif board.player_fell_into_pit():
+                V_train = -1000
+                won = False
+                bootstraps = False
+            else:
+                won = False
+
+            if transitions is not None:
+                if bootstraps and actions_player:
+                    transitions.append(current_features_player, successor_features_player[best_index], 0.0)
+                else:
+                    transitions.append(current_features_player, None, V_train)
+
+            if records is not None:
+                records.append((current_features_player.copy(), V_train))
+                continue
+
+            self._update(current_features_player, V_train, alpha)
+
+        self.last_outcome = outcome or (OUTCOME_WON if won else OUTCOME_GAME_OVER)
+        self.num_episodes += 1
+        return V_train, steps, won
+
+    def apply_episode(self, features: NDArray, V_trains: NDArray, alpha: float, won: bool) -> None:
+        """Apply the recorded TD updates of an episode played elsewhere.
+
+        The updates run in step order with the same formula as
+        train_episode, so replaying an episode's records reproduces the
+        weights a serial run would reach from the same records.
+
+        Args:
+            features: (steps, 8) feature rows recorded by train_episode
+            V_trains: V_train target of each step
+            alpha: Learning rate
+            won: Whether the episode was won
+        """
+        self.apply_updates(features, V_trains, alpha)
+        self.num_win += int(won)
+        self.num_episodes += 1
+
+    def apply_updates(self, features: NDArray, V_trains: NDArray, alpha: float) -> None:
+        """Apply TD updates for rows of (features, V_train), e.g. one step of many games.
+
+        In per-step mode the rows are applied one by one, in order. With
+        update_batch they are copied into the batch, which is applied each
+        time it fills.
+
+        Args:
+            features: (n, 8) feature rows
+            V_trains: (n,) V_train targets
+            alpha: Learning rate
+        """
+        if self.batch is None:
+            for current_features_player, V_train in zip(features, V_trains):
+                self._update(current_features_player, V_train, alpha)
+            return
+
+        features = np.asarray(features, dtype=float)
+        V_trains = np.asarray(V_trains, dtype=float)
+        added = 0
+        while added < len(V_trains):
+            added += self.batch.extend(features[added:], V_trains[added:], alpha)
+            if self.batch.full:
+                self.flush()
+
+    def flush(self) -> None:
+        """Apply the pending mini-batch, if any (no-op in per-step mode).
+
+        Call it before reading or saving w_hat_player mid-run: a partial
+        batch is not applied until it fills.
+        """
+        if self.batch is None or not self.batch.count:
+            return
+        # SACRED WEIGHT UPDATE - PAC-MAN (ADDITION), summed over the batch
+        self.w_hat_player += self.batch.step(self.w_hat_player)
+
+    def replay_update(self, replay: 'ReplayBuffer', batch_size: int, alpha: float) -> NDArray:
+        """Apply TD updates to a batch sampled from a replay buffer.
+
+        Targets are recomputed with the current weights, V_train = reward +
+        V_hat(next_features), and applied with apply_updates() (per step or
+        in mini-batches). Rows with a non-finite target are skipped. The
+        sampled rows' priorities are set to their absolute TD errors.
+
+        Args:
+            replay: Buffer of 8-feature transitions
+            batch_size: Transitions to sample
+            alpha: Learning rate
+
+        Returns:
+            Sampled row indices
+        """
+        indices, features, next_features, rewards = replay.sample(batch_size)
+        V_trains = rewards + V_hat_batch(next_features, self.w_hat_player)
+        errors = V_trains - V_hat_batch(features, self.w_hat_player)
+        finite = np.isfinite(V_trains)
+        self.apply_updates(features[finite], V_trains[finite], alpha)
+        replay.update_priorities(indices, np.abs(errors))
+        return indices
+
+    def _update(self, features: NDArray, V_train: float, alpha: float) -> None:
+        """Apply one TD update to w_hat_player in place.
+
+        Same arithmetic as ``w = w + α * (V_train - V_hat) * features``
+        (bit for bit), with the step written into a reused buffer. With
+        update_batch the row is queued instead (see flush()).
+
+        Args:
+            features: Feature vector of the state being updated
+            V_train: Training target
+            alpha: Learning rate
+        """
+        if self.batch is not None:
+            self.batch.add(features, V_train, alpha)
+            if self.batch.full:
+                self.flush()
+            return
+
+        # SACRED WEIGHT UPDATE - PAC-MAN (ADDITION)
+        # Formula from agent.py line 755
+        np.multiply(alpha * (V_train - V_hat(features, self.w_hat_player)), features, out=self._step)
+        self.w_hat_player += self._step
+
+
+class ZombieTrainer:
+    """Trainer for Zombie agent using adversarial temporal difference learning.
+
+    Uses adversarial learning: agent improves by opposing the player's objectives.
+
+    Weight Update Formula (SACRED - DO NOT MODIFY):
+        w_new = w_old - α * (V_train - V_hat(features, w_old)) * features
+
+    CRITICAL: Note the MINUS sign (adversarial learning).
+
+    Updates are written into w_hat_zombie in place (see PacmanTrainer).
+    """
+
+    def __init__(
+        self,
+        initial_weights: Optional[NDArray] = None,
+        cache: Optional[TranspositionCache] = None,
+        rng: Optional[random.Random] = None,
+        update_batch: Optional[int] = None
+    ):
+        """Initialize Zombie trainer.
+
+        Args:
+            initial_weights: Starting weights (3-dimensional). If None, random init.
+            cache: Optional transposition cache for Pac-Man's (opponent)
+                decisions; see PacmanTrainer.
+            rng: Random stream; see PacmanTrainer.
+            update_batch: Mini-batch size; see PacmanTrainer.
+        """
+        self.rng: random.Random = rng if rng is not None else make_rng()
+        if initial_weights is None:
+            # Random initialization between -0.5 and 0.5
+            self.w_hat_zombie = np.array([self.rng.random() for _ in range(3)]) - 0.5
+        else:
+            if len(initial_weights) != 3:
+                raise ValueError(f"Zombie requires 3 weights, got {len(initial_weights)}")
+            self.w_hat_zombie = np.array(initial_weights, dtype=float)
+
+        self.cache = cache
+
+        # Step buffers reused by every update (see PacmanTrainer)
+        self._features = np.empty(3)
+        self._step = np.empty(3)
+        self.batch = UpdateBatch(update_batch, 3) if update_batch is not None else None
+
+        # Training statistics
+        self.num_win = 0
+        self.num_episodes = 0
+        self.last_outcome: Optional[str] = None
+
+    def train_episode(
+        self,
+        board: 'Board',
+        player_weights: NDArray,
+        alpha: float = 0.01,
+        max_steps: int = 1000,
+        records: Optional[List[Tuple[List[float], float]]] = None,
+        max_repeats: Optional[int] = None,
+        transitions: Optional[Union['TransitionLog', 'ReplayBuffer']] = None
+    ) -> Tuple[float, int, bool]:
+        """Train Zombie for one episode against player agent.
+
+        Args:
+            board: Game board (fresh episode)
+            player_weights: Weights for player opponent (8-dimensional)
+            alpha: Learning rate (default: 0.01)
+            max_steps: Maximum steps per episode (default: 1000)
+            records: If given, each step's (features, V_train) pair is
+                appended here instead of updating the weights (see
+                PacmanTrainer.train_episode)
+            max_repeats: If given, end the episode as OUTCOME_CYCLE once a
+                state repeats more than this many times (see
+                PacmanTrainer.train_episode)
+            transitions: If given, each step is also logged to a
+                TransitionLog or ReplayBuffer (see PacmanTrainer.train_episode)
+
+        Returns:
+            Tuple of (final_V_train, steps_taken, won); why the episode
+            ended is stored in last_outcome
+
+        Algorithm (from zombie.py lines 686-762):
+            1. Get current state and features (for first zombie)
+            2. Select best zombie actions using greedy policy over w_hat_zombie
+            3. Player takes best action using player_weights
+            4. Execute zombie and player actions
+            5. Compute V_train based on game outcome
+            6. Update weights: w = w - α * (V_train - V_hat) * features (ADVERSARIAL)
+            7. Repeat until game over or max_steps
+        """
+        V_train = 0
+        steps = 0
+        won = False
+        player_version = weights_version(player_weights) if self.cache is not None else None
+
+        outcome = None
+        seen = {} if max_repeats is not None else None
+
+        while not board.is_game_over():
+            steps += 1
+            if steps >= max_steps:
+                outcome = OUTCOME_MAX_STEPS
+                break
+
+            # Oscillating episodes revisit the same few states
+            if seen is not None:
+                repeats = seen.get(board.zobrist_hash, 0) + 1
+                seen[board.zobrist_hash] = repeats
+                if repeats > max_repeats:
+                    outcome = OUTCOME_CYCLE
+                    break
+
+            # Current features (for zombie perspective), written into the step buffer
+            # Note: We use the first zombie's position for feature extraction
+            # This matches the original implementation's approach
+            zombies_positions = board.get_zombies_position()
+            if not zombies_positions:
+                # No zombies left, episode should end
+                break
+            first_zombie_row, first_zombie_col = zombies_positions[0][0], zombies_positions[0][1]
+            current_features_zombie = board.extract_features_zombie(
+                None, first_zombie_row, first_zombie_col, out=self._features
+            )
+
+            # Select best actions for all zombies (one value field per turn)
+            best_actions_zombies = []
+            zombie_field = board.extract_features_zombie_field()
+            zombie_values = V_hat_batch(zombie_field, self.w_hat_zombie).tolist()
+
+            for zombie_pos in zombies_positions:
+                row, col = zombie_pos[0], zombie_pos[1]
+                actions_zombie = board.get_possible_action_zombie(row, col)
+                max_V_zombie = -np.inf
+                best_action_zombie = None
+                best_cell = None
+                self.rng.shuffle(actions_zombie)
+
+                for action_zombie in actions_zombie:
+                    move_delta = board.move_deltas[action_zombie]
+                    successor_row = row + move_delta[0]
+                    successor_col = col + move_delta[1]
+                    successor_cell = successor_row * board.width + successor_col
+                    successor_V_zombie = zombie_values[successor_cell]
+
+                    if successor_V_zombie > max_V_zombie:
+                        best_action_zombie = action_zombie
+                        max_V_zombie = successor_V_zombie
+                        best_cell = successor_cell
+
+                best_actions_zombies.append((row, col, best_action_zombie))
+
+            # Select best action for player (first of tied maxima)
+            cached = None
+            if self.cache is not None:
+                player_key = (board.zobrist_hash, player_version, 'pacman-first')
+                cached = self.cache.get(player_key)
+
+            if cached is not None:
+                best_action_player = cached[0]
+            else:
+                best_action_player = None
+                actions_player = board.get_possible_action()
+                self.rng.shuffle(actions_player)
+
+                if actions_player:
+                    successor_features_player = board.extract_features_batch(actions_player)
+                    successor_V_player = V_hat_batch(successor_features_player, player_weights)
+                    best_index = int(np.argmax(successor_V_player))
+                    best_action_player = actions_player[best_index]
+                    if self.cache is not None:
+                        self.cache.put(player_key, best_action_player, float(successor_V_player[best_index]))
+
+            # Execute actions (zombies first, then player)
+            board.zombies_action(best_actions_zombies)
+            board.player_action(best_action_player)
+
+            # Compute V_train based on outcome
+            V_train = max_V_zombie  # Default (from first zombie calculation)
+            bootstraps = True
+
+            # Win condition for zombie: captured player
+            if board.player_captured_by_zombies():
+                V_train = 1000
+                self.num_win += 1
+                won = True
+                bootstraps = False
+
+            # Zombie fell into pit
+            if board.zombie_fell_into_pit():
+                V_train = -100
+                bootstraps = False
+
+            # Player cured zombie (zombie's loss)
+            if board.player_cure_zombie():
+                V_train = -1000
+                bootstraps = False
+
+            if transitions is not None:
+                if bootstraps and best_cell is not None:
+                    transitions.append(current_features_zombie, zombie_field[best_cell], 0.0)
+                else:
+                    transitions.append(current_features_zombie, None, V_train)
+
+            if records is not None:
+                records.append((current_features_zombie.copy(), V_train))
+                continue
+
+            self._update(current_features_zombie, V_train, alpha)
+
+        self.last_outcome = outcome or (OUTCOME_WON if won else OUTCOME_GAME_OVER)
+        self.num_episodes += 1
+        return V_train, steps, won
+
+    def apply_episode(self, features: NDArray, V_trains: NDArray, alpha: float, won: bool) -> None:
+        """Apply the recorded TD updates of an episode played elsewhere.
+
+        Args:
+            features: (steps, 3) feature rows recorded by train_episode
+            V_trains: V_train target of each step
+            alpha: Learning rate
+            won: Whether the episode was won
+        """
+        self.apply_updates(features, V_trains, alpha)
+        self.num_win += int(won)
+        self.num_episodes += 1
+
+    def apply_updates(self, features: NDArray, V_trains: NDArray, alpha: float) -> None:
+        """Apply TD updates for rows of (features, V_train); see PacmanTrainer.
+
+        Args:
+            features: (n, 3) feature rows
+            V_trains: (n,) V_train targets
+            alpha: Learning rate
+        """
+        if self.batch is None:
+            for current_features_zombie, V_train in zip(features, V_trains):
+                self._update(current_features_zombie, V_train, alpha)
+            return
+
+        features = np.asarray(features, dtype=float)
+        V_trains = np.asarray(V_trains, dtype=float)
+        added = 0
+        while added < len(V_trains):
+            added += self.batch.extend(features[added:], V_trains[added:], alpha)
+            if self.batch.full:
+                self.flush()
+
+    def flush(self) -> None:
+        """Apply the pending mini-batch, if any; see PacmanTrainer."""
+        if self.batch is None or not self.batch.count:
+            return
+        # SACRED WEIGHT UPDATE - ZOMBIE (SUBTRACTION - ADVERSARIAL), summed over the batch
+        self.w_hat_zombie -= self.batch.step(self.w_hat_zombie)
+
+    def replay_update(self, replay: 'ReplayBuffer', batch_size: int, alpha: float) -> NDArray:
+        """Apply adversarial TD updates to a replayed batch; see PacmanTrainer.
+
+        Args:
+            replay: Buffer of 3-feature transitions
+            batch_size: Transitions to sample
+            alpha: Learning rate
+
+        Returns:
+            Sampled row indices
+        """
+        indices, features, next_features, rewards = replay.sample(batch_size)
+        V_trains = rewards + V_hat_batch(next_features, self.w_hat_zombie)
+        errors = V_trains - V_hat_batch(features, self.w_hat_zombie)
+        finite = np.isfinite(V_trains)
+        self.apply_updates(features[finite], V_trains[finite], alpha)
+        replay.update_priorities(indices, np.abs(errors))
+        return indices
+
+    def _update(self, features: NDArray, V_train: float, alpha: float) -> None:
+        """Apply one adversarial TD update to w_hat_zombie in place.
+
+        Same arithmetic as ``w = w - α * (V_train - V_hat) * features``
+        (bit for bit), with the step written into a reused buffer. With
+        update_batch the row is queued instead (see flush()).
+
+        Args:
+            features: Feature vector of the state being updated
+            V_train: Training target
+            alpha: Learning rate
+        """
+        if self.batch is not None:
+            self.batch.add(features, V_train, alpha)
+            if self.batch.full:
+                self.flush()
+            return
+
+        # SACRED WEIGHT UPDATE - ZOMBIE (SUBTRACTION - ADVERSARIAL)
+        # Formula from zombie.py line 762
+        np.multiply(alpha * (V_train - V_hat(features, self.w_hat_zombie)), features, out=self._step)
+        self.w_hat_zombie -= self._step